@@ -0,0 +1,80 @@
+"""
+Benchmark JSON against the binary result encoding used by the quantum API.
+
+For each qubit count, encodes a random statevector and the counts from
+sampling it, and reports encode time and bytes on the wire for JSON and the
+binary layout, uncompressed and with each available codec (gzip, zstd).
+
+Usage (from the repository root):
+    python scripts/benchmark_result_encoding.py --qubits 16 20 22 --shots 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.quantum_integration import result_encoding  # noqa: E402
+
+
+def random_result(num_qubits, shots, rng):
+    """A normalized random statevector and the counts dict from sampling it."""
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    state /= np.linalg.norm(state)
+    probabilities = np.abs(state) ** 2
+    outcomes = np.bincount(rng.choice(state.size, size=shots, p=probabilities), minlength=state.size)
+    counts = {format(int(index), f'0{num_qubits}b'): int(outcomes[index]) for index in np.flatnonzero(outcomes)}
+    return state, counts
+
+
+def encoders(state, counts):
+    """(label, encode function) pairs, mirroring the API's JSON and binary bodies."""
+    return [
+        ('counts json', lambda: json.dumps({"measurement_results": counts}).encode()),
+        ('counts binary', lambda: result_encoding.encode_counts(counts)),
+        ('state json', lambda: json.dumps({"statevector": {"real": state.real.tolist(),
+                                                           "imag": state.imag.tolist()}}).encode()),
+        ('state binary', lambda: result_encoding.encode_statevector(state)),
+    ]
+
+
+def timed(fn, repeats):
+    """Return (best seconds, result) over `repeats` calls."""
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--qubits', type=int, nargs='+', default=[16, 20, 22])
+    parser.add_argument('--shots', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    codecs = [None] + list(result_encoding.available_codecs())
+    rng = np.random.default_rng(0)
+
+    print(f"Codecs: {', '.join(result_encoding.available_codecs()) or 'none'}; shots: {args.shots}")
+    print(f"{'qubits':>6} {'payload':<14} {'codec':<6} {'encode ms':>10} {'KiB':>10} {'vs json':>8}")
+    for num_qubits in args.qubits:
+        state, counts = random_result(num_qubits, args.shots, rng)
+        baseline = {}
+        for label, encode in encoders(state, counts):
+            seconds, body = timed(encode, args.repeats)
+            for codec in codecs:
+                extra, wire = timed(lambda: result_encoding.compress(body, codec), args.repeats)
+                baseline.setdefault((label.split()[0], codec), len(wire))
+                ratio = baseline[(label.split()[0], codec)] / len(wire)
+                print(f"{num_qubits:>6} {label:<14} {codec or '-':<6} {(seconds + extra) * 1e3:>10.2f} "
+                      f"{len(wire) / 1024:>10.1f} {ratio:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark multi-threaded statevector gate application.
+
+Applies a layer of Hadamard, RX and CNOT gates across every qubit and reports
+the time per gate for 1..N threads at each qubit count.
+
+Usage (from the repository root):
+    python scripts/benchmark_simulator.py --qubits 20 22 24 26 --threads 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.quantum_integration.quantum_simulator import QuantumSimulator, estimate_memory  # noqa: E402
+from src.quantum_integration.simulator_circuit import GATE_MATRICES, rx_matrix  # noqa: E402
+
+
+def time_layer(num_qubits, num_threads, dtype, repeats):
+    """Return the average seconds per gate for one layer of 1- and 2-qubit gates."""
+    simulator = QuantumSimulator(num_qubits, dtype=dtype, num_threads=num_threads)
+    gates = []
+    for qubit in range(num_qubits):
+        gates.append((GATE_MATRICES['h'], [qubit]))
+        gates.append((rx_matrix(0.3), [qubit]))
+    for qubit in range(num_qubits - 1):
+        gates.append((GATE_MATRICES['cx'], [qubit, qubit + 1]))
+
+    simulator.apply_gate(*gates[0])  # warm up the pool and allocator
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for gate, targets in gates:
+            simulator.apply_gate(gate, targets)
+    elapsed = time.perf_counter() - start
+    simulator.close()
+    return elapsed / (repeats * len(gates))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--qubits', type=int, nargs='+', default=[20, 22, 24])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument('--dtype', choices=['complex64', 'complex128'], default='complex128')
+    parser.add_argument('--repeats', type=int, default=1)
+    args = parser.parse_args()
+    threads = sorted(set(args.threads))
+
+    print(f"CPU cores: {os.cpu_count()}, dtype: {args.dtype}")
+    print(f"{'qubits':>6} {'state MB':>9} " + ' '.join(f"{f'{t} thr ms':>10}" for t in threads) + '  speedup')
+    for num_qubits in args.qubits:
+        megabytes = estimate_memory(num_qubits, args.dtype)['state_bytes'] / 2 ** 20
+        timings = [time_layer(num_qubits, t, np.dtype(args.dtype), args.repeats) for t in threads]
+        row = ' '.join(f"{seconds * 1e3:>10.2f}" for seconds in timings)
+        print(f"{num_qubits:>6} {megabytes:>9.0f} {row}  {timings[0] / timings[-1]:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Load-test the quantum REST API.
+
+Fires requests at a running server from 1..N concurrent clients and reports
+p50/p99 latency of successful responses, requests per second, and how many
+requests were turned away with 429 (split into queue full and rate limited)
+or handed off as 202 jobs.
+
+Start the server first, then run (from the repository root):
+    python -m src.quantum_integration.quantum_api --workers 4 --max-queued 64
+    python scripts/load_test_api.py --concurrency 1 4 16 64 --requests 400
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def post(url, payload):
+    """POST JSON and return (status, seconds, body)."""
+    body = json.dumps(payload).encode()
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as response:
+            status, data = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, data = e.code, e.read()
+    return status, time.perf_counter() - start, data
+
+
+def rejection_reason(data):
+    """The "reason" of a 429 body; bodies without one (older servers) mean the queue was full."""
+    try:
+        return json.loads(data).get('reason', 'queue_full')
+    except ValueError:
+        return 'queue_full'
+
+
+def make_request(args):
+    """Build the (url, payload) pair every client sends for the chosen endpoint."""
+    if args.endpoint == 'measure':
+        return f"{args.url}/measure", {'num_qubits': args.qubits}
+    _, _, data = post(f"{args.url}/create_circuit", {'num_qubits': args.qubits})
+    session_id = json.loads(data)['session_id']
+    gates = [{'gate': 'H', 'target_qubits': [0]}]
+    gates += [{'gate': 'CX', 'target_qubits': [q, q + 1]} for q in range(args.qubits - 1)]
+    post(f"{args.url}/apply_gates", {'session_id': session_id, 'gates': gates})
+    return f"{args.url}/run", {'session_id': session_id, 'shots': args.shots}
+
+
+def run_level(url, payload, concurrency, num_requests):
+    """Send num_requests requests from `concurrency` clients; returns the report row."""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(lambda _: post(url, payload), range(num_requests)))
+        elapsed = time.perf_counter() - start
+    ok = [seconds for status, seconds, _ in results if status == 200]
+    statuses = [status for status, _, _ in results]
+    reasons = [rejection_reason(data) for status, _, data in results if status == 429]
+    p50, p99 = np.percentile(ok, [50, 99]) * 1e3 if ok else (float('nan'), float('nan'))
+    return {
+        'p50': p50,
+        'p99': p99,
+        'rps': len(ok) / elapsed,
+        'queue_full': reasons.count('queue_full'),
+        'rate_limited': reasons.count('rate_limited'),
+        'deferred': statuses.count(202),
+        'errors': sum(status not in (200, 202, 429) for status in statuses),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--endpoint', choices=['measure', 'run'], default='run')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--requests', type=int, default=200, help="requests per concurrency level")
+    parser.add_argument('--qubits', type=int, default=5)
+    parser.add_argument('--shots', type=int, default=1024)
+    args = parser.parse_args()
+    url, payload = make_request(args)
+
+    print(f"Endpoint: {url}, {args.requests} requests per level")
+    print(f"{'clients':>7} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9} {'429 q':>6} {'429 rl':>6} {'202':>6} "
+          f"{'errors':>6}")
+    for concurrency in args.concurrency:
+        row = run_level(url, payload, concurrency, args.requests)
+        print(f"{concurrency:>7} {row['p50']:>9.1f} {row['p99']:>9.1f} {row['rps']:>9.1f} "
+              f"{row['queue_full']:>6} {row['rate_limited']:>6} {row['deferred']:>6} {row['errors']:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -88,7 +88,7 @@ PI_COIN_MULTISIG_THRESHOLD = 3  # Number of signatures required for transactions
 
 # Pi Coin Privacy Features
 PI_COIN_PRIVACY_ENABLED = True  # Enable privacy features for transactions
-PI_COIN_PRIVACY _ENABLED = "zk-SNARKs"  # Zero-Knowledge Succinct Non-Interactive Arguments of Knowledge for privacy
+PI_COIN_PRIVACY_METHOD = "zk-SNARKs"  # Zero-Knowledge Succinct Non-Interactive Arguments of Knowledge for privacy
 
 # Pi Coin Transaction Monitoring
 PI_COIN_TRANSACTION_MONITORING_ENABLED = True  # Enable transaction monitoring for suspicious activities
@@ -0,0 +1,87 @@
+import numpy as np
+from typing import Dict, Tuple
+from src.quantum_integration.sampling import Seed, counts_from_indices, sample_indices
+
+
+class QAOAEngine:
+    """Pure-NumPy depth-p QAOA for a cost function given as its 2^n diagonal.
+
+    Parameters are packed as [gamma_1..gamma_p, beta_1..beta_p]. The state is
+    |+>^n followed by p layers of exp(-i gamma C), an elementwise phase
+    multiply, and the mixer exp(-i beta X) on every qubit (RX(2 beta)),
+    applied by viewing the state as (high, 2, low) around each qubit axis.
+    No circuit is ever built, so one evaluation costs O(p * n * 2^n).
+    """
+
+    def __init__(self, cost_diagonal: np.ndarray):
+        self.cost = np.asarray(cost_diagonal, dtype=float)
+        self.num_qubits = int(np.log2(len(self.cost)))
+        if 2 ** self.num_qubits != len(self.cost):
+            raise ValueError("The cost diagonal must have 2^n entries.")
+
+    def _split(self, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        params = np.asarray(params, dtype=float)
+        if params.ndim != 1 or len(params) % 2:
+            raise ValueError("QAOA parameters must be [gammas..., betas...] of even length.")
+        p = len(params) // 2
+        return params[:p], params[p:]
+
+    def _qubit_view(self, state: np.ndarray, qubit: int) -> np.ndarray:
+        """View the state as (high bits, qubit, low bits)."""
+        return state.reshape(2 ** (self.num_qubits - 1 - qubit), 2, 2 ** qubit)
+
+    def _mix(self, state: np.ndarray, beta: float) -> np.ndarray:
+        """Apply RX(2 beta) to every qubit in place."""
+        c, s = np.cos(beta), -1j * np.sin(beta)
+        for qubit in range(self.num_qubits):
+            view = self._qubit_view(state, qubit)
+            zero, one = view[:, 0, :].copy(), view[:, 1, :]
+            view[:, 0, :] = c * zero + s * one
+            view[:, 1, :] = s * zero + c * one
+        return state
+
+    def _sum_x(self, state: np.ndarray) -> np.ndarray:
+        """Return (sum_q X_q)|state>."""
+        result = np.zeros_like(state)
+        for qubit in range(self.num_qubits):
+            result += self._qubit_view(state, qubit)[:, ::-1, :].reshape(-1)
+        return result
+
+    def state(self, params: np.ndarray) -> np.ndarray:
+        """Final QAOA statevector; qubit q is bit q of the basis index."""
+        gammas, betas = self._split(params)
+        state = np.full(len(self.cost), 1 / np.sqrt(len(self.cost)), dtype=complex)
+        for gamma, beta in zip(gammas, betas):
+            state *= np.exp(-1j * gamma * self.cost)
+            self._mix(state, beta)
+        return state
+
+    def expectation(self, params: np.ndarray) -> float:
+        """<C> in the final state."""
+        return float(np.abs(self.state(params)) ** 2 @ self.cost)
+
+    def value_and_grad(self, params: np.ndarray) -> Tuple[float, np.ndarray]:
+        """<C> and its gradient by adjoint differentiation (one forward, one backward sweep).
+
+        Both layer unitaries are exp(-i theta G) with G = C or sum_q X_q, so each
+        angle contributes 2 Im<lambda|G|psi> with lambda = C psi carried backwards.
+        """
+        gammas, betas = self._split(params)
+        psi = self.state(params)
+        lam = self.cost * psi
+        value = float(np.real(np.vdot(psi, lam)))
+        grad_gammas, grad_betas = np.zeros(len(gammas)), np.zeros(len(betas))
+        for layer in range(len(gammas) - 1, -1, -1):
+            grad_betas[layer] = 2 * np.imag(np.vdot(lam, self._sum_x(psi)))
+            self._mix(psi, -betas[layer])
+            self._mix(lam, -betas[layer])
+            grad_gammas[layer] = 2 * np.imag(np.vdot(lam, self.cost * psi))
+            phase = np.exp(1j * gammas[layer] * self.cost)
+            psi *= phase
+            lam *= phase
+        return value, np.concatenate([grad_gammas, grad_betas])
+
+    def sample(self, params: np.ndarray, shots: int, seed: Seed = None) -> Dict[str, int]:
+        """Draw measurement shots from the final state as Qiskit-style counts."""
+        probabilities = np.abs(self.state(params)) ** 2
+        return counts_from_indices(sample_indices(probabilities, shots, seed), self.num_qubits)
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import OptimizeResult, minimize
+from typing import Dict, List, Optional, Tuple
+from src.core.algorithms.qaoa_engine import QAOAEngine
+
+logger = logging.getLogger(__name__)
+
+# Engine held by each worker process, built once by the pool initializer
+_worker_engine: Optional[QAOAEngine] = None
+
+
+def _init_worker(cost_diagonal: np.ndarray):
+    global _worker_engine
+    _worker_engine = QAOAEngine(cost_diagonal)
+
+
+def _local_search(engine: QAOAEngine, initial_params: np.ndarray, maxiter: int) -> Tuple[np.ndarray, float, int]:
+    """L-BFGS-B from one start; returns (params, expected cost, evaluations)."""
+    def negated(params):
+        value, grad = engine.value_and_grad(params)
+        return -value, -grad
+    result = minimize(negated, initial_params, jac=True, method='L-BFGS-B', options={'maxiter': maxiter})
+    return result.x, -result.fun, result.nfev
+
+
+def _local_search_in_worker(initial_params: np.ndarray, maxiter: int) -> Tuple[np.ndarray, float, int]:
+    return _local_search(_worker_engine, initial_params, maxiter)
+
+
+def interpolate_params(params: np.ndarray) -> np.ndarray:
+    """INTERP warm start: stretch optimal depth-p angles to a depth-(p+1) initial guess."""
+    p = len(params) // 2
+    stretched = []
+    for angles in (params[:p], params[p:]):
+        padded = np.concatenate([[0.0], angles, [0.0]])
+        stretched.append([(i / p) * padded[i] + ((p - i) / p) * padded[i + 1] for i in range(p + 1)])
+    return np.concatenate(stretched)
+
+
+class QAOAOptimizer:
+    """Multi-start, layer-by-layer QAOA driver on top of QAOAEngine.
+
+    Each depth runs `num_starts` L-BFGS-B searches (in a process pool when
+    workers > 1) and keeps the best. Depth p + 1 starts from the INTERP
+    stretch of the best depth-p angles plus perturbed copies of it. Layers
+    stop early once the approximation ratio reaches `target_ratio` or
+    improves by less than `tolerance`. With a `cache_path`, the best angles
+    per depth are kept in a JSON file keyed by graph fingerprint and reused
+    as starting points by later runs.
+    """
+
+    def __init__(self, cost_diagonal: np.ndarray, fingerprint: Optional[str] = None, num_starts: int = 8,
+                 workers: int = 1, cache_path: Optional[str] = None, target_ratio: float = 1.0,
+                 tolerance: float = 1e-4, maxiter: int = 200, seed: Optional[int] = None):
+        self.cost_diagonal = np.asarray(cost_diagonal, dtype=float)
+        self.fingerprint = fingerprint or hashlib.sha256(self.cost_diagonal.tobytes()).hexdigest()
+        self.num_starts = num_starts
+        self.workers = workers
+        self.cache_path = cache_path
+        self.target_ratio = target_ratio
+        self.tolerance = tolerance
+        self.maxiter = maxiter
+        self.rng = np.random.default_rng(seed)
+        self.engine = QAOAEngine(self.cost_diagonal)
+        self.optimum = float(self.cost_diagonal.max()) or 1.0  # avoid dividing by zero for edgeless graphs
+
+    def _load_cache(self) -> Dict[str, Dict[str, dict]]:
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path) as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable QAOA parameter cache {self.cache_path}: {e}")
+            return {}
+
+    def cached_params(self, p: int) -> Optional[np.ndarray]:
+        """Best known depth-p angles for this graph, if any."""
+        entry = self._load_cache().get(self.fingerprint, {}).get(str(p))
+        return None if entry is None else np.array(entry['params'])
+
+    def _store(self, p: int, params: np.ndarray, value: float):
+        if self.cache_path is None:
+            return
+        cache = self._load_cache()
+        entries = cache.setdefault(self.fingerprint, {})
+        if str(p) in entries and entries[str(p)]['value'] >= value:
+            return
+        entries[str(p)] = {'params': params.tolist(), 'value': value}
+        temporary = f"{self.cache_path}.tmp"
+        with open(temporary, 'w') as handle:
+            json.dump(cache, handle)
+        os.replace(temporary, self.cache_path)  # never leave a half-written cache behind
+
+    def _starts(self, p: int, warm: Optional[np.ndarray]) -> List[np.ndarray]:
+        starts = []
+        cached = self.cached_params(p)
+        if cached is not None:
+            starts.append(cached)
+        if warm is not None:
+            starts.append(warm)
+        while len(starts) < self.num_starts:
+            if warm is not None:
+                starts.append(warm + self.rng.normal(scale=0.1, size=2 * p))
+            else:
+                gammas = self.rng.uniform(0, np.pi, p)
+                betas = self.rng.uniform(0, np.pi / 2, p)
+                starts.append(np.concatenate([gammas, betas]))
+        return starts
+
+    def _search(self, starts: List[np.ndarray], executor: Optional[ProcessPoolExecutor]):
+        if executor is None:
+            return [_local_search(self.engine, start, self.maxiter) for start in starts]
+        return list(executor.map(_local_search_in_worker, starts, [self.maxiter] * len(starts)))
+
+    def run(self, max_p: int = 1) -> OptimizeResult:
+        """Optimize depths 1..max_p layer by layer and return the best result found."""
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                           initargs=(self.cost_diagonal,))
+        history = []
+        best_params, best_value, evaluations = None, -np.inf, 0
+        try:
+            warm = None
+            for p in range(1, max_p + 1):
+                results = self._search(self._starts(p, warm), executor)
+                evaluations += sum(nfev for _, _, nfev in results)
+                params, value, _ = max(results, key=lambda result: result[1])
+                self._store(p, params, value)
+                history.append({'p': p, 'value': value, 'approximation_ratio': value / self.optimum})
+                improvement = value - best_value
+                if value > best_value:
+                    best_params, best_value = params, value
+                if value / self.optimum >= self.target_ratio or improvement < self.tolerance:
+                    break
+                warm = interpolate_params(params)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return OptimizeResult(x=best_params, fun=-best_value, p=len(best_params) // 2, nfev=evaluations,
+                              approximation_ratio=best_value / self.optimum, history=history)
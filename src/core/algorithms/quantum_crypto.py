@@ -1,36 +1,36 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, Aer
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
+from src.quantum_integration.batch_executor import BatchExecutor
 
 class QuantumCrypto:
     def __init__(self, num_qubits=1):
         self.num_qubits = num_qubits
         self.qc = QuantumCircuit(num_qubits)
         self.backend = Aer.get_backend('aer_simulator')
+        self.executor = BatchExecutor(self.backend)
 
-    def prepare_qubit(self, state):
-        """Prepare a qubit in a specific state."""
+    def prepare_qubit(self, state, circuit=None):
+        """Prepare a qubit in a specific state (on self.qc unless another circuit is given)."""
+        circuit = self.qc if circuit is None else circuit
         if state == '0':
-            self.qc.initialize([1, 0], 0)  # |0>
+            circuit.initialize([1, 0], 0)  # |0>
         elif state == '1':
-            self.qc.initialize([0, 1], 0)  # |1>
+            circuit.initialize([0, 1], 0)  # |1>
         elif state == '+':
-            self.qc.h(0)  # |+>
+            circuit.h(0)  # |+>
         elif state == '-':
-            self.qc.h(0)
-            self.qc.z(0)  # |->
+            circuit.h(0)
+            circuit.z(0)  # |->
 
-    def measure_qubit(self):
+    def measure_qubit(self, circuit=None):
         """Measure the qubit."""
-        self.qc.measure_all()
+        (self.qc if circuit is None else circuit).measure_all()
 
     def simulate(self):
         """Simulate the quantum circuit."""
-        job = execute(self.qc, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(self.qc)
-        return counts
+        return self.executor.run([self.qc], shots=1024)[0]
 
     def plot_results(self, counts):
         """Plot the results of the measurement."""
@@ -41,14 +41,17 @@ class QuantumCrypto:
     def bb84_protocol(self, alice_bits, basis_choice):
         """Implement the BB84 quantum key distribution protocol."""
         bob_basis = np.random.choice(['Z', 'X'], size=len(alice_bits))
-        bob_results = []
+        circuits = []
 
+        # One circuit per bit, all submitted together as batched jobs
         for i in range(len(alice_bits)):
-            self.prepare_qubit(alice_bits[i] if basis_choice[i] == 'Z' else ('+' if alice_bits[i] == '0' else '-'))
-            self.measure_qubit()
-            counts = self.simulate()
-            bob_results.append(max(counts, key=counts.get))
+            circuit = QuantumCircuit(self.num_qubits)
+            self.prepare_qubit(alice_bits[i] if basis_choice[i] == 'Z' else ('+' if alice_bits[i] == '0' else '-'),
+                               circuit)
+            self.measure_qubit(circuit)
+            circuits.append(circuit)
 
+        bob_results = [max(counts, key=counts.get) for counts in self.executor.run(circuits, shots=1024)]
         return bob_basis, bob_results
 
     def sift_key(self, alice_bits, bob_basis, bob_results):
@@ -1,11 +1,15 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, Aer
 from qiskit.visualization import plot_bloch_multivector, plot_histogram
+from src.quantum_integration.execution_cache import default_cache
+from src.quantum_integration.simulator_frontend import clifford_counts
 
 class QuantumEntanglement:
-    def __init__(self):
+    def __init__(self, seed=None, cache=default_cache):
         self.backend = Aer.get_backend('statevector_simulator')
+        self.seed = seed
+        self.cache = cache
 
     def create_bell_state(self):
         """Create a Bell state (|Φ⁺⟩ = (|00⟩ + |11⟩) / √2)."""
@@ -21,10 +25,7 @@ class QuantumEntanglement:
 
     def simulate_circuit(self, circuit):
         """Simulate the quantum circuit and return the state vector."""
-        job = execute(circuit, self.backend)
-        result = job.result()
-        statevector = result.get_statevector(circuit)
-        return statevector
+        return self.cache.execute(circuit, self.backend, kind='statevector')
 
     def visualize_entanglement(self, statevector):
         """Visualize the entangled state on the Bloch sphere."""
@@ -36,9 +37,9 @@ class QuantumEntanglement:
     def measure_state(self, circuit):
         """Measure the state of the qubits."""
         circuit.measure_all()
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
+        counts = clifford_counts(circuit, shots=1024, seed=self.seed)  # Bell and GHZ circuits skip Aer
+        if counts is None:
+            counts = self.cache.execute(circuit, self.backend, shots=1024, seed=self.seed)
         return counts
 
     def plot_measurement_results(self, counts):
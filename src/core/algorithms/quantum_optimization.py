@@ -1,9 +1,33 @@
+import hashlib
 import numpy as np
+from functools import lru_cache
 from qiskit import QuantumCircuit, Aer, execute
-from qiskit.circuit import Parameter
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
 from scipy.optimize import minimize
+from src.core.algorithms.qaoa_engine import QAOAEngine
+from src.core.algorithms.qaoa_optimizer import QAOAOptimizer
+from src.quantum_integration.adjoint_gradient import scipy_objective
+from src.quantum_integration.batched_simulator import BatchedQuantumSimulator
+from src.quantum_integration.observables import DiagonalObservable
+from src.quantum_integration.simulator_circuit import Parameter, SimulatorCircuit
+
+
+@lru_cache(maxsize=32)
+def max_cut_diagonal(num_qubits, edges):
+    """Cut value of every basis state for a tuple of (u, v) edges, cached per graph."""
+    diagonal = cut_values_for(np.arange(2 ** num_qubits, dtype=np.int64), np.array(edges, dtype=np.int64))
+    diagonal.setflags(write=False)  # shared between callers through the cache
+    return diagonal
+
+
+def cut_values_for(states, edges):
+    """Vectorized cut values: node i is bit i of each basis-state index."""
+    values = np.zeros(len(states), dtype=float)
+    for u, v in edges.reshape(-1, 2):
+        values += ((states >> u) ^ (states >> v)) & 1
+    return values
+
 
 class QuantumOptimization:
     def __init__(self, graph):
@@ -12,29 +36,31 @@ class QuantumOptimization:
         self.backend = Aer.get_backend('aer_simulator')
 
     def create_qaoa_circuit(self, p, gamma, beta):
-        """Create a QAOA circuit for the given parameters."""
+        """Create a depth-p QAOA circuit; gamma and beta are scalars or length-p sequences."""
+        gammas = np.broadcast_to(np.asarray(gamma, dtype=float), (p,))
+        betas = np.broadcast_to(np.asarray(beta, dtype=float), (p,))
         circuit = QuantumCircuit(self.num_qubits)
 
         # Initialize the qubits to |+>
         circuit.h(range(self.num_qubits))
 
-        # Apply the problem Hamiltonian
-        for i in range(len(self.graph)):
-            for j in self.graph[i]:
-                circuit.cx(i, j)
-                circuit.rz(2 * gamma, j)
-                circuit.cx(i, j)
+        for layer in range(p):
+            # Apply the problem Hamiltonian: exp(-i gamma C), up to a global phase
+            for u, v in self.edges:
+                circuit.cx(u, v)
+                circuit.rz(-gammas[layer], v)
+                circuit.cx(u, v)
 
-        # Apply the mixing Hamiltonian
-        for i in range(self.num_qubits):
-            circuit.rx(2 * beta, i)
+            # Apply the mixing Hamiltonian
+            for i in range(self.num_qubits):
+                circuit.rx(2 * betas[layer], i)
 
         return circuit
 
     def objective_function(self, params):
-        """Objective function to minimize."""
-        gamma, beta = params
-        circuit = self.create_qaoa_circuit(1, gamma, beta)
+        """Objective function to minimize; params are [gamma_1..gamma_p, beta_1..beta_p]."""
+        p = len(params) // 2
+        circuit = self.create_qaoa_circuit(p, params[:p], params[p:])
         circuit.measure_all()
 
         # Execute the circuit
@@ -46,32 +72,115 @@ class QuantumOptimization:
         max_cut_value = self.calculate_max_cut(counts)
         return -max_cut_value  # We minimize the negative value
 
-    def calculate_max_cut(self, counts):
-        """Calculate the Max-Cut value from the measurement results."""
-        max_cut_value = 0
-        total_shots = sum(counts.values())
+    def cost_observable(self):
+        """Max-Cut value of every basis state as a diagonal observable."""
+        return DiagonalObservable(self.cost_diagonal())
+
+    def engine(self):
+        """NumPy QAOA engine over this graph's cost diagonal."""
+        return QAOAEngine(self.cost_diagonal())
 
-        for bitstring, count in counts.items():
-            cut_value = self.calculate_cut_value(bitstring)
-            probability = count / total_shots
-            max_cut_value += cut_value * probability
+    def exact_objective(self, params):
+        """Noise-free objective: the exact expected cut value, with no shot sampling."""
+        return -self.engine().expectation(params)
 
-        return max_cut_value
+    def sweep_objective(self, param_grid):
+        """Evaluate the noise-free objective for many (gamma, beta) pairs in one batched simulation."""
+        param_grid = np.atleast_2d(np.asarray(param_grid, dtype=float))
+        gammas, betas = param_grid[:, 0], param_grid[:, 1]
+        simulator = BatchedQuantumSimulator(self.num_qubits, len(param_grid))
+
+        # Same gate sequence as create_qaoa_circuit, with one angle per grid point
+        for i in range(self.num_qubits):
+            simulator.hadamard(i)
+        for u, v in self.edges:
+            simulator.cnot(u, v)
+            simulator.rz(-gammas, v)
+            simulator.cnot(u, v)
+        for i in range(self.num_qubits):
+            simulator.rx(2 * betas, i)
+
+        return -simulator.expectation(self.cost_observable())
+
+    def qaoa_template(self, p):
+        """Depth-p QAOA circuit over the parameter vector [gamma_1..gamma_p, beta_1..beta_p]."""
+        circuit = SimulatorCircuit(self.num_qubits)
+        for i in range(self.num_qubits):
+            circuit.h(i)
+        for layer in range(p):
+            for u, v in self.edges:
+                circuit.cx(u, v)
+                circuit.rz(Parameter(layer, scale=-1.0), v)
+                circuit.cx(u, v)
+            for i in range(self.num_qubits):
+                circuit.rx(2 * Parameter(p + layer), i)
+        return circuit
+
+    @property
+    def edges(self):
+        """Unique undirected edges of the graph as an (num_edges, 2) array with u < v."""
+        edges = sorted({(min(i, j), max(i, j)) for i in self.graph for j in self.graph[i] if i != j})
+        return np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+    def cost_diagonal(self):
+        """Cut value of every basis state, computed once per graph."""
+        return max_cut_diagonal(self.num_qubits, tuple(map(tuple, self.edges.tolist())))
+
+    def graph_fingerprint(self):
+        """Stable hash of the node count and edge set, used to key cached parameters."""
+        return hashlib.sha256(f"{self.num_qubits}:{self.edges.tolist()}".encode()).hexdigest()
+
+    def cut_values(self, bitstrings):
+        """Cut values for an array of sampled bitstrings (qubit n-1 first, as in Qiskit counts)."""
+        states = np.array([int(bitstring.replace(' ', ''), 2) for bitstring in bitstrings], dtype=np.int64)
+        return cut_values_for(states, self.edges)
+
+    def calculate_max_cut(self, counts):
+        """Calculate the Max-Cut value from the measurement results."""
+        frequencies = np.array(list(counts.values()), dtype=float)
+        return float(self.cut_values(list(counts)) @ frequencies / frequencies.sum())
 
     def calculate_cut_value(self, bitstring):
-        """Calculate the cut value for a given bitstring."""
-        cut_value = 0
-        for i in range(len(bitstring)):
-            for j in self.graph[i]:
-                if bitstring[i] != bitstring[j]:  # Different partitions
-                    cut_value += 1
-        return cut_value
-
-    def optimize(self):
-        """Optimize the parameters using a classical optimizer."""
-        initial_params = np.random.rand(2)  # Random initial parameters for gamma and beta
-        result = minimize(self.objective_function, initial_params, method='COBYLA')
-        return result
+        """Calculate the cut value for a given bitstring; node i is bitstring[n - 1 - i]."""
+        return int(self.cut_values([bitstring])[0])
+
+    def optimize(self, gradient=False, p=1, exact=False, engine=None):
+        """Optimize the 2p parameters using a classical optimizer.
+
+        engine='qiskit' minimizes the 1024-shot Aer estimate with COBYLA.
+        engine='numpy' minimizes the exact expectation from QAOAEngine, with
+        COBYLA or, when gradient=True, L-BFGS-B and the engine's adjoint
+        gradients. engine='simulator' runs L-BFGS-B on the parameterized
+        circuit template with adjoint gradients from the NumPy simulator.
+        Without an engine, exact=True picks 'numpy', gradient=True picks
+        'simulator' and the default is 'qiskit', as before engines existed.
+        """
+        if engine is None:
+            engine = 'simulator' if gradient else 'numpy' if exact else 'qiskit'
+        if engine not in ('qiskit', 'numpy', 'simulator'):
+            raise ValueError(f"Unknown QAOA engine '{engine}'. Use 'qiskit', 'numpy' or 'simulator'.")
+        initial_params = np.random.rand(2 * p)  # Random initial gammas and betas
+        if engine == 'qiskit':
+            if gradient:
+                raise ValueError("Gradients need engine='numpy' or 'simulator'.")
+            return minimize(self.objective_function, initial_params, method='COBYLA')
+        if engine == 'simulator':
+            fun, jac = scipy_objective(self.qaoa_template(p), -self.cost_diagonal())
+            if gradient:
+                return minimize(fun, initial_params, jac=jac, method='L-BFGS-B')
+            return minimize(fun, initial_params, method='COBYLA')
+        qaoa = self.engine()
+        if gradient:
+            def value_and_grad(params):
+                value, grad = qaoa.value_and_grad(params)
+                return -value, -grad
+            return minimize(value_and_grad, initial_params, jac=True, method='L-BFGS-B')
+        return minimize(lambda params: -qaoa.expectation(params), initial_params, method='COBYLA')
+
+    def optimize_layerwise(self, max_p=3, **options):
+        """Multi-start, warm-started optimization of depths 1..max_p; see QAOAOptimizer for options."""
+        optimizer = QAOAOptimizer(self.cost_diagonal(), fingerprint=self.graph_fingerprint(), **options)
+        return optimizer.run(max_p)
 
     def plot_results(self, counts):
         """Plot the results of the measurement."""
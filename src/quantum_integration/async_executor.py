@@ -0,0 +1,168 @@
+import asyncio
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from src.quantum_integration.sampling import Seed, spawn_seeds
+from src.quantum_integration.simulator_frontend import sample_counts
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised by non-blocking submissions when every pending slot is taken."""
+
+
+class AsyncQuantumExecutor:
+    """Bounded worker pool for quantum jobs with an asyncio facade.
+
+    At most `max_pending` jobs may be queued or running at once; further
+    submissions wait for a slot (backpressure) or, with block=False, raise
+    ExecutorSaturated. Slots are counted under a thread lock, so the bound holds
+    across threads and event loops (e.g. one asyncio.run per Flask request);
+    a freed slot is handed straight to the longest-waiting coroutine, on its
+    own loop, before blocked synchronous callers see it.
+    A job that times out or whose awaiting task is cancelled is cancelled in
+    the pool if it has not started; a job that is already running finishes and
+    only then frees its slot, since simulator calls cannot be interrupted.
+    With use_processes=True jobs run in a process pool (functions and
+    arguments must then be picklable), keeping CPU-bound simulation off the
+    caller's interpreter entirely.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64, default_timeout: Optional[float] = None,
+                 use_processes: bool = False):
+        self.max_pending = max_pending
+        self.default_timeout = default_timeout
+        if use_processes:
+            # Workers are spawned rather than forked: forking a process whose server threads may hold locks can deadlock
+            self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='quantum-job')
+        self._free = max_pending
+        self._slot_freed = threading.Condition()
+        self._waiters = deque()  # (loop, asyncio.Future) of coroutines waiting for a slot
+
+    def _try_acquire(self) -> bool:
+        with self._slot_freed:
+            if self._free > 0:
+                self._free -= 1
+                return True
+            return False
+
+    def _release(self):
+        """Free a slot, handing it to a waiting coroutine if there is one."""
+        with self._slot_freed:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._grant, waiter)
+                    return
+                except RuntimeError:  # that loop has closed; try the next waiter
+                    continue
+            self._free += 1
+            self._slot_freed.notify()
+
+    def _grant(self, waiter: asyncio.Future):
+        # Runs on the waiter's loop; a waiter cancelled meanwhile passes the slot on
+        if waiter.cancelled():
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    async def _acquire(self, block: bool):
+        if self._try_acquire():
+            return
+        if not block:
+            raise ExecutorSaturated(f"All {self.max_pending} job slots are in use.")
+        waiter = asyncio.get_running_loop().create_future()
+        with self._slot_freed:
+            if self._free > 0:  # freed since the first check
+                self._free -= 1
+                return
+            self._waiters.append((asyncio.get_running_loop(), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # granted just as the caller gave up
+            raise
+
+    def _start(self, fn: Callable[..., Any], args, kwargs) -> Future:
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()  # e.g. submitting after shutdown
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def submit(self, fn: Callable[..., Any], *args, block: bool = True, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) from synchronous code; returns a concurrent.futures.Future."""
+        with self._slot_freed:
+            while self._free == 0:
+                if not block:
+                    raise ExecutorSaturated(f"All {self.max_pending} job slots are in use.")
+                self._slot_freed.wait()
+            self._free -= 1
+        return self._start(fn, args, kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, block: bool = True,
+                  **kwargs) -> Any:
+        """Await fn(*args, **kwargs) on the pool without blocking the event loop."""
+        await self._acquire(block)
+        future = self._start(fn, args, kwargs)
+        timeout = self.default_timeout if timeout is None else timeout
+        # wrap_future forwards cancellation (from wait_for or the caller) to the pool future
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    async def run_circuit(self, circuit, shots: int = 1024, seed: Seed = None, backend: Optional[str] = None,
+                          timeout: Optional[float] = None) -> Dict[str, int]:
+        """Sample a SimulatorCircuit or Qiskit circuit on the NumPy backends and await the counts."""
+        return await self.run(sample_counts, circuit, shots, seed, backend, timeout=timeout)
+
+    async def run_many(self, circuits: List, shots: int = 1024, seed: Seed = None,
+                       timeout: Optional[float] = None) -> List[Dict[str, int]]:
+        """Run circuits concurrently, each under its own child of `seed`; counts are returned in input order."""
+        seeds = spawn_seeds(seed, len(circuits))
+        return await asyncio.gather(*(self.run_circuit(circuit, shots, child, timeout=timeout)
+                                      for circuit, child in zip(circuits, seeds)))
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and cancel any that have not started."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.shutdown(wait=False)
+
+
+_default_executor: Optional[AsyncQuantumExecutor] = None
+_default_lock = threading.Lock()
+
+
+def default_executor() -> AsyncQuantumExecutor:
+    """Process-wide executor, created on first use."""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = AsyncQuantumExecutor()
+    return _default_executor
+
+
+async def run_circuit(circuit, shots: int = 1024, seed: Seed = None, timeout: Optional[float] = None,
+                      executor: Optional[AsyncQuantumExecutor] = None) -> Dict[str, int]:
+    """`await run_circuit(...)` on the shared executor (or the one given)."""
+    return await (executor or default_executor()).run_circuit(circuit, shots, seed, timeout=timeout)
+
+# Example usage
+if __name__ == "__main__":
+    from src.quantum_integration.simulator_circuit import SimulatorCircuit
+
+    async def main():
+        circuits = [SimulatorCircuit(12).h(0).ry(0.1 * k, 1).cx(0, 5) for k in range(16)]
+        results = await asyncio.gather(*(run_circuit(circuit, shots=256, seed=k) for k, circuit in enumerate(circuits)))
+        print("First result:", results[0])
+
+    asyncio.run(main())
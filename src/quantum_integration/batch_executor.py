@@ -0,0 +1,52 @@
+import logging
+from qiskit import Aer, QuantumCircuit, execute
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchExecutor:
+    """Collects circuits and submits them as list jobs instead of one job per circuit.
+
+    Circuits are split into jobs of at most `max_batch_size`; every job is
+    submitted before any result is awaited, so jobs overlap on the simulator.
+    `max_parallel_experiments` is passed to Aer (0 lets it use every core).
+    Results come back as one counts dict per circuit, in submission order.
+    Without a seed every experiment samples independently; with one, Aer
+    seeds the whole job, which makes repeated runs reproducible.
+    """
+
+    def __init__(self, backend=None, max_batch_size: int = 300, max_parallel_experiments: int = 0,
+                 seed: Optional[int] = None):
+        self.backend = backend or Aer.get_backend('qasm_simulator')
+        self.max_batch_size = max_batch_size
+        self.max_parallel_experiments = max_parallel_experiments
+        self.seed = seed
+        self.pending: List[QuantumCircuit] = []
+
+    def add(self, circuit: QuantumCircuit) -> int:
+        """Queue a circuit for the next flush; returns its index in the flushed results."""
+        self.pending.append(circuit)
+        return len(self.pending) - 1
+
+    def flush(self, shots: int = 1024) -> List[Dict[str, int]]:
+        """Run every queued circuit and clear the queue."""
+        circuits, self.pending = self.pending, []
+        return self.run(circuits, shots)
+
+    def run(self, circuits: List[QuantumCircuit], shots: int = 1024) -> List[Dict[str, int]]:
+        """Run circuits as batched jobs; returns one counts dict per circuit, in order."""
+        options = {'shots': shots, 'max_parallel_experiments': self.max_parallel_experiments}
+        if self.seed is not None:
+            options['seed_simulator'] = self.seed
+        jobs = []
+        for start in range(0, len(circuits), self.max_batch_size):
+            batch = circuits[start:start + self.max_batch_size]
+            jobs.append((batch, execute(batch, self.backend, **options)))
+        logger.debug(f"Submitted {len(circuits)} circuits as {len(jobs)} job(s)")
+
+        counts = []
+        for batch, job in jobs:
+            result = job.result()
+            counts.extend(result.get_counts(index) for index in range(len(batch)))
+        return counts
@@ -0,0 +1,113 @@
+import numpy as np
+from typing import List, Optional, Union
+from src.quantum_integration.circuit_compiler import CircuitCompiler, default_compiler
+from src.quantum_integration.observables import Observable, expectation_value
+from src.quantum_integration.simulator_circuit import GATE_MATRICES, SimulatorCircuit
+from src.quantum_integration.tensor_engine import apply_batched_gate_tensor, apply_gate_tensor, validate_targets
+
+Angles = Union[float, np.ndarray]
+
+
+def rotation_matrices(axis: str, thetas: np.ndarray) -> np.ndarray:
+    """Build a (batch, 2, 2) stack of single-qubit rotations in one vectorized call."""
+    thetas = np.asarray(thetas, dtype=float)
+    c, s = np.cos(thetas / 2), np.sin(thetas / 2)
+    gates = np.zeros(thetas.shape + (2, 2), dtype=complex)
+    if axis == 'x':
+        gates[..., 0, 0] = c
+        gates[..., 1, 1] = c
+        gates[..., 0, 1] = -1j * s
+        gates[..., 1, 0] = -1j * s
+    elif axis == 'y':
+        gates[..., 0, 0] = c
+        gates[..., 1, 1] = c
+        gates[..., 0, 1] = -s
+        gates[..., 1, 0] = s
+    elif axis == 'z':
+        gates[..., 0, 0] = np.exp(-0.5j * thetas)
+        gates[..., 1, 1] = np.exp(0.5j * thetas)
+    else:
+        raise ValueError("Rotation axis must be 'x', 'y' or 'z'.")
+    return gates
+
+
+class BatchedQuantumSimulator:
+    """Statevector simulator holding a (batch, 2^n) array of independent states.
+
+    Shared gates are applied to every member with one tensor contraction, and
+    parameterized rotations take one angle per member, so a feature map over
+    many samples or a sweep over a parameter grid costs a handful of NumPy calls.
+    """
+
+    def __init__(self, num_qubits: int, batch_size: int):
+        self.num_qubits = num_qubits
+        self.batch_size = batch_size
+        self.state = np.zeros((batch_size, 2 ** num_qubits), dtype=complex)
+        self.state[:, 0] = 1  # Initialize every member to |0...0>
+
+    def apply_gate(self, gate: np.ndarray, target_qubits: List[int]):
+        """Apply one gate to all members, or a (batch, d, d) stack with one gate per member."""
+        validate_targets(target_qubits, self.num_qubits)
+        dim = 2 ** len(target_qubits)
+        if gate.shape == (dim, dim):
+            self.state = apply_gate_tensor(self.state, gate, target_qubits, self.num_qubits)
+        elif gate.shape == (self.batch_size, dim, dim):
+            self.state = apply_batched_gate_tensor(self.state, gate, target_qubits, self.num_qubits)
+        else:
+            raise ValueError(f"Expected a ({dim}, {dim}) or ({self.batch_size}, {dim}, {dim}) gate array.")
+
+    def _rotate(self, axis: str, thetas: Angles, qubit: int):
+        thetas = np.asarray(thetas, dtype=float)
+        if thetas.ndim != 0 and thetas.shape != (self.batch_size,):
+            raise ValueError(f"Expected a scalar angle or {self.batch_size} angles.")
+        self.apply_gate(rotation_matrices(axis, thetas), [qubit])
+
+    def rx(self, thetas: Angles, qubit: int):
+        """Apply RX rotations with one angle per batch member (or a shared angle)."""
+        self._rotate('x', thetas, qubit)
+
+    def ry(self, thetas: Angles, qubit: int):
+        """Apply RY rotations with one angle per batch member (or a shared angle)."""
+        self._rotate('y', thetas, qubit)
+
+    def rz(self, thetas: Angles, qubit: int):
+        """Apply RZ rotations with one angle per batch member (or a shared angle)."""
+        self._rotate('z', thetas, qubit)
+
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit of every member."""
+        self.apply_gate(GATE_MATRICES['h'], [qubit])
+
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit of every member."""
+        self.apply_gate(GATE_MATRICES['x'], [qubit])
+
+    def cnot(self, control: int, target: int):
+        """Apply CNOT gate to every member."""
+        self.apply_gate(GATE_MATRICES['cx'], [control, target])
+
+    def run(self, circuit: SimulatorCircuit, compiler: Optional[CircuitCompiler] = None):
+        """Apply a fixed (fused) circuit to every batch member."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        program = (compiler or default_compiler).compile(circuit)
+        self.state = program.apply(self.state)
+        return program.report
+
+    def probabilities(self) -> np.ndarray:
+        """Return the (batch, 2^n) array of basis-state probabilities."""
+        return np.abs(self.state) ** 2
+
+    def expectation(self, observable: Observable) -> np.ndarray:
+        """Exact expectation value of the observable for every batch member."""
+        return expectation_value(observable, self.state)
+
+# Example usage
+if __name__ == "__main__":
+    samples = np.random.rand(10000, 2) * np.pi
+    simulator = BatchedQuantumSimulator(num_qubits=2, batch_size=len(samples))
+    simulator.rx(samples[:, 0], 0)
+    simulator.rx(samples[:, 1], 1)
+    simulator.cnot(0, 1)
+    print("Probabilities of the first three samples:")
+    print(simulator.probabilities()[:3])
@@ -0,0 +1,120 @@
+import logging
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+from src.quantum_integration.simulator_circuit import SimulatorCircuit
+from src.quantum_integration.tensor_engine import apply_gate_tensor
+
+logger = logging.getLogger(__name__)
+
+
+def embed_gate(matrix: np.ndarray, qubits: Sequence[int], block: Sequence[int]) -> np.ndarray:
+    """Express a gate on `qubits` as a matrix on the larger ordered qubit `block`."""
+    if tuple(qubits) == tuple(block):
+        return matrix
+    size = len(block)
+    # Inside a block matrix the first qubit is the most significant bit
+    local_targets = [size - 1 - block.index(qubit) for qubit in qubits]
+    columns = apply_gate_tensor(np.eye(2 ** size, dtype=complex), matrix, local_targets, size)
+    return columns.T
+
+
+class CompiledProgram:
+    """Fused gate sequence ready to be applied to a statevector."""
+
+    def __init__(self, num_qubits: int, operations: List[Tuple[np.ndarray, Tuple[int, ...]]], source_gates: int):
+        self.num_qubits = num_qubits
+        self.operations = operations
+        self.source_gates = source_gates
+
+    @property
+    def report(self) -> Dict[str, int]:
+        """Summarize how many full passes over the statevector were removed by fusion."""
+        return {
+            'gates_in': self.source_gates,
+            'passes_out': len(self.operations),
+            'passes_removed': self.source_gates - len(self.operations),
+        }
+
+    def apply(self, state: np.ndarray) -> np.ndarray:
+        """Apply the program to a statevector and return the new state."""
+        for matrix, qubits in self.operations:
+            state = apply_gate_tensor(state, matrix, qubits, self.num_qubits)
+        return state
+
+
+class CircuitCompiler:
+    def __init__(self, max_fused_qubits: int = 2, cache_size: int = 128):
+        self.max_fused_qubits = max_fused_qubits
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, circuit: SimulatorCircuit) -> CompiledProgram:
+        """Compile a circuit, reusing the cached program for structurally identical circuits."""
+        if circuit.num_parameters:
+            raise ValueError("Bind the circuit's parameters before compiling it.")
+        key = circuit.fingerprint()
+        program = self._cache.get(key)
+        if program is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return program
+
+        self.misses += 1
+        program = self.fuse(circuit)
+        self._cache[key] = program
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        logger.debug(f"Compiled circuit {key[:12]}: {program.report}")
+        return program
+
+    def fuse(self, circuit: SimulatorCircuit) -> CompiledProgram:
+        """Merge gates into blocks of at most max_fused_qubits qubits.
+
+        A gate is merged into the most recent operation touching any of its
+        qubits. Every later operation is disjoint from the gate, so the two
+        commute and the merge preserves the circuit's action.
+        """
+        operations: List[Tuple[np.ndarray, Tuple[int, ...]]] = []
+        last_op = {}  # qubit -> index of the last operation acting on it
+
+        for instruction in circuit.instructions:
+            qubits = instruction.qubits
+            touched = [last_op[qubit] for qubit in qubits if qubit in last_op]
+            if touched:
+                index = max(touched)
+                matrix, block = operations[index]
+                merged = list(block) + [qubit for qubit in qubits if qubit not in block]
+                if len(merged) <= self.max_fused_qubits:
+                    fused = embed_gate(instruction.matrix, qubits, merged) @ embed_gate(matrix, block, merged)
+                    operations[index] = (fused, tuple(merged))
+                    for qubit in merged:
+                        last_op[qubit] = max(last_op.get(qubit, index), index)
+                    continue
+
+            operations.append((instruction.matrix, qubits))
+            for qubit in qubits:
+                last_op[qubit] = len(operations) - 1
+
+        return CompiledProgram(circuit.num_qubits, operations, len(circuit.instructions))
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return cache statistics."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+
+default_compiler = CircuitCompiler()
+
+# Example usage
+if __name__ == "__main__":
+    circuit = SimulatorCircuit(3)
+    for qubit in range(3):
+        circuit.h(qubit).rz(0.3, qubit).rx(0.2, qubit)
+    circuit.cx(0, 1).rz(0.1, 1).cx(0, 1).cx(1, 2)
+
+    program = default_compiler.compile(circuit)
+    print("Fusion report:", program.report)
+    default_compiler.compile(circuit)
+    print("Cache info:", default_compiler.cache_info())
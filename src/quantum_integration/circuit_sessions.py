@@ -0,0 +1,98 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class SessionNotFound(KeyError):
+    """The session ID is unknown or its session has expired."""
+
+
+class CircuitSession:
+    """A circuit being built across requests, plus its bookkeeping."""
+
+    def __init__(self, session_id: str, num_qubits: int, circuit: Any, now: float):
+        self.session_id = session_id
+        self.num_qubits = num_qubits
+        self.circuit = circuit
+        self.gate_count = 0
+        self.created = now
+        self.last_access = now
+        self.lock = threading.Lock()  # serializes edits to this session's circuit
+
+    def describe(self) -> Dict[str, Any]:
+        return {'session_id': self.session_id, 'num_qubits': self.num_qubits, 'gate_count': self.gate_count}
+
+
+class SessionStore:
+    """Bounded, TTL-evicted map of session ID -> CircuitSession.
+
+    Sessions idle for longer than `ttl` seconds are dropped; when `max_sessions`
+    is reached, expired sessions go first and then the least recently used one.
+    Together with `max_gates` and `max_qubits` this caps the memory held by
+    client circuits.
+    """
+
+    def __init__(self, create_circuit: Callable[[int], Any], max_sessions: int = 1000, ttl: float = 600.0,
+                 max_gates: int = 10000, max_qubits: int = 24, clock: Callable[[], float] = time.monotonic):
+        self.create_circuit = create_circuit
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_gates = max_gates
+        self.max_qubits = max_qubits
+        self.clock = clock
+        self._sessions: 'OrderedDict[str, CircuitSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict_expired(self, now: float):
+        # Sessions are kept in last-access order, so expired ones sit at the front
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_access <= self.ttl:
+                break
+            self._sessions.popitem(last=False)
+
+    def create(self, num_qubits: int) -> CircuitSession:
+        """Start a session with an empty circuit on num_qubits qubits."""
+        if not 1 <= num_qubits <= self.max_qubits:
+            raise ValueError(f"num_qubits must be between 1 and {self.max_qubits}.")
+        now = self.clock()
+        session = CircuitSession(uuid.uuid4().hex, num_qubits, self.create_circuit(num_qubits), now)
+        with self._lock:
+            self._evict_expired(now)
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+            self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: Optional[str]) -> CircuitSession:
+        """Return a live session and refresh its TTL; raises SessionNotFound otherwise."""
+        now = self.clock()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise SessionNotFound(session_id)
+            session.last_access = now
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id: str):
+        """Drop a session; raises SessionNotFound if it does not exist."""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise SessionNotFound(session_id)
+
+    def apply(self, session_id: str, edit: Callable[[Any], Any], num_gates: int) -> CircuitSession:
+        """Run `edit(circuit)` under the session lock; callers validate the gates beforehand."""
+        session = self.get(session_id)
+        with session.lock:
+            if session.gate_count + num_gates > self.max_gates:
+                raise ValueError(f"Sessions are limited to {self.max_gates} gates.")
+            edit(session.circuit)
+            session.gate_count += num_gates
+        return session
@@ -0,0 +1,155 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from src.quantum_integration.noise_channels import (NoiseModel, amplitude_damping_kraus, depolarizing_kraus,
+                                                    superoperator)
+from src.quantum_integration.sampling import Seed, counts_from_indices, sample_indices
+from src.quantum_integration.simulator_circuit import GATE_MATRICES, SimulatorCircuit
+from src.quantum_integration.tensor_engine import apply_gate_tensor, validate_targets
+
+
+class DensityMatrixSimulator:
+    """Exact mixed-state simulator.
+
+    rho is stored flat with the row index as the high qubits n..2n-1 and the
+    column index as the low qubits 0..n-1, so a gate is two tensor contractions
+    (U on the row axes, conj(U) on the column axes). A channel is a single
+    contraction with its superoperator sum_k K (x) conj(K) on the target axes.
+    """
+
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+        self.rho = np.zeros(4 ** num_qubits, dtype=complex)
+        self.rho[0] = 1  # |0...0><0...0|
+
+    def apply_gate(self, gate: np.ndarray, target_qubits: List[int]):
+        """Apply a unitary gate: rho -> U rho U^dagger."""
+        validate_targets(target_qubits, self.num_qubits)
+        n = self.num_qubits
+        self.rho = apply_gate_tensor(self.rho, gate, [n + qubit for qubit in target_qubits], 2 * n)
+        self.rho = apply_gate_tensor(self.rho, gate.conj(), target_qubits, 2 * n)
+
+    def apply_channel(self, kraus: np.ndarray, qubit: int):
+        """Apply a single-qubit channel given as a (num_kraus, 2, 2) stack."""
+        validate_targets([qubit], self.num_qubits)
+        self.rho = apply_gate_tensor(self.rho, superoperator(kraus), [self.num_qubits + qubit, qubit],
+                                     2 * self.num_qubits)
+
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['h'], [qubit])
+
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['x'], [qubit])
+
+    def cnot(self, control: int, target: int):
+        """Apply CNOT gate with specified control and target qubits."""
+        self.apply_gate(GATE_MATRICES['cx'], [control, target])
+
+    def run(self, circuit: SimulatorCircuit, noise_model: Optional[NoiseModel] = None):
+        """Apply a circuit, inserting the noise model's channels after each gate."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        for instruction in circuit.instructions:
+            self.apply_gate(instruction.matrix, list(instruction.qubits))
+            if noise_model is not None:
+                for kraus in noise_model.channels_for(instruction.name):
+                    for qubit in instruction.qubits:
+                        self.apply_channel(kraus, qubit)
+
+    def density_matrix(self) -> np.ndarray:
+        """Return rho as a (2^n, 2^n) matrix."""
+        return self.rho.reshape(2 ** self.num_qubits, 2 ** self.num_qubits)
+
+    def probabilities(self) -> np.ndarray:
+        """Return the probability of every basis state (the diagonal of rho)."""
+        return np.real(np.diagonal(self.density_matrix())).clip(min=0)
+
+    def purity(self) -> float:
+        """Return Tr(rho^2)."""
+        return float(np.real(np.vdot(self.rho, self.rho)))
+
+    def sample(self, shots: int, seed: Seed = None) -> Dict[str, int]:
+        """Draw measurement shots from the diagonal of rho."""
+        return counts_from_indices(sample_indices(self.probabilities(), shots, seed), self.num_qubits)
+
+
+class TrajectorySimulator:
+    """Monte Carlo wavefunction simulation of a noisy circuit.
+
+    Trajectories are held as a (batch, 2^n) state array and every Kraus branch
+    is evaluated for the whole batch at once; memory stays O(batch * 2^n)
+    instead of the 4^n of a density matrix. Trajectories are split into
+    fixed-size chunks, each with its own child of SeedSequence(seed), so
+    results are reproducible for a given seed whatever the number of workers.
+    """
+
+    def __init__(self, num_qubits: int, noise_model: NoiseModel, num_trajectories: int = 1000,
+                 seed: Optional[int] = None, workers: int = 1, chunk_size: int = 256):
+        self.num_qubits = num_qubits
+        self.noise_model = noise_model
+        self.num_trajectories = num_trajectories
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.states = None
+
+    def _apply_channel(self, states: np.ndarray, kraus: np.ndarray, qubit: int, rng: np.random.Generator):
+        batch = len(states)
+        branches = np.stack([apply_gate_tensor(states, operator, [qubit], self.num_qubits) for operator in kraus])
+        weights = np.sum(np.abs(branches) ** 2, axis=2)  # (num_kraus, batch)
+        cumulative = np.cumsum(weights, axis=0) / weights.sum(axis=0)
+        choice = np.minimum((rng.random(batch) > cumulative).sum(axis=0), len(kraus) - 1)
+        chosen = branches[choice, np.arange(batch)]
+        return chosen / np.sqrt(weights[choice, np.arange(batch)])[:, None]
+
+    def _run_chunk(self, circuit: SimulatorCircuit, batch: int, seed_sequence) -> np.ndarray:
+        rng = np.random.default_rng(seed_sequence)
+        states = np.zeros((batch, 2 ** self.num_qubits), dtype=complex)
+        states[:, 0] = 1
+        for instruction in circuit.instructions:
+            states = apply_gate_tensor(states, instruction.matrix, instruction.qubits, self.num_qubits)
+            for kraus in self.noise_model.channels_for(instruction.name):
+                for qubit in instruction.qubits:
+                    states = self._apply_channel(states, kraus, qubit, rng)
+        return states
+
+    def run(self, circuit: SimulatorCircuit) -> np.ndarray:
+        """Simulate every trajectory; returns the (num_trajectories, 2^n) final states."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        starts = list(range(0, self.num_trajectories, self.chunk_size))
+        sizes = [min(self.chunk_size, self.num_trajectories - start) for start in starts]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(starts))
+        if self.workers > 1:
+            # NumPy releases the GIL inside the contractions, so chunks run in parallel
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                chunks = list(executor.map(lambda args: self._run_chunk(circuit, *args), zip(sizes, seeds)))
+        else:
+            chunks = [self._run_chunk(circuit, size, seed) for size, seed in zip(sizes, seeds)]
+        self.states = np.concatenate(chunks)
+        return self.states
+
+    def probabilities(self) -> np.ndarray:
+        """Trajectory-averaged basis-state probabilities (an estimate of diag(rho))."""
+        if self.states is None:
+            raise ValueError("Run a circuit before reading probabilities.")
+        return np.mean(np.abs(self.states) ** 2, axis=0)
+
+    def sample(self, shots: int, seed: Seed = None) -> Dict[str, int]:
+        """Draw measurement shots from the trajectory-averaged distribution."""
+        return counts_from_indices(sample_indices(self.probabilities(), shots, seed), self.num_qubits)
+
+# Example usage
+if __name__ == "__main__":
+    noise = NoiseModel().add_channel(depolarizing_kraus(0.05)).add_channel(amplitude_damping_kraus(0.02))
+    bell = SimulatorCircuit(2).h(0).cx(0, 1)
+
+    exact = DensityMatrixSimulator(2)
+    exact.run(bell, noise)
+    print("Density-matrix probabilities:", exact.probabilities(), "purity:", exact.purity())
+
+    trajectories = TrajectorySimulator(2, noise, num_trajectories=4000, seed=1, workers=4)
+    trajectories.run(bell)
+    print("Trajectory probabilities:   ", trajectories.probabilities())
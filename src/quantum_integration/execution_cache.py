@@ -0,0 +1,178 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Result kinds: statevectors are deterministic, counts only when the sampling seed is fixed
+RESULT_KINDS = ('counts', 'statevector')
+
+
+def backend_name(backend) -> str:
+    """Backend name across Qiskit versions (a method on V1 backends, a property on V2)."""
+    name = getattr(backend, 'name', type(backend).__name__)
+    return name() if callable(name) else str(name)
+
+
+def circuit_key(circuit, kind: str = 'counts', shots: Optional[int] = None, seed: Optional[int] = None,
+                backend: str = '') -> str:
+    """Structural hash of a circuit's gates, parameters and wiring plus the execution options.
+
+    Accepts a Qiskit QuantumCircuit or a SimulatorCircuit. Two circuits built
+    separately with the same gates on the same qubits get the same key.
+    """
+    digest = hashlib.sha256(f"{kind}|{backend}|shots={shots}|seed={seed}".encode())
+    if hasattr(circuit, 'fingerprint'):
+        digest.update(circuit.fingerprint().encode())
+        return digest.hexdigest()
+    digest.update(f"|qubits={circuit.num_qubits}|clbits={circuit.num_clbits}".encode())
+    for operation, qargs, cargs in circuit.data:
+        qubits = [circuit.find_bit(qubit).index for qubit in qargs]
+        clbits = [circuit.find_bit(clbit).index for clbit in cargs]
+        digest.update(f"|{operation.name}{qubits}{clbits}".encode())
+        for param in operation.params:
+            if isinstance(param, np.ndarray):
+                digest.update(np.ascontiguousarray(param, dtype=complex).tobytes())
+            else:
+                digest.update(repr(param).encode())
+    return digest.hexdigest()
+
+
+class ExecutionCache:
+    """Memoizes circuit results in a bounded in-memory LRU with an optional on-disk tier.
+
+    Statevector results are always cached. Counts are cached only when a seed
+    is given, since unseeded sampling is meant to differ between calls. With
+    `disk_path`, entries evicted from memory stay on disk (counts as JSON,
+    statevectors as .npy) and survive restarts.
+    """
+
+    def __init__(self, max_entries: int = 256, disk_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def _disk_file(self, key: str, value: Any = None) -> str:
+        extension = '.npy' if isinstance(value, np.ndarray) else '.json'
+        return os.path.join(self.disk_path, key + extension)
+
+    def _read_disk(self, key: str) -> Optional[Any]:
+        if self.disk_path is None:
+            return None
+        array_file, counts_file = self._disk_file(key, np.empty(0)), self._disk_file(key)
+        try:
+            if os.path.exists(array_file):
+                return np.load(array_file)
+            if os.path.exists(counts_file):
+                with open(counts_file) as handle:
+                    return json.load(handle)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+        return None
+
+    def _write_disk(self, key: str, value: Any):
+        path = self._disk_file(key, value)
+        temporary = f"{path}.tmp"
+        with open(temporary, 'wb') as handle:
+            if isinstance(value, np.ndarray):
+                np.save(handle, value)
+            else:
+                handle.write(json.dumps(value).encode())
+        os.replace(temporary, path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look a key up in memory, then on disk; None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any):
+        """Store a result in memory and, when configured, on disk."""
+        with self._lock:
+            self._remember(key, value)
+        if self.disk_path is not None:
+            self._write_disk(key, value)
+
+    def _remember(self, key: str, value: Any):
+        if isinstance(value, np.ndarray) and value.flags.writeable:
+            # The stored array is handed to every caller; copy so the caller's own array stays writable
+            value = value.copy()
+            value.setflags(write=False)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def execute(self, circuit, backend, shots: int = 1024, seed: Optional[int] = None, kind: str = 'counts'):
+        """Run a Qiskit circuit through the cache; returns counts or the statevector as an array."""
+        if kind not in RESULT_KINDS:
+            raise ValueError(f"Unknown result kind '{kind}'. Use one of {RESULT_KINDS}.")
+        from qiskit import execute  # only needed when a circuit actually runs
+
+        if kind == 'statevector':
+            key = circuit_key(circuit, kind, backend=backend_name(backend))
+            return self.get_or_compute(
+                key, lambda: np.asarray(execute(circuit, backend).result().get_statevector(circuit)))
+
+        def run():
+            return dict(execute(circuit, backend, shots=shots, seed_simulator=seed).result().get_counts(circuit))
+
+        if seed is None:
+            with self._lock:
+                self.uncacheable += 1
+            return run()
+        return dict(self.get_or_compute(circuit_key(circuit, kind, shots, seed, backend_name(backend)), run))
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters, the overall hit rate and the number of entries held in memory."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'uncacheable': self.uncacheable,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+            }
+
+    def clear(self):
+        """Drop the in-memory entries and reset the counters (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = self.uncacheable = 0
+
+
+# Shared by the Qiskit-backed modules so identical circuits are executed once per process. Those
+# modules take `seed=None, cache=default_cache`; a fixed seed is what makes their counts cacheable.
+default_cache = ExecutionCache()
@@ -1,10 +1,11 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, Aer
 from qiskit.circuit import Parameter
 from sklearn.svm import SVC
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import make_pipeline
 from typing import List, Tuple
+from src.quantum_integration.batched_simulator import BatchedQuantumSimulator
 
 class HybridQuantumSVM:
     def __init__(self, num_qubits: int, num_features: int):
@@ -32,16 +33,14 @@ class HybridQuantumSVM:
 
     def feature_map(self, X: np.ndarray) -> np.ndarray:
         """Map classical features to quantum states."""
-        mapped_states = []
-        for x in X:
-            # Bind parameters to the circuit based on input features
-            bound_circuit = self.circuit.bind_parameters({self.params[i]: x[i] for i in range(self.num_features)})
-            # Execute the circuit
-            job = execute(bound_circuit, self.backend)
-            result = job.result()
-            statevector = result.get_statevector()
-            mapped_states.append(np.abs(statevector)**2)  # Get probabilities
-        return np.array(mapped_states)
+        # Simulate the feature-map circuit for all samples at once: one RX per
+        # feature with a per-sample angle, then the CNOT chain
+        simulator = BatchedQuantumSimulator(self.num_qubits, len(X))
+        for i in range(self.num_features):
+            simulator.rx(X[:, i], i)
+        for i in range(self.num_qubits - 1):
+            simulator.cnot(i, i + 1)
+        return simulator.probabilities()  # Get probabilities
 
     def fit(self, X: np.ndarray, y: np.ndarray):
         """Fit the hybrid quantum SVM model."""
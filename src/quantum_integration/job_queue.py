@@ -0,0 +1,82 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+from src.quantum_integration.async_executor import AsyncQuantumExecutor, ExecutorSaturated
+
+
+class JobNotFound(KeyError):
+    """The job ID is unknown or its result has already been discarded."""
+
+
+class JobQueue:
+    """Job-ID front end over a bounded AsyncQuantumExecutor for the REST API.
+
+    submit() never blocks: when `max_queued` jobs are already queued or
+    running it raises ExecutorSaturated, which the API turns into a 429.
+    Finished jobs keep their result for `result_ttl` seconds so clients can
+    poll for it; older results are dropped to bound memory.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queued: int = 64, result_ttl: float = 300.0,
+                 use_processes: bool = True, clock: Callable[[], float] = time.monotonic):
+        self.executor = AsyncQuantumExecutor(max_workers=max_workers, max_pending=max_queued,
+                                             use_processes=use_processes)
+        self.result_ttl = result_ttl
+        self.clock = clock
+        self._jobs: 'OrderedDict[str, Future]' = OrderedDict()
+        self._finished: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _record_finish(self, job_id: str):
+        with self._lock:
+            self._finished.setdefault(job_id, self.clock())
+
+    def _evict(self, now: float):
+        for job_id, finished in list(self._finished.items()):
+            if now - finished > self.result_ttl:
+                del self._finished[job_id]
+                self._jobs.pop(job_id, None)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> str:
+        """Start fn(*args, **kwargs) in the pool and return its job ID."""
+        future = self.executor.submit(fn, *args, block=False, **kwargs)
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._evict(self.clock())
+            self._jobs[job_id] = future
+        future.add_done_callback(lambda _: self._record_finish(job_id))
+        return job_id
+
+    def future(self, job_id: str) -> Future:
+        """The concurrent.futures.Future behind a job, for callers that want to wait on it."""
+        with self._lock:
+            now = self.clock()
+            self._evict(now)
+            future = self._jobs.get(job_id)
+            if future is not None and future.done():
+                # result() can return before the done callback has recorded the finish time
+                self._finished.setdefault(job_id, now)
+        if future is None:
+            raise JobNotFound(job_id)
+        return future
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Poll a job: {'job_id', 'status'} plus 'result' or 'error' once it has finished."""
+        future = self.future(job_id)
+        if not future.done():
+            return {'job_id': job_id, 'status': 'running' if future.running() else 'queued'}
+        if future.cancelled():
+            return {'job_id': job_id, 'status': 'cancelled'}
+        error = future.exception()
+        if error is not None:
+            return {'job_id': job_id, 'status': 'failed', 'error': str(error)}
+        return {'job_id': job_id, 'status': 'done', 'result': future.result()}
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
+
+
+__all__ = ['ExecutorSaturated', 'JobNotFound', 'JobQueue']
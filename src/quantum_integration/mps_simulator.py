@@ -0,0 +1,189 @@
+import logging
+import numpy as np
+from typing import Dict, List, Optional, Union
+from src.quantum_integration.circuit_compiler import CircuitCompiler, default_compiler
+from src.quantum_integration.sampling import Seed, counts_from_bits
+from src.quantum_integration.simulator_circuit import GATE_MATRICES, SimulatorCircuit
+from src.quantum_integration.tensor_engine import validate_targets
+
+logger = logging.getLogger(__name__)
+
+
+class MPSSimulator:
+    """Matrix-product-state simulator for shallow, low-entanglement circuits.
+
+    Site i holds qubit i as a (left bond, 2, right bond) tensor. Two-qubit gates
+    are applied to neighbouring sites and split back with an SVD truncated to
+    `max_bond_dimension`, so memory grows with entanglement instead of 2^n.
+    Non-adjacent gates are routed with SWAPs. Qubit ordering matches
+    QuantumSimulator (qubit q is bit q of the basis index).
+    """
+
+    def __init__(self, num_qubits: int, max_bond_dimension: int = 64, cutoff: float = 1e-12):
+        self.num_qubits = num_qubits
+        self.max_bond_dimension = max_bond_dimension
+        self.cutoff = cutoff
+        self.tensors = []
+        for _ in range(num_qubits):
+            site = np.zeros((1, 2, 1), dtype=complex)
+            site[0, 0, 0] = 1  # Initialize to |0>
+            self.tensors.append(site)
+        self.center = 0  # orthogonality center of the mixed-canonical form
+        self.truncation_error = 0.0
+        self.fidelity_estimate = 1.0
+
+    def apply_gate(self, gate: np.ndarray, target_qubits: List[int]):
+        """Apply a 1- or 2-qubit gate to the specified target qubits."""
+        validate_targets(target_qubits, self.num_qubits)
+        dim = 2 ** len(target_qubits)
+        if gate.shape != (dim, dim):
+            raise ValueError("Invalid gate matrix.")
+        if len(target_qubits) == 1:
+            site = target_qubits[0]
+            self.tensors[site] = np.einsum('ij,ajb->aib', gate, self.tensors[site])
+        elif len(target_qubits) == 2:
+            self._apply_two_qubit_gate(gate, target_qubits[0], target_qubits[1])
+        else:
+            raise ValueError("The MPS backend supports 1- and 2-qubit gates only.")
+
+    def _apply_two_qubit_gate(self, gate: np.ndarray, first: int, second: int):
+        low, high = sorted((first, second))
+        # Route the far qubit next to the near one, apply, then route it back
+        for site in range(high - 1, low, -1):
+            self._apply_adjacent(GATE_MATRICES['swap'], site)
+        tensor = gate.reshape(2, 2, 2, 2)
+        if first > second:
+            tensor = tensor.transpose(1, 0, 3, 2)  # put the lower site first
+        self._apply_adjacent(tensor.reshape(4, 4), low)
+        for site in range(low + 1, high):
+            self._apply_adjacent(GATE_MATRICES['swap'], site)
+
+    def _apply_adjacent(self, gate: np.ndarray, site: int):
+        """Apply a gate to sites (site, site + 1), the lower site being the most significant bit."""
+        self._move_center(site)
+        left, right = self.tensors[site], self.tensors[site + 1]
+        theta = np.einsum('apb,bqc->apqc', left, right)
+        theta = np.einsum('pqrs,arsc->apqc', gate.reshape(2, 2, 2, 2), theta)
+
+        chi_left, chi_right = theta.shape[0], theta.shape[3]
+        u, s, vh = np.linalg.svd(theta.reshape(chi_left * 2, 2 * chi_right), full_matrices=False)
+        weights = s ** 2
+        total = weights.sum()
+        keep = int(np.count_nonzero(weights > self.cutoff * total))
+        keep = max(1, min(keep, self.max_bond_dimension))
+        discarded = weights[keep:].sum() / total
+        if discarded > 0:
+            self.truncation_error += discarded
+            self.fidelity_estimate *= 1 - discarded
+
+        s = s[:keep] / np.sqrt(weights[:keep].sum() / total)  # renormalize after truncation
+        self.tensors[site] = u[:, :keep].reshape(chi_left, 2, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, chi_right)
+        self.center = site + 1
+
+    def _move_center(self, site: int):
+        """Shift the orthogonality center with QR sweeps so SVD truncation is optimal."""
+        while self.center < site:
+            tensor = self.tensors[self.center]
+            chi_left, _, chi_right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(chi_left * 2, chi_right))
+            self.tensors[self.center] = q.reshape(chi_left, 2, q.shape[1])
+            self.tensors[self.center + 1] = np.einsum('ab,bpc->apc', r, self.tensors[self.center + 1])
+            self.center += 1
+        while self.center > site:
+            tensor = self.tensors[self.center]
+            chi_left, _, chi_right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(chi_left, 2 * chi_right).T)
+            self.tensors[self.center] = q.T.reshape(q.shape[1], 2, chi_right)
+            self.tensors[self.center - 1] = np.einsum('apb,cb->apc', self.tensors[self.center - 1], r)
+            self.center -= 1
+
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['h'], [qubit])
+
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['x'], [qubit])
+
+    def cnot(self, control: int, target: int):
+        """Apply CNOT gate with specified control and target qubits."""
+        self.apply_gate(GATE_MATRICES['cx'], [control, target])
+
+    def run(self, circuit: SimulatorCircuit, compiler: Optional[CircuitCompiler] = None) -> Dict[str, int]:
+        """Apply a circuit after fusing it into blocks of at most two qubits."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        program = (compiler or default_compiler).compile(circuit)
+        for matrix, qubits in program.operations:
+            self.apply_gate(matrix, list(qubits))
+        return program.report
+
+    def bond_dimensions(self) -> List[int]:
+        """Return the bond dimension between each pair of neighbouring sites."""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def memory_bytes(self) -> int:
+        """Exact number of bytes held by the MPS tensors."""
+        return sum(tensor.nbytes for tensor in self.tensors)
+
+    def memory_report(self) -> Dict[str, Union[int, float]]:
+        """Summarize memory use and accumulated truncation error."""
+        bonds = self.bond_dimensions()
+        return {
+            'memory_bytes': self.memory_bytes(),
+            'dense_statevector_bytes': (2 ** self.num_qubits) * np.dtype(complex).itemsize,
+            'max_bond_dimension': max(bonds) if bonds else 1,
+            'truncation_error': self.truncation_error,
+            'fidelity_estimate': self.fidelity_estimate,
+        }
+
+    def to_statevector(self) -> np.ndarray:
+        """Contract the MPS into a dense statevector (small qubit counts only)."""
+        state = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            state = np.tensordot(state, tensor, axes=([-1], [0]))
+        state = state.reshape((2,) * self.num_qubits)
+        # Axis i is qubit i; reverse so qubit 0 becomes the least significant bit
+        return state.transpose(list(range(self.num_qubits - 1, -1, -1))).reshape(-1)
+
+    def sample_bits(self, shots: int, seed: Seed = None) -> np.ndarray:
+        """Draw shots site by site from conditional distributions; returns a (shots, n) bit array.
+
+        Column q holds qubit q. Shots are sampled together, so the cost is
+        O(n * shots * chi^2) and never touches a 2^n vector.
+        """
+        rng = np.random.default_rng(seed)
+        self._move_center(0)  # every other site becomes right-canonical
+        bits = np.zeros((shots, self.num_qubits), dtype=np.uint8)
+        environment = np.ones((shots, 1), dtype=complex)
+        for site, tensor in enumerate(self.tensors):
+            branches = np.einsum('sa,apb->spb', environment, tensor)
+            weights = np.sum(np.abs(branches) ** 2, axis=2)
+            prob_one = weights[:, 1] / weights.sum(axis=1)
+            outcome = (rng.random(shots) < prob_one).astype(np.uint8)
+            bits[:, site] = outcome
+            environment = branches[np.arange(shots), outcome]
+            environment /= np.linalg.norm(environment, axis=1, keepdims=True)
+        return bits
+
+    def sample(self, shots: int, seed: Seed = None, packed: bool = False) -> Union[Dict[str, int], np.ndarray]:
+        """Draw measurement shots; returns a counts dict or a packed (shots, ceil(n / 8)) array."""
+        bits = self.sample_bits(shots, seed)[:, ::-1]  # qubit n-1 first, as in bitstrings
+        if packed:
+            return np.packbits(bits, axis=1)
+        return counts_from_bits(bits)
+
+# Example usage
+if __name__ == "__main__":
+    num_qubits = 100
+    simulator = MPSSimulator(num_qubits, max_bond_dimension=32)
+
+    # GHZ-style nearest-neighbour CNOT chain over 100 qubits
+    simulator.hadamard(0)
+    for qubit in range(num_qubits - 1):
+        simulator.cnot(qubit, qubit + 1)
+
+    print("Memory report:", simulator.memory_report())
+    counts = simulator.sample(1000, seed=42)
+    print("Distinct outcomes:", {key[:8] + '...': value for key, value in counts.items()})
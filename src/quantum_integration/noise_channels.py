@@ -0,0 +1,54 @@
+import numpy as np
+from typing import Iterable, List, Optional, Tuple
+
+# Each channel is a (num_kraus, 2, 2) stack of Kraus operators with sum_k K^dagger K = I
+
+
+def bit_flip_kraus(probability: float) -> np.ndarray:
+    """Flip the qubit (X) with the given probability."""
+    return np.array([np.sqrt(1 - probability) * np.eye(2),
+                     np.sqrt(probability) * np.array([[0, 1], [1, 0]])], dtype=complex)
+
+
+def phase_flip_kraus(probability: float) -> np.ndarray:
+    """Apply Z with the given probability."""
+    return np.array([np.sqrt(1 - probability) * np.eye(2),
+                     np.sqrt(probability) * np.diag([1, -1])], dtype=complex)
+
+
+def depolarizing_kraus(probability: float) -> np.ndarray:
+    """Replace the qubit with the maximally mixed state with the given probability."""
+    paulis = [np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]), np.diag([1, -1])]
+    return np.array([np.sqrt(1 - 3 * probability / 4) * np.eye(2)]
+                    + [np.sqrt(probability / 4) * pauli for pauli in paulis], dtype=complex)
+
+
+def amplitude_damping_kraus(gamma: float) -> np.ndarray:
+    """Decay |1> -> |0> with probability gamma (energy relaxation)."""
+    return np.array([[[1, 0], [0, np.sqrt(1 - gamma)]],
+                     [[0, np.sqrt(gamma)], [0, 0]]], dtype=complex)
+
+
+def superoperator(kraus: np.ndarray) -> np.ndarray:
+    """Combine Kraus operators into sum_k K (x) conj(K), acting on the (row, column) indices of rho."""
+    return np.einsum('kab,kcd->acbd', kraus, kraus.conj()).reshape(kraus.shape[1] ** 2, kraus.shape[2] ** 2)
+
+
+class NoiseModel:
+    """Single-qubit channels applied to every qubit a gate touches, right after the gate."""
+
+    def __init__(self):
+        self.channels: List[Tuple[np.ndarray, Optional[set]]] = []
+
+    def add_channel(self, kraus: np.ndarray, gates: Optional[Iterable[str]] = None):
+        """Attach a channel after the named gates (all gates when `gates` is None)."""
+        kraus = np.asarray(kraus, dtype=complex)
+        completeness = np.einsum('kba,kbc->ac', kraus.conj(), kraus)
+        if kraus.shape[1:] != (2, 2) or not np.allclose(completeness, np.eye(2)):
+            raise ValueError("Kraus operators must be 2x2 and satisfy sum K^dagger K = I.")
+        self.channels.append((kraus, None if gates is None else set(gates)))
+        return self
+
+    def channels_for(self, gate_name: str) -> List[np.ndarray]:
+        """Return the Kraus stacks to apply after a gate with this name."""
+        return [kraus for kraus, gates in self.channels if gates is None or gate_name in gates]
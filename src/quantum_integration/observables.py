@@ -0,0 +1,108 @@
+import numpy as np
+from typing import Dict, Sequence, Tuple, Union
+
+
+def basis_indices(num_qubits: int) -> np.ndarray:
+    """All basis-state indices 0..2^n - 1."""
+    return np.arange(2 ** num_qubits, dtype=np.int64)
+
+
+def parity(values: np.ndarray, mask: int) -> np.ndarray:
+    """Parity (0 or 1) of the bits of `values` selected by `mask`."""
+    result = np.zeros_like(values)
+    bit = 0
+    while mask >> bit:
+        if (mask >> bit) & 1:
+            result ^= (values >> bit) & 1
+        bit += 1
+    return result
+
+
+class DiagonalObservable:
+    """Observable diagonal in the computational basis, stored as its 2^n eigenvalues."""
+
+    def __init__(self, diagonal: np.ndarray):
+        self.diagonal = np.asarray(diagonal, dtype=float)
+        self.num_qubits = int(np.log2(len(self.diagonal)))
+        if 2 ** self.num_qubits != len(self.diagonal):
+            raise ValueError("The diagonal must have 2^n entries.")
+
+    def apply(self, state: np.ndarray) -> np.ndarray:
+        """Return H|psi>."""
+        return self.diagonal * state
+
+    def expectation(self, state: np.ndarray) -> Union[float, np.ndarray]:
+        """<psi|H|psi> from the probabilities; a (batch, 2^n) state gives one value per member."""
+        return (np.abs(state) ** 2) @ self.diagonal
+
+
+class PauliSum:
+    """Weighted sum of Pauli strings, e.g. PauliSum([('ZZI', 0.5), ('XIX', -1.0)]).
+
+    Labels follow Qiskit: the last character acts on qubit 0. A string P is kept
+    as an X mask, a Z mask and the phase i^(#Y), so
+    (P psi)[j] = i^(#Y) (-1)^parity((j ^ x) & z) psi[j ^ x]
+    and no matrix is ever built. Terms sharing an X mask are merged into one
+    phase vector, cached per mask, so all Z-only terms cost a single dot product.
+    """
+
+    def __init__(self, terms: Sequence[Tuple[str, complex]]):
+        terms = list(terms)
+        if not terms:
+            raise ValueError("A PauliSum needs at least one term.")
+        self.num_qubits = len(terms[0][0])
+        self.terms = []
+        for label, coefficient in terms:
+            if len(label) != self.num_qubits or set(label) - set('IXYZ'):
+                raise ValueError(f"Invalid Pauli label '{label}'.")
+            x_mask = z_mask = 0
+            for qubit, pauli in enumerate(reversed(label)):
+                if pauli in 'XY':
+                    x_mask |= 1 << qubit
+                if pauli in 'ZY':
+                    z_mask |= 1 << qubit
+            phase = 1j ** label.count('Y')
+            self.terms.append((x_mask, z_mask, coefficient * phase))
+        self._phases: Dict[int, np.ndarray] = {}
+
+    def _phase_vectors(self) -> Dict[int, np.ndarray]:
+        if not self._phases:
+            indices = basis_indices(self.num_qubits)
+            for x_mask, z_mask, coefficient in self.terms:
+                signs = 1 - 2 * parity(indices ^ x_mask, z_mask)
+                vector = self._phases.setdefault(x_mask, np.zeros(len(indices), dtype=complex))
+                vector += coefficient * signs
+        return self._phases
+
+    def apply(self, state: np.ndarray) -> np.ndarray:
+        """Return H|psi> for a (2^n,) or (batch, 2^n) state."""
+        indices = basis_indices(self.num_qubits)
+        result = np.zeros(state.shape, dtype=complex)
+        for x_mask, phases in self._phase_vectors().items():
+            result += phases * state[..., indices ^ x_mask]
+        return result
+
+    def expectation(self, state: np.ndarray) -> Union[float, np.ndarray]:
+        """<psi|H|psi>; a (batch, 2^n) state gives one value per member."""
+        indices = basis_indices(self.num_qubits)
+        total = 0
+        for x_mask, phases in self._phase_vectors().items():
+            if x_mask == 0:
+                total = total + (np.abs(state) ** 2) @ phases
+            else:
+                total = total + np.sum(state.conj() * phases * state[..., indices ^ x_mask], axis=-1)
+        return np.real(total)
+
+
+Observable = Union[DiagonalObservable, PauliSum, np.ndarray]
+
+
+def expectation_value(observable: Observable, state: np.ndarray) -> Union[float, np.ndarray]:
+    """Exact expectation of an observable; a plain array is a diagonal (1-D) or a dense matrix (2-D)."""
+    if isinstance(observable, np.ndarray) and observable.ndim == 2:
+        value = np.real(np.einsum('...i,ij,...j->...', state.conj(), observable, state))
+    elif isinstance(observable, np.ndarray):
+        value = DiagonalObservable(observable).expectation(state)
+    else:
+        value = observable.expectation(state)
+    return float(value) if np.ndim(value) == 0 else value
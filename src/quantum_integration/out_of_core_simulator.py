@@ -0,0 +1,191 @@
+import logging
+import os
+import tempfile
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.quantum_integration.circuit_compiler import CircuitCompiler, default_compiler
+from src.quantum_integration.quantum_simulator import estimate_memory
+from src.quantum_integration.sampling import Seed, counts_from_indices, sample_indices
+from src.quantum_integration.simulator_circuit import GATE_MATRICES, SimulatorCircuit
+from src.quantum_integration.tensor_engine import apply_gate_tensor, validate_targets
+
+logger = logging.getLogger(__name__)
+
+
+class OutOfCoreSimulator:
+    """Statevector simulator that keeps the amplitudes in an np.memmap file on local disk.
+
+    The file is processed in blocks of 2^block_qubits contiguous amplitudes:
+    the low `block_qubits` physical bits are "local" and gates on them are
+    applied block by block, one sequential read and write of the file per pass.
+    A gate on a "global" qubit first swaps that qubit with a local one (one
+    paired-block pass), and the swap stays in effect so later gates on the
+    same qubit are local. `run` fuses the circuit and applies every run of
+    consecutive local gates in a single pass to minimize I/O.
+    """
+
+    def __init__(self, num_qubits: int, path: Optional[str] = None, block_qubits: int = 20,
+                 dtype=np.complex128):
+        self.num_qubits = num_qubits
+        self.block_qubits = min(block_qubits, num_qubits)
+        self.block_size = 2 ** self.block_qubits
+        self.num_blocks = 2 ** (num_qubits - self.block_qubits)
+        self.dtype = np.dtype(dtype)
+        estimate_memory(num_qubits, self.dtype)  # validates the dtype
+        self._owns_file = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(suffix='.statevector')
+            os.close(handle)
+        self.path = path
+        self.state = np.memmap(path, dtype=self.dtype, mode='w+', shape=(2 ** num_qubits,))
+        self.state[0] = 1  # Initialize to |0...0>
+        # layout[q] is the physical bit currently holding logical qubit q
+        self.layout = list(range(num_qubits))
+        self._last_used = [0] * num_qubits
+        self._clock = 0
+        self.io = {'bytes_read': 0, 'bytes_written': 0, 'passes': 0, 'swaps': 0, 'gates': 0}
+
+    def _block(self, index: int) -> slice:
+        return slice(index * self.block_size, (index + 1) * self.block_size)
+
+    def _local_pass(self, operations: Sequence[Tuple[np.ndarray, Sequence[int]]]):
+        """Apply gates on local physical bits, streaming every block through memory once."""
+        for index in range(self.num_blocks):
+            block = np.array(self.state[self._block(index)])
+            for gate, physical in operations:
+                block = apply_gate_tensor(block, gate, physical, self.block_qubits)
+            self.state[self._block(index)] = block
+        self._count_pass(2 ** self.num_qubits)
+
+    def _swap_pass(self, global_bit: int, local_bit: int):
+        """Exchange a global and a local physical bit by pairing blocks that differ in the global bit."""
+        stride = 2 ** (global_bit - self.block_qubits)
+        for index in range(self.num_blocks):
+            if index & stride:
+                continue
+            low = np.array(self.state[self._block(index)]).reshape(-1, 2, 2 ** local_bit)
+            high = np.array(self.state[self._block(index | stride)]).reshape(-1, 2, 2 ** local_bit)
+            # Amplitudes with (global, local) = (0, 1) and (1, 0) trade places
+            low[:, 1, :], high[:, 0, :] = high[:, 0, :].copy(), low[:, 1, :].copy()
+            self.state[self._block(index)] = low.reshape(-1)
+            self.state[self._block(index | stride)] = high.reshape(-1)
+        self._count_pass(2 ** self.num_qubits)
+        self.io['swaps'] += 1
+
+    def _count_pass(self, amplitudes: int):
+        self.io['bytes_read'] += amplitudes * self.dtype.itemsize
+        self.io['bytes_written'] += amplitudes * self.dtype.itemsize
+        self.io['passes'] += 1
+
+    def _localize(self, target_qubits: Sequence[int]) -> List[int]:
+        """Swap any global targets into local bits; return the physical bits of the targets."""
+        if len(target_qubits) > self.block_qubits:
+            raise ValueError("Gate acts on more qubits than fit in one block.")
+        self._clock += 1
+        for qubit in target_qubits:
+            self._last_used[qubit] = self._clock
+        for qubit in target_qubits:
+            if self.layout[qubit] < self.block_qubits:
+                continue
+            # Evict the least recently used local qubit that this gate does not need
+            candidates = [other for other in range(self.num_qubits)
+                          if self.layout[other] < self.block_qubits and other not in target_qubits]
+            victim = min(candidates, key=lambda other: self._last_used[other])
+            global_bit, local_bit = self.layout[qubit], self.layout[victim]
+            self._swap_pass(global_bit, local_bit)
+            self.layout[qubit], self.layout[victim] = local_bit, global_bit
+        return [self.layout[qubit] for qubit in target_qubits]
+
+    def apply_gate(self, gate: np.ndarray, target_qubits: List[int]):
+        """Apply a quantum gate to the specified target qubits."""
+        validate_targets(target_qubits, self.num_qubits)
+        physical = self._localize(target_qubits)
+        self._local_pass([(np.asarray(gate), physical)])
+        self.io['gates'] += 1
+
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['h'], [qubit])
+
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit (the first qubit by default)."""
+        self.apply_gate(GATE_MATRICES['x'], [qubit])
+
+    def cnot(self, control: int, target: int):
+        """Apply CNOT gate with specified control and target qubits."""
+        self.apply_gate(GATE_MATRICES['cx'], [control, target])
+
+    def run(self, circuit: SimulatorCircuit, compiler: Optional[CircuitCompiler] = None) -> Dict[str, int]:
+        """Apply a circuit, grouping consecutive local gates into shared passes over the file."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        program = (compiler or default_compiler).compile(circuit)
+        pending = []
+        for matrix, qubits in program.operations:
+            if any(self.layout[qubit] >= self.block_qubits for qubit in qubits) and pending:
+                self._local_pass(pending)  # flush before the layout changes
+                pending = []
+            pending.append((matrix, self._localize(qubits)))
+        if pending:
+            self._local_pass(pending)
+        self.io['gates'] += len(circuit)
+        return program.report
+
+    def io_report(self) -> Dict[str, float]:
+        """Return disk traffic totals and the average bytes moved per gate."""
+        report = dict(self.io)
+        moved = self.io['bytes_read'] + self.io['bytes_written']
+        report['io_bytes_per_gate'] = moved / self.io['gates'] if self.io['gates'] else 0.0
+        return report
+
+    def _logical_indices(self, physical: np.ndarray) -> np.ndarray:
+        """Map physical basis indices to logical ones under the current layout."""
+        logical = np.zeros_like(physical)
+        for qubit, bit in enumerate(self.layout):
+            logical |= ((physical >> bit) & 1) << qubit
+        return logical
+
+    def to_array(self) -> np.ndarray:
+        """Load the full statevector in logical qubit order (small qubit counts only)."""
+        n = self.num_qubits
+        tensor = np.array(self.state).reshape((2,) * n)
+        order = [n - 1 - self.layout[n - 1 - axis] for axis in range(n)]
+        return tensor.transpose(order).reshape(-1)
+
+    def sample(self, shots: int, seed: Seed = None) -> Dict[str, int]:
+        """Draw shots with two streaming passes: pick a block per shot, then an amplitude within it."""
+        rng = np.random.default_rng(seed)
+        weights = np.array([np.sum(np.abs(self.state[self._block(index)]) ** 2)
+                            for index in range(self.num_blocks)])
+        self.io['bytes_read'] += self.state.nbytes
+        blocks = sample_indices(weights, shots, rng)
+        physical = np.empty(shots, dtype=np.int64)
+        sampled = np.unique(blocks)
+        for index in sampled:
+            chosen = np.nonzero(blocks == index)[0]
+            probabilities = np.abs(np.array(self.state[self._block(index)])) ** 2
+            physical[chosen] = index * self.block_size + sample_indices(probabilities, len(chosen), rng)
+        # The second pass reads only the blocks some shot landed in
+        self.io['bytes_read'] += len(sampled) * self.block_size * self.dtype.itemsize
+        return counts_from_indices(self._logical_indices(physical), self.num_qubits)
+
+    def close(self):
+        """Flush the memmap and remove the backing file if this simulator created it."""
+        self.state.flush()
+        del self.state
+        if self._owns_file and os.path.exists(self.path):
+            os.remove(self.path)
+
+# Example usage
+if __name__ == "__main__":
+    simulator = OutOfCoreSimulator(num_qubits=22, block_qubits=16)
+    circuit = SimulatorCircuit(22)
+    for qubit in range(22):
+        circuit.h(qubit)
+    for qubit in range(21):
+        circuit.cx(qubit, qubit + 1)
+
+    simulator.run(circuit)
+    print("I/O report:", simulator.io_report())
+    print("Counts sample:", list(simulator.sample(5, seed=1).items())[:5])
+    simulator.close()
@@ -1,17 +1,62 @@
-from flask import Flask, request, jsonify
-from qiskit import QuantumCircuit, Aer, execute
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+from concurrent.futures import TimeoutError as FutureTimeout
+from flask import Flask, Response, g, request, jsonify, make_response
+from qiskit import QuantumCircuit, Aer
 import numpy as np
+from src.constant import PI_COIN_API_REQUEST_LIMIT, PI_COIN_DDOS_PROTECTION_ENABLED
+from src.quantum_integration.circuit_sessions import SessionNotFound, SessionStore
+from src.quantum_integration.execution_cache import default_cache
+from src.quantum_integration.job_queue import ExecutorSaturated, JobNotFound, JobQueue
+from src.quantum_integration.rate_limiter import TokenBucketLimiter
+from src.quantum_integration.request_cache import RequestCache
+from src.quantum_integration import result_encoding
+from src.quantum_integration.shot_stream import stream_counts
+
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Number of target qubits each supported gate takes
+GATE_ARITY = {'H': 1, 'X': 1, 'CX': 2}
+
+# Seconds a synchronous request waits for its job before answering 202 with the job ID instead
+SYNC_WAIT = 30.0
+
+# Most shots /run samples in one job; larger runs belong on /measure/stream
+MAX_SHOTS = 10 ** 6
+
+# Bounds for /measure/stream: total shots, and shots per streamed chunk
+MAX_STREAM_SHOTS = 10 ** 9
+STREAM_CHUNK_SHOTS = (1_000, 10_000_000)
+
 class QuantumAPI:
-    def __init__(self):
+    def __init__(self, seed=None, cache=default_cache):
         self.backend = Aer.get_backend('statevector_simulator')
+        self.seed = seed
+        self.cache = cache
 
     def create_circuit(self, num_qubits: int) -> QuantumCircuit:
         """Create a new quantum circuit with the specified number of qubits."""
         return QuantumCircuit(num_qubits)
 
+    def validate_gate(self, gate: str, target_qubits: list, num_qubits: int):
+        """Check a gate request before touching any circuit."""
+        if not isinstance(gate, str) or gate not in GATE_ARITY:
+            raise ValueError(f"Unsupported gate type '{gate}'. Use one of {sorted(GATE_ARITY)}.")
+        # bool is an int subclass, but true/false are not qubit indices
+        if not isinstance(target_qubits, list) or not all(
+                isinstance(qubit, int) and not isinstance(qubit, bool) for qubit in target_qubits):
+            raise ValueError("target_qubits must be a list of integers.")
+        if len(target_qubits) != GATE_ARITY[gate] or len(set(target_qubits)) != len(target_qubits):
+            raise ValueError(f"{gate} needs {GATE_ARITY[gate]} distinct target qubit(s).")
+        if not all(0 <= qubit < num_qubits for qubit in target_qubits):
+            raise ValueError(f"Target qubits must be integers in [0, {num_qubits}).")
+
     def apply_gate(self, circuit: QuantumCircuit, gate: str, target_qubits: list):
         """Apply a quantum gate to the specified target qubits."""
         if gate == 'H':
@@ -23,43 +68,342 @@ class QuantumAPI:
         else:
             raise ValueError("Unsupported gate type.")
 
-    def measure(self, circuit: QuantumCircuit) -> np.ndarray:
-        """Measure the qubits in the circuit and return the results."""
+    def measure(self, circuit: QuantumCircuit, shots: int = 1024, seed: int = None) -> np.ndarray:
+        """Measure the qubits in the circuit and return the results (seed overrides the API's seed)."""
         circuit.measure_all()  # Measure all qubits
-        job = execute(circuit, self.backend)
-        result = job.result()
-        return result.get_counts(circuit)
+        return self.cache.execute(circuit, self.backend, shots=shots, seed=self.seed if seed is None else seed)
+
+    def statevector(self, circuit: QuantumCircuit) -> np.ndarray:
+        """Final statevector of the (unmeasured) circuit."""
+        return self.cache.execute(circuit, self.backend, kind='statevector')
 
 quantum_api = QuantumAPI()
+sessions = SessionStore(quantum_api.create_circuit)
+# Runs measurements off the request threads; serve() swaps in a process pool
+jobs = JobQueue(use_processes=False)
+# Results of identical /measure requests, shared for a short TTL
+request_cache = RequestCache(ttl=30.0)
+# Per-client request budget from constant.py, checked before any circuit work
+rate_limiter = TokenBucketLimiter.per_hour(PI_COIN_API_REQUEST_LIMIT) if PI_COIN_DDOS_PROTECTION_ENABLED else None
+
+class JobPending(Exception):
+    """A synchronous measurement outlived SYNC_WAIT; args[0] is the job ID to poll instead."""
+
+def execute_job(circuit: QuantumCircuit, shots: int, seed: int = None) -> dict:
+    """Job entry point, defined at module level so worker processes can unpickle it."""
+    return quantum_api.measure(circuit, shots=shots, seed=seed)
+
+def execute_statevector_job(circuit: QuantumCircuit) -> np.ndarray:
+    return np.ascontiguousarray(quantum_api.statevector(circuit))
+
+def await_job(job_id: str):
+    """Wait for a job's result; raises JobPending after SYNC_WAIT."""
+    try:
+        return jobs.future(job_id).result(timeout=SYNC_WAIT)
+    except FutureTimeout:
+        raise JobPending(job_id)
+
+def run_job(circuit: QuantumCircuit, shots: int, seed: int = None) -> dict:
+    """Queue a measurement and wait for its counts; raises JobPending after SYNC_WAIT."""
+    return await_job(jobs.submit(execute_job, circuit, shots, seed))
+
+def pending_response(job_id: str, **extra):
+    return jsonify({"job_id": job_id, "status_url": f"/jobs/{job_id}", **extra}), 202
+
+def result_response(result, headers: dict = None, **extra) -> Response:
+    """Counts dict or statevector array in the negotiated format.
+
+    JSON is the default. Clients sending Accept: application/vnd.quantum-result
+    get the compact binary layout from result_encoding (the result only;
+    `extra` fields are JSON-only). Either body is compressed with zstd or
+    gzip when Accept-Encoding allows and it is large enough to benefit.
+    """
+    binary = request.accept_mimetypes.best_match(
+        [result_encoding.JSON_MEDIA_TYPE, result_encoding.BINARY_MEDIA_TYPE],
+        default=result_encoding.JSON_MEDIA_TYPE) == result_encoding.BINARY_MEDIA_TYPE
+    is_state = isinstance(result, np.ndarray)
+    if binary:
+        body = result_encoding.encode_statevector(result) if is_state else result_encoding.encode_counts(result)
+        media_type = result_encoding.BINARY_MEDIA_TYPE
+    else:
+        if is_state:
+            payload = {"statevector": {"real": result.real.tolist(), "imag": result.imag.tolist()}, **extra}
+        else:
+            payload = {"measurement_results": result, **extra}
+        body, media_type = json.dumps(payload).encode(), result_encoding.JSON_MEDIA_TYPE
+    response = Response(headers=headers, mimetype=media_type)
+    response.vary.add('Accept')
+    response.vary.add('Accept-Encoding')
+    codec = result_encoding.choose_codec(request.headers.get('Accept-Encoding'))
+    if codec is not None and len(body) >= result_encoding.MIN_COMPRESS_BYTES:
+        body = result_encoding.compress(body, codec)
+        response.headers['Content-Encoding'] = codec
+    response.set_data(body)
+    return response
+
+def dispatch(circuit: QuantumCircuit, shots: int, wait: bool, **extra):
+    """Queue a measurement; answer with the counts, or with 202 and a job ID for long or async runs."""
+    if not wait:
+        return pending_response(jobs.submit(execute_job, circuit, shots), **extra)
+    try:
+        return result_response(run_job(circuit, shots), **extra)
+    except JobPending as pending:
+        return pending_response(pending.args[0], **extra)
+
+def int_field(data: dict, name: str, default: int) -> int:
+    """An integer field of a request body; strings, floats, booleans and null get a 400."""
+    value = data.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{name} must be an integer.")
+    return value
+
+def demo_qubits(data: dict) -> int:
+    """The request's num_qubits for the demo circuit, held to the same bound as sessions."""
+    num_qubits = int(data.get('num_qubits', 1))
+    if not 1 <= num_qubits <= sessions.max_qubits:
+        raise ValueError(f"num_qubits must be between 1 and {sessions.max_qubits}.")
+    return num_qubits
+
+def demo_circuit(num_qubits: int) -> QuantumCircuit:
+    """The /measure demo circuit: a Hadamard on the first qubit."""
+    circuit = quantum_api.create_circuit(num_qubits)
+    quantum_api.apply_gate(circuit, 'H', [0])
+    return circuit
+
+def client_id() -> str:
+    """Rate-limit identity: a digest of the X-API-Key header, else the remote address."""
+    api_key = request.headers.get('X-API-Key')
+    if api_key:
+        return 'key:' + hashlib.sha256(api_key.encode()).hexdigest()[:16]  # keys never appear in /usage
+    return f"ip:{request.remote_addr}"
+
+@app.before_request
+def enforce_rate_limit():
+    # Polling a job is free: its submission was already charged, and a client
+    # waiting on a 202 should not be locked out of collecting the result
+    if rate_limiter is None or request.endpoint == 'job_status':
+        return None
+    allowed, remaining, retry_after = rate_limiter.acquire(client_id())
+    g.rate_limit_remaining = int(remaining)
+    if not allowed:
+        return (jsonify({"error": "Rate limit exceeded", "reason": "rate_limited"}), 429,
+                {"Retry-After": str(math.ceil(retry_after))})
+    return None
+
+@app.after_request
+def rate_limit_headers(response):
+    if 'rate_limit_remaining' in g:
+        response.headers['X-RateLimit-Limit'] = str(int(rate_limiter.capacity))
+        response.headers['X-RateLimit-Remaining'] = str(g.rate_limit_remaining)
+    return response
+
+@app.errorhandler(SessionNotFound)
+def session_not_found(error):
+    return jsonify({"error": f"Unknown or expired session {error.args[0]!r}"}), 404
+
+@app.errorhandler(JobNotFound)
+def job_not_found(error):
+    return jsonify({"error": f"Unknown or expired job {error.args[0]!r}"}), 404
+
+@app.errorhandler(ExecutorSaturated)
+def queue_full(error):
+    return jsonify({"error": str(error), "reason": "queue_full"}), 429, {"Retry-After": "1"}
+
+@app.errorhandler(ValueError)
+def invalid_request(error):
+    return jsonify({"error": str(error)}), 400
 
 @app.route('/create_circuit', methods=['POST'])
 def create_circuit():
-    """Create a new quantum circuit."""
+    """Create a new quantum circuit held server-side under a session ID."""
     data = request.json
-    num_qubits = data.get('num_qubits', 1)
-    circuit = quantum_api.create_circuit(num_qubits)
-    return jsonify({"message": "Circuit created", "num_qubits": num_qubits})
+    session = sessions.create(int_field(data, 'num_qubits', 1))
+    return jsonify({"message": "Circuit created", **session.describe()})
 
 @app.route('/apply_gate', methods=['POST'])
 def apply_gate():
-    """Apply a quantum gate to the circuit."""
+    """Apply a quantum gate to the session's circuit."""
     data = request.json
     gate = data.get('gate')
     target_qubits = data.get('target_qubits', [])
-    circuit = quantum_api.create_circuit(len(target_qubits))  # Create a new circuit for simplicity
-    quantum_api.apply_gate(circuit, gate, target_qubits)
-    return jsonify({"message": f"{gate} gate applied to qubits {target_qubits}"})
+    if 'session_id' not in data:
+        # Stateless form kept for older clients: validates the gate on a throwaway circuit
+        quantum_api.validate_gate(gate, target_qubits, sessions.max_qubits)
+        circuit = quantum_api.create_circuit(max(target_qubits) + 1)
+        quantum_api.apply_gate(circuit, gate, target_qubits)
+        return jsonify({"message": f"{gate} gate applied to qubits {target_qubits}"})
+    session = sessions.get(data['session_id'])
+    quantum_api.validate_gate(gate, target_qubits, session.num_qubits)
+    sessions.apply(session.session_id, lambda circuit: quantum_api.apply_gate(circuit, gate, target_qubits), 1)
+    return jsonify({"message": f"{gate} gate applied to qubits {target_qubits}", **session.describe()})
+
+@app.route('/apply_gates', methods=['POST'])
+def apply_gates():
+    """Apply a whole list of gates in one request: {"session_id", "gates": [{"gate", "target_qubits"}, ...]}."""
+    data = request.json
+    items = data.get('gates', [])
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError('gates must be a list of {"gate", "target_qubits"} objects.')
+    gates = [(item.get('gate'), item.get('target_qubits', [])) for item in items]
+    session = sessions.get(data.get('session_id'))
+    for gate, target_qubits in gates:  # all or nothing: validate before applying any
+        quantum_api.validate_gate(gate, target_qubits, session.num_qubits)
+
+    def apply_all(circuit):
+        for gate, target_qubits in gates:
+            quantum_api.apply_gate(circuit, gate, target_qubits)
+
+    sessions.apply(session.session_id, apply_all, len(gates))
+    return jsonify({"message": f"{len(gates)} gates applied", **session.describe()})
+
+@app.route('/run', methods=['POST'])
+def run():
+    """Measure the session's circuit; the session keeps its unmeasured circuit for further gates.
+
+    With {"async": true} the response is 202 with a job ID to poll at /jobs/<job_id>.
+    """
+    data = request.json
+    shots = int_field(data, 'shots', 1024)
+    if not 1 <= shots <= MAX_SHOTS:
+        raise ValueError(f"shots must be between 1 and {MAX_SHOTS}.")
+    session = sessions.get(data.get('session_id'))
+    with session.lock:
+        circuit = session.circuit.copy()
+    return dispatch(circuit, shots, not data.get('async', False), **session.describe())
+
+@app.route('/statevector', methods=['POST'])
+def statevector():
+    """Final statevector of the session's circuit, as JSON real/imag lists or binary complex64."""
+    data = request.json
+    session = sessions.get(data.get('session_id'))
+    with session.lock:
+        circuit = session.circuit.copy()
+    try:
+        return result_response(await_job(jobs.submit(execute_statevector_job, circuit)), **session.describe())
+    except JobPending as pending:
+        return pending_response(pending.args[0], **session.describe())
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Poll a queued job: status is queued, running, done (with results) or failed."""
+    status = jobs.status(job_id)
+    if 'result' in status:
+        return result_response(status.pop('result'), **status)
+    return jsonify(status)
+
+@app.route('/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    """Free a session before its TTL runs out."""
+    sessions.delete(session_id)
+    return jsonify({"message": "Session deleted", "session_id": session_id})
+
+@app.route('/usage', methods=['GET'])
+def usage():
+    """Rate-limit counters for the caller; with ?all=1 (local requests only) totals and the busiest clients."""
+    if rate_limiter is None:
+        return jsonify({"error": "Rate limiting is disabled"}), 404
+    if request.args.get('all'):
+        if request.remote_addr not in ('127.0.0.1', '::1'):
+            return jsonify({"error": "Usage for all clients is only served to local monitoring"}), 403
+        return jsonify(rate_limiter.usage(limit=int(request.args.get('limit', 100))))
+    return jsonify(rate_limiter.usage(client_id()))
 
 @app.route('/measure', methods=['POST'])
 def measure():
-    """Measure the qubits in the circuit."""
+    """Measure the qubits in the circuit.
+
+    Results are cached per num_qubits and reported in X-Cache (HIT, MISS,
+    COALESCED); send Cache-Control: no-cache for a fresh unseeded sample.
+    """
     data = request.json
-    num_qubits = data.get('num_qubits', 1)
-    circuit = quantum_api.create_circuit(num_qubits)
-    # Apply a sample gate for demonstration
-    quantum_api.apply_gate(circuit, 'H', [0])  # Apply Hadamard to the first qubit
-    counts = quantum_api.measure(circuit)
-    return jsonify({"measurement_results": counts})
+    num_qubits = demo_qubits(data)
+    if data.get('async', False) or request.cache_control.no_cache:
+        response = make_response(dispatch(demo_circuit(num_qubits), 1024, not data.get('async', False)))
+        response.headers['X-Cache'] = 'BYPASS'  # unseeded, so every such call samples afresh
+        return response
+    # Identical requests share one seeded execution, so a cached answer is exactly what a rerun would return
+    key = RequestCache.key('/measure', {'num_qubits': num_qubits})
+    try:
+        counts, status = request_cache.get_or_compute(
+            key, lambda: run_job(demo_circuit(num_qubits), 1024, RequestCache.seed_for(key)))
+    except JobPending as pending:
+        response = make_response(pending_response(pending.args[0]))
+        response.headers['X-Cache'] = 'MISS'
+        return response
+    return result_response(counts, headers={"X-Cache": status})
+
+@app.route('/measure/stream', methods=['POST'])
+def measure_stream():
+    """Stream shot counts as NDJSON, one line per chunk, for runs too large to wait for.
+
+    Body: {"shots", "chunk_shots", "tolerance", "seed"} plus either "session_id"
+    or "num_qubits" (the /measure demo circuit). The statevector is computed
+    once; each chunk is sampled from it and sent as soon as it is drawn. A line
+    carries that chunk's counts, shots_done, max_stderr, converged and
+    finished. Sampling stops at `shots`, once max_stderr <= tolerance, or when
+    the client disconnects. If the statevector is not ready within SYNC_WAIT
+    the answer is 503 with Retry-After, since there is no stream to poll for.
+    """
+    data = request.json
+    shots = int(data.get('shots', 1_000_000))
+    chunk_shots = int(data.get('chunk_shots', 100_000))
+    tolerance = data.get('tolerance')
+    if not 1 <= shots <= MAX_STREAM_SHOTS:
+        raise ValueError(f"shots must be between 1 and {MAX_STREAM_SHOTS}.")
+    if not STREAM_CHUNK_SHOTS[0] <= chunk_shots <= STREAM_CHUNK_SHOTS[1]:
+        raise ValueError(f"chunk_shots must be between {STREAM_CHUNK_SHOTS[0]} and {STREAM_CHUNK_SHOTS[1]}.")
+    if 'session_id' in data:
+        session = sessions.get(data['session_id'])
+        with session.lock:
+            circuit = session.circuit.copy()
+    else:
+        circuit = demo_circuit(demo_qubits(data))
+    job_id = jobs.submit(execute_statevector_job, circuit)
+    try:
+        state = await_job(job_id)
+    except JobPending:
+        jobs.future(job_id).cancel()  # gives its queue slot back if it has not started yet
+        return (jsonify({"error": f"The statevector was not ready within {SYNC_WAIT:g} seconds"}), 503,
+                {"Retry-After": str(math.ceil(SYNC_WAIT))})
+    records = stream_counts(np.abs(state) ** 2, shots, chunk_shots, data.get('seed'),
+                            None if tolerance is None else float(tolerance))
+
+    def generate():
+        # The server closes this generator when the client goes away, which stops sampling
+        for record in records:
+            yield json.dumps(record) + '\n'
+
+    return Response(generate(), mimetype='application/x-ndjson', headers={'X-Accel-Buffering': 'no'})
+
+def serve(host: str = '127.0.0.1', port: int = 5000, workers: int = None, max_queued: int = 64,
+          threads: int = 16):
+    """Serving mode: measurements run in a pool of worker processes behind a bounded queue.
+
+    Once `max_queued` jobs are queued or running, new ones get 429 with
+    Retry-After. Uses waitress when it is installed, otherwise Flask's
+    threaded server without the debugger.
+    """
+    global jobs
+    jobs.shutdown(wait=False)
+    jobs = JobQueue(max_workers=workers or os.cpu_count() or 1, max_queued=max_queued, use_processes=True)
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        logger.warning("waitress is not installed; falling back to Flask's threaded server")
+        app.run(host=host, port=port, threaded=True)
+    else:
+        waitress_serve(app, host=host, port=port, threads=threads)
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    parser = argparse.ArgumentParser(description="Quantum circuit REST API")
+    parser.add_argument('--dev', action='store_true', help="Flask debug server, measurements on threads")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--max-queued', type=int, default=64, help="queued or running jobs before 429")
+    parser.add_argument('--threads', type=int, default=16, help="waitress request threads")
+    args = parser.parse_args()
+    if args.dev:
+        app.run(debug=True)
+    else:
+        serve(args.host, args.port, args.workers, args.max_queued, args.threads)
@@ -1,9 +1,17 @@
+import threading
 import numpy as np
-from qiskit import QuantumCircuit, Aer, transpile, assemble, execute
+from qiskit import QuantumCircuit, transpile
 from qiskit.visualization import plot_histogram
 from qiskit.providers.aer import AerSimulator
+from typing import Dict, List
+from src.quantum_integration.execution_cache import ExecutionCache, backend_name, circuit_key
 
 class QuantumCircuitManager:
+    # One simulator and one transpilation cache shared by every manager in the process
+    _backend = None
+    _backend_lock = threading.Lock()
+    transpile_cache = ExecutionCache(max_entries=256)
+
     def __init__(self, num_qubits):
         self.num_qubits = num_qubits
         self.circuit = QuantumCircuit(num_qubits)
@@ -29,14 +37,36 @@ class QuantumCircuitManager:
         self.add_hadamard(qubit1)
         self.add_cnot(qubit1, qubit2)
 
+    @classmethod
+    def get_backend(cls):
+        """Return the shared AerSimulator, creating it on first use."""
+        with cls._backend_lock:
+            if cls._backend is None:
+                cls._backend = AerSimulator()
+        return cls._backend
+
+    @staticmethod
+    def backend_configuration_key(backend) -> str:
+        """Backend name and basis gates: everything transpile output depends on here."""
+        configuration = getattr(backend, 'configuration', None)
+        basis_gates = sorted(configuration().basis_gates) if callable(configuration) else []
+        return f"{backend_name(backend)}|{basis_gates}"
+
+    def transpile_cached(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        """Transpile for the shared backend, reusing earlier output for structurally identical circuits."""
+        backend = self.get_backend()
+        key = circuit_key(circuit, 'transpile', backend=self.backend_configuration_key(backend))
+        return self.transpile_cache.get_or_compute(key, lambda: transpile(circuit, backend))
+
+    def run_many(self, circuits: List[QuantumCircuit], shots=1024) -> List[Dict[str, int]]:
+        """Run many circuits as a single batched job; returns one counts dict per circuit, in order."""
+        transpiled = [self.transpile_cached(circuit) for circuit in circuits]
+        result = self.get_backend().run(transpiled, shots=shots).result()
+        return [result.get_counts(index) for index in range(len(transpiled))]
+
     def run_simulation(self, shots=1024):
         """Run the quantum circuit simulation and return the results."""
-        simulator = AerSimulator()
-        transpiled_circuit = transpile(self.circuit, simulator)
-        qobj = assemble(transpiled_circuit)
-        result = execute(transpiled_circuit, simulator, shots=shots).result()
-        counts = result.get_counts(self.circuit)
-        return counts
+        return self.run_many([self.circuit], shots=shots)[0]
 
     def visualize_circuit(self):
         """Visualize the quantum circuit."""
@@ -66,5 +96,15 @@ if __name__ == "__main__":
     results = qc_manager.run_simulation(shots=1024)
     print("Measurement results:", results)
 
+    # Sweep a rotation angle; all circuits go to the simulator as one job
+    sweep = []
+    for theta in np.linspace(0, np.pi, 8):
+        qc_manager.reset_circuit()
+        qc_manager.add_rotation(0, theta)
+        qc_manager.circuit.measure_all()
+        sweep.append(qc_manager.circuit)
+    print("Sweep results:", qc_manager.run_many(sweep, shots=256))
+    print("Transpile cache:", QuantumCircuitManager.transpile_cache.stats())
+
     # Visualize the circuit
     qc_manager.visualize_circuit()
@@ -1,11 +1,17 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, Aer
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
+from src.quantum_integration.batch_executor import BatchExecutor
+from src.quantum_integration.execution_cache import default_cache
+from src.quantum_integration.simulator_frontend import clifford_counts, route_counts
 
 class QuantumDataExchange:
-    def __init__(self):
+    def __init__(self, seed=None, cache=default_cache):
         self.backend = Aer.get_backend('qasm_simulator')
+        self.seed = seed
+        self.cache = cache
+        self.executor = BatchExecutor(self.backend, seed=seed)
 
     def create_entangled_pair(self) -> QuantumCircuit:
         """Create a quantum circuit that generates an entangled pair of qubits."""
@@ -33,9 +39,9 @@ class QuantumDataExchange:
     def measure(self, circuit: QuantumCircuit) -> dict:
         """Measure the qubits in the circuit and return the results."""
         circuit.measure([0, 1], [0, 1])  # Measure both qubits
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
+        counts = clifford_counts(circuit, shots=1024, seed=self.seed)  # every prepared state is Clifford
+        if counts is None:
+            counts = self.cache.execute(circuit, self.backend, shots=1024, seed=self.seed)
         return counts
 
     def run_data_exchange(self, state: str):
@@ -51,6 +57,15 @@ class QuantumDataExchange:
 
         return measurement_results
 
+    def run_data_exchange_batch(self, states):
+        """Run the protocol for many states in one batched submission; returns counts per state."""
+        circuits = []
+        for state in states:
+            circuit = self.prepare_state(self.create_entangled_pair(), state)
+            circuit.measure([0, 1], [0, 1])
+            circuits.append(circuit)
+        return route_counts(circuits, 1024, lambda rest: self.executor.run(rest, shots=1024), seed=self.seed)
+
 # Example usage
 if __name__ == "__main__":
     qde = QuantumDataExchange()
@@ -1,12 +1,15 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, Aer
 from qiskit.visualization import plot_bloch_multivector
 import matplotlib.pyplot as plt
 from typing import List, Tuple
+from src.quantum_integration.execution_cache import default_cache
 
 class QuantumInteroperability:
-    def __init__(self):
+    def __init__(self, seed=None, cache=default_cache):
         self.backend = Aer.get_backend('statevector_simulator')
+        self.seed = seed
+        self.cache = cache
 
     def prepare_state(self, state: str) -> QuantumCircuit:
         """Prepare a quantum circuit for a given state."""
@@ -37,10 +40,7 @@ class QuantumInteroperability:
     def measure(self, circuit: QuantumCircuit) -> dict:
         """Measure the qubit in the circuit and return the results."""
         circuit.measure_all()  # Measure all qubits
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
-        return counts
+        return self.cache.execute(circuit, self.backend, shots=1024, seed=self.seed)
 
     def run_interoperability(self, state: str):
         """Run the interoperability protocol."""
@@ -48,8 +48,7 @@ class QuantumInteroperability:
         circuit = self.prepare_state(state)
 
         # Step 2: Execute the circuit and get the statevector
-        job = execute(circuit, self.backend)
-        statevector = job.result().get_statevector(circuit)
+        statevector = self.cache.execute(circuit, self.backend, kind='statevector')
 
         # Step 3: Convert to Bloch sphere coordinates
         bloch_coords = self.convert_to_bloch(statevector)
@@ -1,6 +1,8 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit
 from typing import List, Tuple
+from src.quantum_integration.batch_executor import BatchExecutor
+from src.quantum_integration.simulator_frontend import route_counts
 
 class QuantumKeyDistribution:
     def __init__(self, num_bits: int):
@@ -10,6 +12,7 @@ class QuantumKeyDistribution:
         self.basis_sender = []
         self.basis_receiver = []
         self.eavesdropper_intercepted = []
+        self.executor = BatchExecutor()
 
     def prepare_qubits(self) -> List[QuantumCircuit]:
         """Prepare qubits in random states based on the sender's basis."""
@@ -45,10 +48,8 @@ class QuantumKeyDistribution:
                 circuit.h(0)  # Change to X-basis measurement
             circuit.measure(0, 0)
 
-            # Execute the circuit
-            job = execute(circuit, Aer.get_backend('qasm_simulator'), shots=1)
-            result = job.result()
-            counts = result.get_counts(circuit)
+        # BB84 circuits are Clifford, so they run on the stabilizer backend; anything else goes as batched jobs
+        for counts in route_counts(circuits, 1, lambda rest: self.executor.run(rest, shots=1)):
             measured_value = int(list(counts.keys())[0])  # Get the measured value
             results.append(measured_value)
         return results
@@ -1,62 +1,179 @@
+import logging
+import weakref
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from src.quantum_integration.circuit_compiler import CircuitCompiler, default_compiler
+from src.quantum_integration.observables import Observable, expectation_value
+from src.quantum_integration.sampling import (Seed, counts_from_indices, marginal_probabilities,
+                                              pack_indices, sample_indices)
+from src.quantum_integration.simulator_circuit import SimulatorCircuit
+from src.quantum_integration.tensor_engine import apply_gate_parallel, apply_gate_tensor, validate_targets
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = (np.complex64, np.complex128)
+
+# Below this size thread dispatch costs more than it saves
+MIN_PARALLEL_QUBITS = 14
+
+# Gate application holds the state plus up to two temporaries (contraction output and reordered copy)
+WORKSPACE_COPIES = 2
+
+
+def estimate_memory(num_qubits: int, dtype=np.complex128) -> Dict[str, int]:
+    """Estimate the bytes needed to simulate num_qubits with the given statevector dtype."""
+    dtype = np.dtype(dtype)
+    if dtype.type not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported statevector dtype {dtype}. Use complex64 or complex128.")
+    state_bytes = (2 ** num_qubits) * dtype.itemsize
+    return {'state_bytes': state_bytes, 'peak_bytes': state_bytes * (1 + WORKSPACE_COPIES)}
+
 
 class QuantumSimulator:
-    def __init__(self, num_qubits: int):
+    def __init__(self, num_qubits: int, dtype=np.complex128, memory_budget: Optional[int] = None,
+                 allow_downgrade: bool = True, num_threads: int = 1):
+        """Allocate a flat 2^n statevector, checking `memory_budget` (bytes) before allocating.
+
+        If double precision does not fit the budget and `allow_downgrade` is set,
+        the simulator falls back to complex64; otherwise a MemoryError is raised.
+        With num_threads > 1, gates on states of MIN_PARALLEL_QUBITS or more are
+        split into independent chunks processed on a thread pool. The pool is
+        shut down by close(), on leaving a `with` block, or when the simulator
+        is garbage collected.
+        """
         self.num_qubits = num_qubits
-        self.state = np.zeros((2 ** num_qubits, 1), dtype=complex)
+        dtype = np.dtype(dtype)
+        needed = estimate_memory(num_qubits, dtype)['peak_bytes']
+        if memory_budget is not None and needed > memory_budget:
+            single = estimate_memory(num_qubits, np.complex64)['peak_bytes']
+            if dtype == np.complex128 and allow_downgrade and single <= memory_budget:
+                logger.warning(f"{num_qubits} qubits need {needed} bytes in complex128; "
+                               f"downgrading to complex64 ({single} bytes) to fit the budget")
+                dtype = np.dtype(np.complex64)
+            else:
+                raise MemoryError(f"{num_qubits} qubits need {needed} bytes, "
+                                  f"over the memory budget of {memory_budget} bytes.")
+        self.dtype = dtype
+        self.state = np.zeros(2 ** num_qubits, dtype=dtype)
         self.state[0] = 1  # Initialize to |0...0>
+        self.num_threads = num_threads
+        self._executor = None
+        self._finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _apply(self, gate: np.ndarray, target_qubits: List[int]):
+        """Dispatch a validated gate to the serial or the thread-pool kernel."""
+        if self.num_threads > 1 and self.num_qubits >= MIN_PARALLEL_QUBITS:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+                # Holds only the executor, so an unreferenced simulator can still be collected
+                self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+            # A few chunks per thread keeps the pool busy when chunks finish unevenly
+            self.state = apply_gate_parallel(self.state, gate, target_qubits, self.num_qubits,
+                                             self._executor, 4 * self.num_threads)
+        else:
+            self.state = apply_gate_tensor(self.state, gate, target_qubits, self.num_qubits)
+
+    def close(self):
+        """Shut down the worker threads, if any."""
+        if self._executor is not None:
+            self._finalizer.detach()
+            self._executor.shutdown()
+            self._executor = None
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the statevector."""
+        return self.state.nbytes
 
     def apply_gate(self, gate: np.ndarray, target_qubits: List[int]):
         """Apply a quantum gate to the specified target qubits."""
-        if not self.is_valid_gate(gate):
+        if not self.is_valid_gate(gate, len(target_qubits)):
             raise ValueError("Invalid gate matrix.")
-        
-        # Create the full gate matrix for the specified qubits
-        full_gate = np.eye(2 ** self.num_qubits, dtype=complex)
-        for qubit in target_qubits:
-            full_gate = self.tensor_product(full_gate, self.expand_gate(gate, qubit))
-        
-        # Apply the gate to the current state
-        self.state = np.dot(full_gate, self.state)
-
-    def measure(self) -> Tuple[int, float]:
+        validate_targets(target_qubits, self.num_qubits)
+
+        # Contract the gate with the target axes instead of building a 2^n x 2^n matrix
+        self._apply(gate, target_qubits)
+
+    def run(self, circuit: SimulatorCircuit, compiler: Optional[CircuitCompiler] = None) -> Dict[str, int]:
+        """Compile a circuit with gate fusion and apply it; return the fusion report."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        program = (compiler or default_compiler).compile(circuit)
+        for matrix, qubits in program.operations:
+            self._apply(matrix, list(qubits))
+        return program.report
+
+    def probabilities(self) -> np.ndarray:
+        """Return the probability of every basis state."""
+        return np.abs(self.state) ** 2
+
+    def expectation(self, observable: Observable) -> float:
+        """Exact <psi|H|psi> for a DiagonalObservable, PauliSum, diagonal array or dense matrix."""
+        return expectation_value(observable, self.state)
+
+    def measure(self, seed: Seed = None) -> Tuple[int, float]:
         """Measure the state of the qubits and return the result."""
-        probabilities = np.abs(self.state.flatten()) ** 2
-        outcome = np.random.choice(range(2 ** self.num_qubits), p=probabilities)
-        self.state = np.zeros((2 ** self.num_qubits, 1), dtype=complex)
+        probabilities = self.probabilities()
+        outcome = int(sample_indices(probabilities, 1, seed)[0])
+        self.state = np.zeros(2 ** self.num_qubits, dtype=self.dtype)
         self.state[outcome] = 1  # Collapse to the measured state
         return outcome, probabilities[outcome]
 
-    def is_valid_gate(self, gate: np.ndarray) -> bool:
-        """Check if the gate is a valid quantum gate."""
-        return gate.shape == (2, 2) and np.isclose(np.linalg.norm(gate @ gate.conj().T, ord=1), 1)
-
-    def expand_gate(self, gate: np.ndarray, target_qubit: int) -> np.ndarray:
-        """Expand a single qubit gate to act on the full state."""
-        identity = np.eye(2, dtype=complex)
-        full_gate = identity
-        for qubit in range(self.num_qubits):
-            if qubit == target_qubit:
-                full_gate = np.kron(full_gate, gate)
-            else:
-                full_gate = np.kron(full_gate, identity)
-        return full_gate
+    def measure_qubits(self, qubits: List[int], seed: Seed = None) -> int:
+        """Measure a subset of qubits, collapsing only that subset; qubits[j] is bit j of the result."""
+        validate_targets(qubits, self.num_qubits)
+        marginal = marginal_probabilities(self.probabilities(), qubits, self.num_qubits)
+        outcome = int(sample_indices(marginal, 1, seed)[0])
+
+        # Zero the amplitudes inconsistent with the outcome and renormalize the rest
+        indices = np.arange(2 ** self.num_qubits)
+        keep = np.ones(2 ** self.num_qubits, dtype=bool)
+        for bit, qubit in enumerate(qubits):
+            keep &= ((indices >> qubit) & 1) == ((outcome >> bit) & 1)
+        self.state[~keep] = 0
+        self.state /= np.sqrt(marginal[outcome])
+        return outcome
+
+    def sample(self, shots: int, qubits: Optional[List[int]] = None, seed: Seed = None,
+               packed: bool = False) -> Union[Dict[str, int], np.ndarray]:
+        """Draw many measurement shots without collapsing the state.
+
+        Probabilities are computed once and all shots are drawn in a single
+        searchsorted call. Pass `qubits` to sample only that subset (marginal
+        distribution). Returns a counts dict of bitstrings, or with packed=True
+        a (shots, ceil(m / 8)) uint8 array with one bitstring per row.
+        """
+        probabilities = self.probabilities()
+        if qubits is not None:
+            validate_targets(qubits, self.num_qubits)
+            probabilities = marginal_probabilities(probabilities, qubits, self.num_qubits)
+        num_bits = self.num_qubits if qubits is None else len(qubits)
+        indices = sample_indices(probabilities, shots, seed)
+        if packed:
+            return pack_indices(indices, num_bits)
+        return counts_from_indices(indices, num_bits)
 
-    def tensor_product(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
-        """Compute the tensor product of two matrices."""
-        return np.kron(a, b)
+    def is_valid_gate(self, gate: np.ndarray, num_targets: int = 1) -> bool:
+        """Check if the gate is a valid unitary acting on num_targets qubits."""
+        dim = 2 ** num_targets
+        return gate.shape == (dim, dim) and np.allclose(gate @ gate.conj().T, np.eye(dim))
 
-    def hadamard(self):
-        """Apply Hadamard gate to the first qubit."""
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit (the first qubit by default)."""
         H = (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
-        self.apply_gate(H, [0])
+        self.apply_gate(H, [qubit])
 
-    def pauli_x(self):
-        """Apply Pauli-X gate to the first qubit."""
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit (the first qubit by default)."""
         X = np.array([[0, 1], [1, 0]], dtype=complex)
-        self.apply_gate(X, [0])
+        self.apply_gate(X, [qubit])
 
     def cnot(self, control: int, target: int):
         """Apply CNOT gate with specified control and target qubits."""
@@ -68,7 +185,7 @@ class QuantumSimulator:
 
     def visualize_state(self):
         """Visualize the quantum state as a bar chart."""
-        probabilities = np.abs(self.state.flatten()) ** 2
+        probabilities = self.probabilities()
         plt.bar(range(2 ** self.num_qubits), probabilities)
         plt.xlabel('State')
         plt.ylabel('Probability')
@@ -81,7 +198,6 @@ if __name__ == "__main__":
     simulator = QuantumSimulator(num_qubits=2)
     simulator.hadamard()  # Apply Hadamard to the first qubit
     simulator.cnot(0, 1)  # Apply CNOT with qubit 0 as control and qubit 1 as target
-    outcome ```python
     outcome, probability = simulator.measure()  # Measure the state
     print(f"Measured outcome: {outcome}, Probability: {probability}")
     simulator.visualize_state()  # Visualize the state probabilities
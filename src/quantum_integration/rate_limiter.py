@@ -0,0 +1,120 @@
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class _Bucket:
+    __slots__ = ('tokens', 'updated', 'allowed', 'rejected')
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.allowed = 0
+        self.rejected = 0
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: 'OrderedDict[str, _Bucket]' = OrderedDict()  # least recently seen first
+        self.evicted = 0
+
+
+class TokenBucketLimiter:
+    """Per-client token buckets refilled at `rate` tokens per second up to `capacity`.
+
+    Clients are spread over `num_shards` independently locked tables, so a
+    check costs one hash, one lock and O(1) dictionary work. A bucket left
+    idle for `idle_ttl` seconds is dropped; the default is the time it takes
+    to refill completely, after which a fresh bucket behaves identically.
+    Each shard also holds at most max_clients / num_shards buckets, evicting
+    the least recently seen. Usage counters live on the buckets, so they
+    cover clients seen within the idle window.
+    """
+
+    def __init__(self, rate: float, capacity: float, num_shards: int = 16, max_clients: int = 100_000,
+                 idle_ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self.idle_ttl = capacity / rate if idle_ttl is None else idle_ttl
+        self.max_per_shard = max(1, max_clients // num_shards)
+        self.clock = clock
+        self._shards = [_Shard() for _ in range(num_shards)]
+
+    @classmethod
+    def per_hour(cls, limit: int, burst: Optional[float] = None, **options) -> 'TokenBucketLimiter':
+        """Limiter allowing `limit` requests per hour on average, in bursts of up to `burst`.
+
+        The burst defaults to a minute's share of the hourly limit (at least
+        one request), so no client can spend its whole quota at once.
+        """
+        burst = max(1.0, limit / 60.0) if burst is None else burst
+        return cls(rate=limit / 3600.0, capacity=burst, **options)
+
+    def _shard(self, client: str) -> _Shard:
+        # crc32 rather than hash(): stable across processes, so shard assignment is reproducible
+        return self._shards[zlib.crc32(client.encode()) % len(self._shards)]
+
+    def _evict(self, shard: _Shard, now: float):
+        buckets = shard.buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if now - oldest.updated <= self.idle_ttl and len(buckets) <= self.max_per_shard:
+                break
+            buckets.popitem(last=False)
+            shard.evicted += 1
+
+    def acquire(self, client: str, cost: float = 1.0) -> Tuple[bool, float, float]:
+        """Take `cost` tokens for a client; returns (allowed, tokens_remaining, retry_after_seconds)."""
+        shard = self._shard(client)
+        now = self.clock()
+        with shard.lock:
+            bucket = shard.buckets.get(client)
+            if bucket is None:
+                bucket = shard.buckets[client] = _Bucket(self.capacity, now)
+            else:
+                bucket.tokens = min(self.capacity, bucket.tokens + (now - bucket.updated) * self.rate)
+                bucket.updated = now
+                shard.buckets.move_to_end(client)
+            if bucket.tokens >= cost:
+                bucket.tokens -= cost
+                bucket.allowed += 1
+                allowed, retry_after = True, 0.0
+            else:
+                bucket.rejected += 1
+                allowed, retry_after = False, (cost - bucket.tokens) / self.rate
+            remaining = bucket.tokens
+            self._evict(shard, now)
+        return allowed, remaining, retry_after
+
+    def usage(self, client: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """Usage counters: one client's, or totals plus the `limit` busiest live clients."""
+        if client is not None:
+            shard = self._shard(client)
+            with shard.lock:
+                bucket = shard.buckets.get(client)
+                if bucket is None:
+                    return {'client': client, 'allowed': 0, 'rejected': 0, 'tokens': self.capacity}
+                tokens = min(self.capacity, bucket.tokens + (self.clock() - bucket.updated) * self.rate)
+                return {'client': client, 'allowed': bucket.allowed, 'rejected': bucket.rejected,
+                        'tokens': tokens}
+
+        clients: List[Dict[str, Any]] = []
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                evicted += shard.evicted
+                clients.extend({'client': name, 'allowed': bucket.allowed, 'rejected': bucket.rejected}
+                               for name, bucket in shard.buckets.items())
+        clients.sort(key=lambda entry: entry['allowed'] + entry['rejected'], reverse=True)
+        return {
+            'clients_tracked': len(clients),
+            'clients_evicted': evicted,
+            'allowed': sum(entry['allowed'] for entry in clients),
+            'rejected': sum(entry['rejected'] for entry in clients),
+            'top_clients': clients[:limit],
+        }
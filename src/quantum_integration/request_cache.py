@@ -0,0 +1,98 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+# Values of the X-Cache response header
+CACHE_STATUSES = ('HIT', 'MISS', 'COALESCED', 'BYPASS')
+
+
+class RequestCache:
+    """TTL cache of API results keyed on normalized request bodies, with request coalescing.
+
+    The first request for a key computes the result; identical requests that
+    arrive while it is in flight wait for that same computation instead of
+    starting their own. Successful results are kept for `ttl` seconds (at
+    most `max_entries`, least recently used dropped first); failures are
+    passed to every waiter and never cached. Cached values are shared
+    between callers and must not be mutated.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(endpoint: str, body: Dict[str, Any]) -> str:
+        """Hash of the endpoint and its normalized body (key order and whitespace do not matter)."""
+        canonical = json.dumps(body, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(f"{endpoint}|{canonical}".encode()).hexdigest()
+
+    @staticmethod
+    def seed_for(key: str) -> int:
+        """Sampling seed derived from a key, so a cached result is exactly what re-running would give."""
+        return int(key[:8], 16)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Tuple[Any, str]:
+        """Return (value, status) where status is 'HIT', 'MISS' or 'COALESCED'."""
+        with self._lock:
+            now = self.clock()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], 'HIT'
+            if entry is not None:
+                del self._entries[key]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result(), 'COALESCED'
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = (self.clock() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(value)
+        return value, 'MISS'
+
+    def stats(self) -> Dict[str, float]:
+        """Hit, miss and coalesced counters plus the number of live entries."""
+        with self._lock:
+            requests = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'hit_rate': (self.hits + self.coalesced) / requests if requests else 0.0,
+                'entries': len(self._entries),
+            }
+
+    def clear(self):
+        """Drop every cached result and reset the counters (in-flight computations finish normally)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = 0
@@ -0,0 +1,117 @@
+import gzip
+import struct
+import numpy as np
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd is only offered to clients when installed
+    zstandard = None
+
+JSON_MEDIA_TYPE = 'application/json'
+BINARY_MEDIA_TYPE = 'application/vnd.quantum-result'
+
+# Binary layout: a fixed header, then little-endian arrays.
+#   counts:        indices (uint32, or uint64 above 32 qubits) then counts (uint32), sorted by index
+#   statevector:   complex64 amplitudes in basis-index order
+#   probabilities: float32 probabilities in basis-index order
+MAGIC = b'QRES'
+VERSION = 1
+KIND_COUNTS, KIND_STATEVECTOR, KIND_PROBABILITIES = 0, 1, 2
+HEADER = struct.Struct('<4sBBHQ')  # magic, version, kind, num_qubits, number of entries
+
+# Content-Encoding preference when a client accepts several
+CODEC_PREFERENCE = ('zstd', 'gzip')
+# Bodies smaller than this are sent uncompressed; the codec framing would outweigh the saving
+MIN_COMPRESS_BYTES = 1024
+
+
+def _index_dtype(num_qubits: int) -> str:
+    return '<u4' if num_qubits <= 32 else '<u8'
+
+
+def encode_counts(counts: Dict[str, int], num_qubits: Optional[int] = None) -> bytes:
+    """Pack a counts dict (Qiskit bitstrings, register spaces allowed) as index/count arrays."""
+    bitstrings = [key.replace(' ', '') for key in counts]
+    if num_qubits is None:
+        num_qubits = max((len(bits) for bits in bitstrings), default=0)
+    if num_qubits > 64:
+        raise ValueError("The binary format holds outcomes of at most 64 qubits.")
+    joined = ''.join(bitstrings).encode()
+    if bitstrings and len(joined) == len(bitstrings) * num_qubits:
+        # Equal-width keys: parse every bitstring at once as a matrix of '0'/'1' bytes
+        bits = (np.frombuffer(joined, dtype=np.uint8).reshape(-1, num_qubits) - ord('0')).astype(np.uint64)
+        indices = bits @ (np.uint64(1) << np.arange(num_qubits - 1, -1, -1, dtype=np.uint64))
+    else:
+        indices = np.fromiter((int(bits, 2) for bits in bitstrings), dtype=np.uint64, count=len(bitstrings))
+    values = np.fromiter(counts.values(), dtype=np.uint64, count=len(bitstrings))
+    if values.size and values.max() > np.iinfo(np.uint32).max:
+        raise ValueError("Counts above 2**32 - 1 per outcome do not fit the binary format.")
+    order = np.argsort(indices, kind='stable')
+    return b''.join((HEADER.pack(MAGIC, VERSION, KIND_COUNTS, num_qubits, len(bitstrings)),
+                     indices[order].astype(_index_dtype(num_qubits)).tobytes(),
+                     values[order].astype('<u4').tobytes()))
+
+
+def encode_statevector(state: np.ndarray, probabilities: bool = False) -> bytes:
+    """Pack a statevector as complex64 amplitudes, or as float32 probabilities."""
+    state = np.asarray(state).reshape(-1)
+    num_qubits = int(state.size).bit_length() - 1
+    if probabilities:
+        payload = (state.real ** 2 + state.imag ** 2).astype('<f4')
+        kind = KIND_PROBABILITIES
+    else:
+        payload, kind = state.astype('<c8'), KIND_STATEVECTOR
+    return HEADER.pack(MAGIC, VERSION, kind, num_qubits, state.size) + payload.tobytes()
+
+
+def decode(payload: bytes) -> Union[Dict[str, int], np.ndarray]:
+    """Inverse of encode_counts / encode_statevector."""
+    magic, version, kind, num_qubits, entries = HEADER.unpack_from(payload)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a version-1 quantum result payload.")
+    body = memoryview(payload)[HEADER.size:]
+    if kind == KIND_STATEVECTOR:
+        return np.frombuffer(body, dtype='<c8', count=entries)
+    if kind == KIND_PROBABILITIES:
+        return np.frombuffer(body, dtype='<f4', count=entries)
+    if kind != KIND_COUNTS:
+        raise ValueError(f"Unknown result kind {kind}.")
+    index_dtype = np.dtype(_index_dtype(num_qubits))
+    indices = np.frombuffer(body, dtype=index_dtype, count=entries)
+    values = np.frombuffer(body, dtype='<u4', count=entries, offset=entries * index_dtype.itemsize)
+    return {format(int(index), f'0{num_qubits}b'): int(value) for index, value in zip(indices, values)}
+
+
+def available_codecs() -> Tuple[str, ...]:
+    return tuple(codec for codec in CODEC_PREFERENCE if codec != 'zstd' or zstandard is not None)
+
+
+def choose_codec(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the preferred available codec the Accept-Encoding header allows (q=0 excludes one)."""
+    accepted = set()
+    for item in (accept_encoding or '').split(','):
+        token, _, params = item.strip().partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(token.strip().lower())
+    for codec in available_codecs():
+        if codec in accepted or '*' in accepted:
+            return codec
+    return None
+
+
+def compress(body: bytes, codec: Optional[str]) -> bytes:
+    # Fast levels: responses are compressed on the request path
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    if codec == 'gzip':
+        return gzip.compress(body, compresslevel=1)
+    return body
+
+
+def decompress(body: bytes, codec: Optional[str]) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdDecompressor().decompress(body)
+    if codec == 'gzip':
+        return gzip.decompress(body)
+    return body
@@ -0,0 +1,75 @@
+import numpy as np
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Union
+
+Seed = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+
+def spawn_seeds(seed: Seed, count: int) -> List[Seed]:
+    """Independent child seeds for `count` tasks sampled under one seed; None stays None for each."""
+    if seed is None:
+        return [None] * count
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(count)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(count)
+
+
+def cumulative_distribution(probabilities: np.ndarray) -> np.ndarray:
+    """Normalized CDF for sample_from_cdf; build it once when sampling the same state repeatedly."""
+    cdf = np.cumsum(probabilities, dtype=np.float64)
+    cdf /= cdf[-1]  # absorb rounding so the last bin closes at exactly 1
+    return cdf
+
+
+def sample_from_cdf(cdf: np.ndarray, shots: int, seed: Seed = None) -> np.ndarray:
+    """Draw `shots` basis-state indices by inverting a cumulative distribution."""
+    rng = np.random.default_rng(seed)
+    indices = np.searchsorted(cdf, rng.random(shots), side='right')
+    return np.minimum(indices, len(cdf) - 1)
+
+
+def sample_indices(probabilities: np.ndarray, shots: int, seed: Seed = None) -> np.ndarray:
+    """Draw `shots` basis-state indices at once by inverting the cumulative distribution."""
+    return sample_from_cdf(cumulative_distribution(probabilities), shots, seed)
+
+
+def marginal_probabilities(probabilities: np.ndarray, qubits: Sequence[int], num_qubits: int) -> np.ndarray:
+    """Marginal distribution of a qubit subset; qubits[j] becomes bit j of the result index."""
+    tensor = probabilities.reshape((2,) * num_qubits)
+    keep = [num_qubits - 1 - qubit for qubit in qubits]
+    summed = tensor.sum(axis=tuple(axis for axis in range(num_qubits) if axis not in keep))
+    # summed keeps the surviving axes in ascending order; put qubits[-1] first (most significant)
+    order = sorted(keep)
+    marginal = summed.transpose([order.index(axis) for axis in reversed(keep)])
+    return marginal.reshape(-1)
+
+
+def counts_from_indices(indices: np.ndarray, num_bits: int) -> Dict[str, int]:
+    """Histogram sampled indices into a Qiskit-style counts dict of bitstrings."""
+    values, frequencies = np.unique(indices, return_counts=True)
+    return {format(int(value), f'0{num_bits}b'): int(count) for value, count in zip(values, frequencies)}
+
+
+def pack_indices(indices: np.ndarray, num_bits: int) -> np.ndarray:
+    """Pack sampled indices into a (shots, ceil(num_bits / 8)) uint8 array, one bitstring per row."""
+    shifts = np.arange(num_bits - 1, -1, -1, dtype=np.int64)
+    bits = (np.asarray(indices, dtype=np.int64)[:, None] >> shifts) & 1
+    return np.packbits(bits.astype(np.uint8), axis=1)
+
+
+def counts_from_bits(bits: np.ndarray) -> Dict[str, int]:
+    """Histogram a (shots, m) bit array (first column = leftmost bit) into a counts dict.
+
+    Rows are packed to bytes and tallied by their raw bytes, which avoids both
+    integer indices (unbounded for wide registers) and a row-wise sort.
+    """
+    num_bits = bits.shape[1]
+    packed = np.packbits(bits, axis=1)
+    tally = Counter(row.tobytes() for row in packed)
+    counts = {}
+    for key, count in tally.items():
+        row = np.unpackbits(np.frombuffer(key, dtype=np.uint8))[:num_bits]
+        counts[''.join('1' if bit else '0' for bit in row)] = count
+    return counts
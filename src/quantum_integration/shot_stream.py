@@ -0,0 +1,40 @@
+import numpy as np
+from typing import Any, Dict, Iterator, Optional
+from src.quantum_integration.sampling import Seed, cumulative_distribution, sample_from_cdf
+
+
+def stream_counts(probabilities: np.ndarray, shots: int, chunk_shots: int = 100_000, seed: Seed = None,
+                  tolerance: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Sample `shots` shots in chunks, yielding one progress record per chunk.
+
+    Each record holds that chunk's counts (clients add them up), the shots
+    drawn so far, `max_stderr` (the largest standard error among the
+    observed outcome frequencies) and `finished` on the last record. With a `tolerance`, sampling stops as soon
+    as max_stderr drops to it. Closing the generator early (e.g. a client
+    disconnecting) stops sampling too.
+    """
+    cdf = cumulative_distribution(probabilities)
+    num_qubits = int(cdf.size).bit_length() - 1
+    rng = np.random.default_rng(seed)
+    seen = np.empty(0, dtype=np.int64)  # outcomes observed so far, sorted
+    totals = np.empty(0)  # and their cumulative counts (float, as bincount weights)
+    done = 0
+    while done < shots:
+        values, frequencies = np.unique(sample_from_cdf(cdf, min(chunk_shots, shots - done), rng),
+                                        return_counts=True)
+        done += int(frequencies.sum())
+        seen, inverse = np.unique(np.concatenate([seen, values]), return_inverse=True)
+        totals = np.bincount(inverse, weights=np.concatenate([totals, frequencies]), minlength=seen.size)
+        observed = totals / done
+        max_stderr = float(np.sqrt(np.max(observed * (1 - observed)) / done))
+        converged = tolerance is not None and max_stderr <= tolerance
+        chunk_counts = {format(int(value), f'0{num_qubits}b'): int(count) for value, count in zip(values, frequencies)}
+        yield {
+            'counts': chunk_counts,
+            'shots_done': done,
+            'max_stderr': max_stderr,
+            'converged': converged,
+            'finished': converged or done >= shots,
+        }
+        if converged:
+            return
@@ -0,0 +1,225 @@
+import hashlib
+import numpy as np
+from typing import List, Optional, Sequence, Union
+from src.quantum_integration.tensor_engine import validate_targets
+
+# Standard gate matrices; for multi-qubit gates the first qubit is the most significant bit
+GATE_MATRICES = {
+    'h': (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex),
+    'x': np.array([[0, 1], [1, 0]], dtype=complex),
+    'y': np.array([[0, -1j], [1j, 0]], dtype=complex),
+    'z': np.array([[1, 0], [0, -1]], dtype=complex),
+    's': np.array([[1, 0], [0, 1j]], dtype=complex),
+    'sdg': np.array([[1, 0], [0, -1j]], dtype=complex),
+    't': np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+    'cx': np.array([[1, 0, 0, 0],
+                    [0, 1, 0, 0],
+                    [0, 0, 0, 1],
+                    [0, 0, 1, 0]], dtype=complex),
+    'cz': np.diag([1, 1, 1, -1]).astype(complex),
+    'swap': np.array([[1, 0, 0, 0],
+                      [0, 0, 1, 0],
+                      [0, 1, 0, 0],
+                      [0, 0, 0, 1]], dtype=complex),
+}
+
+# Gates that map Pauli operators to Pauli operators and can run on the stabilizer backend
+CLIFFORD_GATES = {'h', 'x', 'y', 'z', 's', 'sdg', 'cx', 'cz', 'swap'}
+
+# Qiskit operations that carry no unitary action for the simulators
+NON_UNITARY_OPERATIONS = {'measure', 'barrier', 'id', 'delay'}
+
+
+def rx_matrix(theta: float) -> np.ndarray:
+    """Rotation around the X-axis."""
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+
+
+def ry_matrix(theta: float) -> np.ndarray:
+    """Rotation around the Y-axis."""
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=complex)
+
+
+def rz_matrix(theta: float) -> np.ndarray:
+    """Rotation around the Z-axis."""
+    return np.diag([np.exp(-0.5j * theta), np.exp(0.5j * theta)])
+
+
+# Rotation gates R(theta) = exp(-i theta P / 2) and their Pauli generators P
+ROTATION_MATRICES = {'rx': rx_matrix, 'ry': ry_matrix, 'rz': rz_matrix}
+ROTATION_GENERATORS = {'rx': GATE_MATRICES['x'], 'ry': GATE_MATRICES['y'], 'rz': GATE_MATRICES['z']}
+
+
+class Parameter:
+    """Reference to entry `index` of a parameter vector; the gate angle is scale * values[index]."""
+
+    def __init__(self, index: int, scale: float = 1.0):
+        self.index = index
+        self.scale = scale
+
+    def __mul__(self, factor: float) -> 'Parameter':
+        return Parameter(self.index, self.scale * factor)
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return f"Parameter({self.index}, scale={self.scale})"
+
+
+class Instruction:
+    def __init__(self, name: str, qubits: Sequence[int], matrix: np.ndarray, params: Sequence[float] = (),
+                 parameter: Optional[Parameter] = None):
+        self.name = name
+        self.qubits = tuple(qubits)
+        self.matrix = matrix
+        self.params = tuple(params)
+        self.parameter = parameter
+
+    def __repr__(self):
+        if self.parameter is not None:
+            return f"Instruction({self.name!r}, qubits={self.qubits}, parameter={self.parameter})"
+        return f"Instruction({self.name!r}, qubits={self.qubits}, params={self.params})"
+
+
+class SimulatorCircuit:
+    """Gate-level circuit description consumed by the NumPy simulators."""
+
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+        self.instructions: List[Instruction] = []
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def append(self, name: str, matrix: np.ndarray, qubits: Sequence[int], params: Sequence[float] = (),
+               parameter: Optional[Parameter] = None):
+        """Append a gate given by its unitary matrix."""
+        validate_targets(qubits, self.num_qubits)
+        matrix = np.asarray(matrix, dtype=complex)
+        dim = 2 ** len(qubits)
+        if matrix.shape != (dim, dim):
+            raise ValueError(f"Gate '{name}' expects a {dim}x{dim} matrix for {len(qubits)} qubit(s).")
+        self.instructions.append(Instruction(name, qubits, matrix, params, parameter))
+        return self
+
+    def _rotation(self, name: str, theta: Union[float, Parameter], qubit: int):
+        if isinstance(theta, Parameter):
+            # Placeholder matrix until bind() supplies the angle
+            return self.append(name, np.eye(2), [qubit], parameter=theta)
+        return self.append(name, ROTATION_MATRICES[name](theta), [qubit], [theta])
+
+    def h(self, qubit: int):
+        """Apply a Hadamard gate."""
+        return self.append('h', GATE_MATRICES['h'], [qubit])
+
+    def x(self, qubit: int):
+        """Apply a Pauli-X gate."""
+        return self.append('x', GATE_MATRICES['x'], [qubit])
+
+    def y(self, qubit: int):
+        """Apply a Pauli-Y gate."""
+        return self.append('y', GATE_MATRICES['y'], [qubit])
+
+    def z(self, qubit: int):
+        """Apply a Pauli-Z gate."""
+        return self.append('z', GATE_MATRICES['z'], [qubit])
+
+    def s(self, qubit: int):
+        """Apply an S (phase) gate."""
+        return self.append('s', GATE_MATRICES['s'], [qubit])
+
+    def sdg(self, qubit: int):
+        """Apply an S-dagger gate."""
+        return self.append('sdg', GATE_MATRICES['sdg'], [qubit])
+
+    def t(self, qubit: int):
+        """Apply a T gate."""
+        return self.append('t', GATE_MATRICES['t'], [qubit])
+
+    def rx(self, theta: Union[float, Parameter], qubit: int):
+        """Apply a rotation around the X-axis; theta may be a Parameter reference."""
+        return self._rotation('rx', theta, qubit)
+
+    def ry(self, theta: Union[float, Parameter], qubit: int):
+        """Apply a rotation around the Y-axis; theta may be a Parameter reference."""
+        return self._rotation('ry', theta, qubit)
+
+    def rz(self, theta: Union[float, Parameter], qubit: int):
+        """Apply a rotation around the Z-axis; theta may be a Parameter reference."""
+        return self._rotation('rz', theta, qubit)
+
+    def cx(self, control: int, target: int):
+        """Apply a CNOT gate."""
+        return self.append('cx', GATE_MATRICES['cx'], [control, target])
+
+    def cnot(self, control: int, target: int):
+        """Alias for cx."""
+        return self.cx(control, target)
+
+    def cz(self, qubit1: int, qubit2: int):
+        """Apply a controlled-Z gate."""
+        return self.append('cz', GATE_MATRICES['cz'], [qubit1, qubit2])
+
+    def swap(self, qubit1: int, qubit2: int):
+        """Swap two qubits."""
+        return self.append('swap', GATE_MATRICES['swap'], [qubit1, qubit2])
+
+    def unitary(self, matrix: np.ndarray, qubits: Sequence[int], name: str = 'unitary'):
+        """Apply an arbitrary unitary to the given qubits."""
+        return self.append(name, matrix, qubits)
+
+    def is_clifford(self) -> bool:
+        """Return True if every gate is a Clifford gate."""
+        return all(instruction.name in CLIFFORD_GATES for instruction in self.instructions)
+
+    @property
+    def num_parameters(self) -> int:
+        """Length of the parameter vector referenced by the circuit."""
+        indices = [instruction.parameter.index for instruction in self.instructions
+                   if instruction.parameter is not None]
+        return max(indices) + 1 if indices else 0
+
+    def bind(self, values: Sequence[float]) -> 'SimulatorCircuit':
+        """Return a copy with every Parameter replaced by its angle from `values`."""
+        values = np.asarray(values, dtype=float)
+        if len(values) < self.num_parameters:
+            raise ValueError(f"Expected {self.num_parameters} parameter values, got {len(values)}.")
+        bound = SimulatorCircuit(self.num_qubits)
+        for instruction in self.instructions:
+            parameter = instruction.parameter
+            if parameter is None:
+                bound.instructions.append(instruction)
+            else:
+                theta = parameter.scale * values[parameter.index]
+                bound.append(instruction.name, ROTATION_MATRICES[instruction.name](theta), instruction.qubits, [theta])
+        return bound
+
+    @classmethod
+    def from_qiskit(cls, circuit) -> 'SimulatorCircuit':
+        """Convert a Qiskit QuantumCircuit; measurements and barriers are dropped."""
+        converted = cls(circuit.num_qubits)
+        rotations = {'rx': converted.rx, 'ry': converted.ry, 'rz': converted.rz}
+        for operation, qargs, _ in circuit.data:
+            name = operation.name
+            qubits = [circuit.find_bit(qubit).index for qubit in qargs]
+            if name in NON_UNITARY_OPERATIONS:
+                continue
+            if name in GATE_MATRICES:
+                converted.append(name, GATE_MATRICES[name], qubits)
+            elif name in rotations:
+                rotations[name](float(operation.params[0]), qubits[0])
+            else:
+                # Qiskit matrices put the first qubit in the least significant bit
+                converted.unitary(operation.to_matrix(), list(reversed(qubits)), name)
+        return converted
+
+    def fingerprint(self) -> str:
+        """Structural hash of the circuit: gate names, qubits, parameters and matrices."""
+        digest = hashlib.sha256(f"qubits={self.num_qubits}".encode())
+        for instruction in self.instructions:
+            digest.update(f"|{instruction.name}{instruction.qubits}{instruction.params}".encode())
+            digest.update(repr(instruction.parameter).encode())
+            digest.update(np.ascontiguousarray(instruction.matrix, dtype=complex).tobytes())
+        return digest.hexdigest()
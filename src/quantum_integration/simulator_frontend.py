@@ -0,0 +1,103 @@
+import logging
+from typing import Callable, Dict, List, Optional
+from src.quantum_integration.quantum_simulator import QuantumSimulator
+from src.quantum_integration.sampling import Seed, spawn_seeds
+from src.quantum_integration.simulator_circuit import CLIFFORD_GATES, SimulatorCircuit
+from src.quantum_integration.stabilizer_simulator import StabilizerSimulator
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('stabilizer', 'statevector')
+
+# Qiskit operations a circuit may contain and still be sampled on the stabilizer backend
+STABILIZER_OPERATIONS = CLIFFORD_GATES | {'measure', 'barrier', 'id'}
+
+
+def as_simulator_circuit(circuit) -> SimulatorCircuit:
+    """Accept either a SimulatorCircuit or a Qiskit QuantumCircuit."""
+    if isinstance(circuit, SimulatorCircuit):
+        return circuit
+    return SimulatorCircuit.from_qiskit(circuit)
+
+
+def choose_backend(circuit: SimulatorCircuit) -> str:
+    """Route Clifford-only circuits to the stabilizer backend, everything else to the statevector."""
+    return 'stabilizer' if circuit.is_clifford() else 'statevector'
+
+
+def sample_counts(circuit, shots: int = 1024, seed: Seed = None, backend: Optional[str] = None) -> Dict[str, int]:
+    """Simulate a circuit and return measurement counts from the cheapest suitable backend."""
+    circuit = as_simulator_circuit(circuit)
+    backend = backend or choose_backend(circuit)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+    logger.debug(f"Running {len(circuit)} gates on {circuit.num_qubits} qubits with the {backend} backend")
+
+    if backend == 'stabilizer':
+        simulator = StabilizerSimulator(circuit.num_qubits)
+    else:
+        simulator = QuantumSimulator(circuit.num_qubits)
+    simulator.run(circuit)
+    return simulator.sample(shots, seed=seed)
+
+def measured_qubits(circuit) -> Optional[List[int]]:
+    """Qubit measured into each clbit of a Qiskit circuit, when the stabilizer backend can reproduce its counts.
+
+    Qualifying circuits use only Clifford gates, have one classical register
+    with every clbit written once by a terminal, unconditional measurement,
+    and measure each qubit at most once. Anything else gives None.
+    """
+    if len(circuit.cregs) != 1 or circuit.num_clbits == 0:
+        return None
+    sources = {}
+    for operation, qargs, cargs in circuit.data:
+        qubits = [circuit.find_bit(qubit).index for qubit in qargs]
+        if operation.name not in STABILIZER_OPERATIONS or getattr(operation, 'condition', None) is not None:
+            return None
+        if operation.name == 'measure':
+            clbit = circuit.find_bit(cargs[0]).index
+            if clbit in sources or qubits[0] in sources.values():
+                return None
+            sources[clbit] = qubits[0]
+        elif operation.name != 'barrier' and set(qubits) & set(sources.values()):
+            return None  # a gate after a measurement
+    if len(sources) != circuit.num_clbits:
+        return None
+    return [sources[clbit] for clbit in range(circuit.num_clbits)]
+
+
+def clifford_counts(circuit, shots: int = 1024, seed: Seed = None) -> Optional[Dict[str, int]]:
+    """Counts for a measured Qiskit circuit from the stabilizer backend, or None if it does not qualify."""
+    qubits = measured_qubits(circuit)
+    if qubits is None:
+        return None
+    simulator = StabilizerSimulator(circuit.num_qubits)
+    simulator.run(SimulatorCircuit.from_qiskit(circuit))
+    return simulator.sample(shots, qubits=qubits, seed=seed)
+
+
+def route_counts(circuits: List, shots: int, fallback: Callable[[List], List[Dict[str, int]]],
+                 seed: Seed = None) -> List[Dict[str, int]]:
+    """Counts per measured Qiskit circuit, in order.
+
+    Clifford circuits run on the stabilizer backend, each with its own child
+    of `seed`; the rest go to `fallback(circuits)` (e.g. a BatchExecutor) in
+    a single call.
+    """
+    seeds = spawn_seeds(seed, len(circuits))
+    counts = [clifford_counts(circuit, shots, child) for circuit, child in zip(circuits, seeds)]
+    remaining = [index for index, result in enumerate(counts) if result is None]
+    if remaining:
+        for index, result in zip(remaining, fallback([circuits[index] for index in remaining])):
+            counts[index] = result
+    logger.debug(f"Routed {len(circuits) - len(remaining)} of {len(circuits)} circuits to the stabilizer backend")
+    return counts
+
+# Example usage
+if __name__ == "__main__":
+    ghz = SimulatorCircuit(500).h(0)
+    for qubit in range(499):
+        ghz.cx(qubit, qubit + 1)
+    print("Backend:", choose_backend(ghz))
+    counts = sample_counts(ghz, shots=100000, seed=1)
+    print({key[:6] + '...': value for key, value in counts.items()})
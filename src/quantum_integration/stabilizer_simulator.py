@@ -0,0 +1,258 @@
+import numpy as np
+from typing import Dict, List, Optional, Union
+from src.quantum_integration.sampling import Seed, counts_from_bits
+from src.quantum_integration.simulator_circuit import SimulatorCircuit
+from src.quantum_integration.tensor_engine import validate_targets
+
+# Number of set bits in every byte value, used to popcount packed rows
+POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+
+def multiply_rows(x_h, z_h, r_h, x_i, z_i, r_i):
+    """Return the Pauli product row_i * row_h for packed (..., nbytes) rows, tracking the sign.
+
+    This is the CHP `rowsum` vectorized over any number of rows: the phase
+    exponent is summed with bitwise masks and byte popcounts instead of a
+    per-qubit Python loop.
+    """
+    not_x_h, not_z_h = ~x_h, ~z_h
+    # Per qubit, g(x_i, z_i, x_h, z_h) is +1, -1 or 0 (Aaronson & Gottesman, 2004)
+    plus = ((x_i & z_i & z_h & not_x_h)
+            | (x_i & ~z_i & z_h & x_h)
+            | (~x_i & z_i & x_h & not_z_h))
+    minus = ((x_i & z_i & x_h & not_z_h)
+             | (x_i & ~z_i & z_h & not_x_h)
+             | (~x_i & z_i & x_h & z_h))
+    phase = (2 * r_h.astype(np.int64) + 2 * np.asarray(r_i, dtype=np.int64)
+             + POPCOUNT_TABLE[plus].sum(axis=-1) - POPCOUNT_TABLE[minus].sum(axis=-1))
+    return x_h ^ x_i, z_h ^ z_i, ((phase % 4) // 2).astype(np.uint8)
+
+
+def solve_gf2(matrix: np.ndarray, rhs: np.ndarray):
+    """Solve matrix @ b = rhs over GF(2); return a particular solution and a nullspace basis."""
+    matrix = matrix.astype(np.uint8).copy()
+    rhs = rhs.astype(np.uint8).copy()
+    rows, cols = matrix.shape
+    pivots = []
+    rank = 0
+    for col in range(cols):
+        if rank == rows:
+            break
+        candidates = np.nonzero(matrix[rank:, col])[0]
+        if len(candidates) == 0:
+            continue
+        pivot = rank + candidates[0]
+        matrix[[rank, pivot]] = matrix[[pivot, rank]]
+        rhs[[rank, pivot]] = rhs[[pivot, rank]]
+        others = np.nonzero(matrix[:, col])[0]
+        others = others[others != rank]
+        matrix[others] ^= matrix[rank]
+        rhs[others] ^= rhs[rank]
+        pivots.append(col)
+        rank += 1
+    if np.any(rhs[rank:]):
+        raise ValueError("Inconsistent stabilizer constraints.")
+
+    particular = np.zeros(cols, dtype=np.uint8)
+    particular[pivots] = rhs[:rank]
+    free = [col for col in range(cols) if col not in set(pivots)]
+    nullspace = np.zeros((len(free), cols), dtype=np.uint8)
+    for index, col in enumerate(free):
+        nullspace[index, col] = 1
+        nullspace[index, pivots] = matrix[:rank, col]
+    return particular, nullspace
+
+
+class StabilizerSimulator:
+    """CHP-style stabilizer tableau simulator for Clifford circuits (H, S, X, Y, Z, CNOT, CZ, SWAP).
+
+    Rows 0..n-1 are destabilizers and rows n..2n-1 stabilizers; the X and Z
+    parts are bit-packed along the qubit axis (8 qubits per byte), so gates cost
+    O(n) and measurements O(n^2 / 8) instead of the O(2^n) of a statevector.
+    Qubit ordering matches QuantumSimulator.
+    """
+
+    def __init__(self, num_qubits: int, seed: Seed = None):
+        self.num_qubits = num_qubits
+        self.rng = np.random.default_rng(seed)
+        num_bytes = (num_qubits + 7) // 8
+        self.x = np.zeros((2 * num_qubits, num_bytes), dtype=np.uint8)
+        self.z = np.zeros((2 * num_qubits, num_bytes), dtype=np.uint8)
+        self.r = np.zeros(2 * num_qubits, dtype=np.uint8)
+        for qubit in range(num_qubits):
+            self._set_bit(self.x, qubit, qubit)  # destabilizer X_q
+            self._set_bit(self.z, num_qubits + qubit, qubit)  # stabilizer Z_q  -> |0...0>
+
+    @staticmethod
+    def _set_bit(table: np.ndarray, row: int, qubit: int):
+        table[row, qubit >> 3] |= np.uint8(1 << (qubit & 7))
+
+    @staticmethod
+    def _column(table: np.ndarray, qubit: int) -> np.ndarray:
+        return (table[:, qubit >> 3] >> (qubit & 7)) & 1
+
+    @staticmethod
+    def _flip_column(table: np.ndarray, qubit: int, mask: np.ndarray):
+        table[:, qubit >> 3] ^= (mask << (qubit & 7)).astype(np.uint8)
+
+    def hadamard(self, qubit: int = 0):
+        """Apply Hadamard gate to a qubit."""
+        x, z = self._column(self.x, qubit), self._column(self.z, qubit)
+        self.r ^= x & z
+        self._flip_column(self.x, qubit, x ^ z)
+        self._flip_column(self.z, qubit, x ^ z)
+
+    def phase(self, qubit: int):
+        """Apply the S (phase) gate to a qubit."""
+        x, z = self._column(self.x, qubit), self._column(self.z, qubit)
+        self.r ^= x & z
+        self._flip_column(self.z, qubit, x)
+
+    def phase_dagger(self, qubit: int):
+        """Apply the S-dagger gate to a qubit."""
+        self.pauli_z(qubit)
+        self.phase(qubit)
+
+    def pauli_x(self, qubit: int = 0):
+        """Apply Pauli-X gate to a qubit."""
+        self.r ^= self._column(self.z, qubit)
+
+    def pauli_y(self, qubit: int):
+        """Apply Pauli-Y gate to a qubit."""
+        self.r ^= self._column(self.x, qubit) ^ self._column(self.z, qubit)
+
+    def pauli_z(self, qubit: int):
+        """Apply Pauli-Z gate to a qubit."""
+        self.r ^= self._column(self.x, qubit)
+
+    def cnot(self, control: int, target: int):
+        """Apply CNOT gate with specified control and target qubits."""
+        validate_targets([control, target], self.num_qubits)
+        x_c, z_c = self._column(self.x, control), self._column(self.z, control)
+        x_t, z_t = self._column(self.x, target), self._column(self.z, target)
+        self.r ^= x_c & z_t & (x_t ^ z_c ^ 1)
+        self._flip_column(self.x, target, x_c)
+        self._flip_column(self.z, control, z_t)
+
+    def cz(self, qubit1: int, qubit2: int):
+        """Apply controlled-Z gate."""
+        self.hadamard(qubit2)
+        self.cnot(qubit1, qubit2)
+        self.hadamard(qubit2)
+
+    def swap(self, qubit1: int, qubit2: int):
+        """Swap two qubits."""
+        self.cnot(qubit1, qubit2)
+        self.cnot(qubit2, qubit1)
+        self.cnot(qubit1, qubit2)
+
+    def run(self, circuit: SimulatorCircuit):
+        """Apply a Clifford-only circuit."""
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("Circuit and simulator qubit counts differ.")
+        operations = {'h': self.hadamard, 'x': self.pauli_x, 'y': self.pauli_y, 'z': self.pauli_z,
+                      's': self.phase, 'sdg': self.phase_dagger, 'cx': self.cnot, 'cz': self.cz,
+                      'swap': self.swap}
+        for instruction in circuit.instructions:
+            if instruction.name not in operations:
+                raise ValueError(f"Gate '{instruction.name}' is not a supported Clifford gate.")
+            operations[instruction.name](*instruction.qubits)
+
+    def measure(self, qubit: int) -> int:
+        """Measure one qubit in the Z basis and collapse the tableau."""
+        validate_targets([qubit], self.num_qubits)
+        n = self.num_qubits
+        anticommuting = np.nonzero(self._column(self.x, qubit)[n:])[0]
+        if len(anticommuting) == 0:
+            # Deterministic: Z_q (up to sign) is the product of the stabilizers
+            # flagged by the destabilizers; they commute, so multiply them as a tree
+            rows = n + np.nonzero(self._column(self.x, qubit)[:n])[0]
+            x, z, r = self.x[rows], self.z[rows], self.r[rows]
+            while len(r) > 1:
+                half = len(r) // 2
+                tail = (x[2 * half:], z[2 * half:], r[2 * half:])
+                x, z, r = multiply_rows(x[:half], z[:half], r[:half],
+                                        x[half:2 * half], z[half:2 * half], r[half:2 * half])
+                x, z, r = np.concatenate([x, tail[0]]), np.concatenate([z, tail[1]]), np.concatenate([r, tail[2]])
+            return int(r[0])
+
+        pivot = n + anticommuting[0]
+        rows = np.nonzero(self._column(self.x, qubit))[0]
+        rows = rows[rows != pivot]
+        self.x[rows], self.z[rows], self.r[rows] = multiply_rows(
+            self.x[rows], self.z[rows], self.r[rows], self.x[pivot], self.z[pivot], self.r[pivot])
+        self.x[pivot - n], self.z[pivot - n], self.r[pivot - n] = self.x[pivot], self.z[pivot], self.r[pivot]
+        self.x[pivot] = 0
+        self.z[pivot] = 0
+        self._set_bit(self.z, pivot, qubit)
+        self.r[pivot] = self.rng.integers(2)
+        return int(self.r[pivot])
+
+    def _outcome_space(self):
+        """Z-basis outcomes are uniform over an affine space; return (offset, basis) over GF(2)."""
+        n = self.num_qubits
+        x, z, r = self.x[n:].copy(), self.z[n:].copy(), self.r[n:].copy()
+        rank = 0
+        for qubit in range(n):
+            column = (x[rank:, qubit >> 3] >> (qubit & 7)) & 1
+            candidates = np.nonzero(column)[0]
+            if len(candidates) == 0:
+                continue
+            pivot = rank + candidates[0]
+            for table in (x, z, r):
+                table[[rank, pivot]] = table[[pivot, rank]]
+            rows = np.nonzero((x[:, qubit >> 3] >> (qubit & 7)) & 1)[0]
+            rows = rows[rows != rank]
+            x[rows], z[rows], r[rows] = multiply_rows(x[rows], z[rows], r[rows], x[rank], z[rank], r[rank])
+            rank += 1
+
+        # The remaining rows are Z-type stabilizers: each fixes the parity of its qubits
+        constraints = np.unpackbits(z[rank:], axis=1, bitorder='little')[:, :n]
+        return solve_gf2(constraints, r[rank:])
+
+    def sample_bits(self, shots: int, seed: Seed = None, chunk_size: int = 65536) -> np.ndarray:
+        """Draw shots without collapsing the state; returns a (shots, n) bit array, column q = qubit q.
+
+        Each shot is offset + c @ basis over GF(2) with uniform random c. The
+        products run as float32 matrix multiplies (exact below 2^24 terms) in
+        chunks of `chunk_size` shots.
+        """
+        rng = np.random.default_rng(seed)
+        offset, basis = self._outcome_space()
+        basis = basis.astype(np.float32)
+        bits = np.empty((shots, self.num_qubits), dtype=np.uint8)
+        for start in range(0, shots, chunk_size):
+            stop = min(start + chunk_size, shots)
+            coefficients = rng.integers(0, 2, size=(stop - start, len(basis))).astype(np.float32)
+            bits[start:stop] = np.fmod(coefficients @ basis, 2).astype(np.uint8) ^ offset
+        return bits
+
+    def sample(self, shots: int, qubits: Optional[List[int]] = None, seed: Seed = None,
+               packed: bool = False) -> Union[Dict[str, int], np.ndarray]:
+        """Draw measurement shots; returns a counts dict or a packed (shots, ceil(m / 8)) array."""
+        bits = self.sample_bits(shots, seed)
+        if qubits is not None:
+            validate_targets(qubits, self.num_qubits)
+            bits = bits[:, qubits]
+        bits = bits[:, ::-1]  # highest qubit first, as in bitstrings
+        if packed:
+            return np.packbits(bits, axis=1)
+        return counts_from_bits(bits)
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the tableau."""
+        return self.x.nbytes + self.z.nbytes + self.r.nbytes
+
+# Example usage
+if __name__ == "__main__":
+    num_qubits = 1000
+    simulator = StabilizerSimulator(num_qubits, seed=7)
+
+    # GHZ state over 1000 qubits
+    simulator.hadamard(0)
+    for qubit in range(num_qubits - 1):
+        simulator.cnot(qubit, qubit + 1)
+
+    bits = simulator.sample_bits(20000, seed=7)
+    print("Tableau bytes:", simulator.memory_bytes())
+    print("All-equal shots:", int(np.sum(np.all(bits == bits[:, :1], axis=1))), "of", len(bits))
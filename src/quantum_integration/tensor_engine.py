@@ -0,0 +1,97 @@
+import itertools
+import numpy as np
+from concurrent.futures import Executor
+from typing import List, Sequence
+
+# Qubit ordering convention (matches Qiskit): qubit q is bit q of the basis
+# index, so qubit 0 is the least significant bit. Inside a k-qubit gate matrix
+# the first listed target is the most significant bit, which keeps textbook
+# matrices such as CNOT = |0><0|⊗I + |1><1|⊗X valid for targets [control, target].
+
+
+def qubit_axes(target_qubits: Sequence[int], num_qubits: int) -> List[int]:
+    """Map qubit indices to axes of the (2,)*num_qubits state tensor."""
+    return [num_qubits - 1 - qubit for qubit in target_qubits]
+
+
+def validate_targets(target_qubits: Sequence[int], num_qubits: int):
+    """Check that the target qubits are distinct and in range."""
+    if len(set(target_qubits)) != len(target_qubits):
+        raise ValueError("Target qubits must be distinct.")
+    for qubit in target_qubits:
+        if not 0 <= qubit < num_qubits:
+            raise ValueError(f"Qubit index {qubit} out of range for {num_qubits} qubits.")
+
+
+def _contract(psi: np.ndarray, tensor_gate: np.ndarray, axes: Sequence[int]) -> np.ndarray:
+    """Contract a (2,)*2k gate tensor with the given axes of psi, keeping the axis order."""
+    k = len(axes)
+    psi = np.tensordot(tensor_gate, psi, axes=(list(range(k, 2 * k)), list(axes)))
+    # tensordot puts the gate output axes first; move them back into place
+    return np.moveaxis(psi, list(range(k)), list(axes))
+
+
+def apply_gate_tensor(state: np.ndarray, gate: np.ndarray, target_qubits: Sequence[int],
+                      num_qubits: int) -> np.ndarray:
+    """Apply a k-qubit gate by contracting it with the target axes only.
+
+    The state may carry leading batch dimensions; its trailing 2**num_qubits
+    amplitudes are treated as a (2,)*num_qubits tensor. Cost is O(2**num_qubits
+    * 2**k) instead of the O(4**num_qubits) of a dense full-register matrix.
+    The gate is cast to the state's dtype so complex64 states stay single precision.
+    """
+    k = len(target_qubits)
+    psi = state.reshape((-1,) + (2,) * num_qubits)
+    axes = [1 + axis for axis in qubit_axes(target_qubits, num_qubits)]
+    tensor_gate = gate.astype(state.dtype, copy=False).reshape((2,) * (2 * k))
+    return _contract(psi, tensor_gate, axes).reshape(state.shape)
+
+
+def apply_gate_parallel(state: np.ndarray, gate: np.ndarray, target_qubits: Sequence[int],
+                        num_qubits: int, executor: Executor, num_chunks: int) -> np.ndarray:
+    """Apply a gate to a flat statevector by splitting it into independent chunks on a thread pool.
+
+    The state is sliced along the most significant qubits the gate does not
+    touch; every slice holds complete amplitude groups of the gate, so chunks
+    are contracted and written back concurrently without synchronization.
+    NumPy releases the GIL inside the contractions and copies.
+    """
+    k = len(target_qubits)
+    psi = state.reshape((2,) * num_qubits)
+    axes = qubit_axes(target_qubits, num_qubits)
+    free_axes = [axis for axis in range(num_qubits) if axis not in axes]
+    split_bits = min(max(int(np.ceil(np.log2(max(num_chunks, 1)))), 0), len(free_axes))
+    split_axes = free_axes[:split_bits]
+    # Target axes of each slice once the split axes have been indexed away
+    remaining = [axis for axis in range(num_qubits) if axis not in split_axes]
+    sub_axes = [remaining.index(axis) for axis in axes]
+    tensor_gate = gate.astype(state.dtype, copy=False).reshape((2,) * (2 * k))
+    out = np.empty_like(psi)
+
+    def process(bits):
+        index = [slice(None)] * num_qubits
+        for axis, bit in zip(split_axes, bits):
+            index[axis] = bit
+        index = tuple(index)
+        out[index] = _contract(psi[index], tensor_gate, sub_axes)
+
+    list(executor.map(process, itertools.product((0, 1), repeat=split_bits)))
+    return out.reshape(state.shape)
+
+
+def apply_batched_gate_tensor(state: np.ndarray, gates: np.ndarray, target_qubits: Sequence[int],
+                              num_qubits: int) -> np.ndarray:
+    """Apply a different k-qubit gate to every member of a (batch, 2**num_qubits) state array.
+
+    `gates` has shape (batch, 2**k, 2**k); all members are updated in a single einsum.
+    """
+    k = len(target_qubits)
+    batch = state.shape[0]
+    psi = state.reshape((batch,) + (2,) * num_qubits)
+    axes = [1 + axis for axis in qubit_axes(target_qubits, num_qubits)]
+    # Gather the target axes last (first target most significant) and flatten the rest
+    psi = np.moveaxis(psi, axes, list(range(num_qubits + 1 - k, num_qubits + 1)))
+    moved_shape = psi.shape
+    psi = np.einsum('bij,bmj->bmi', gates.astype(state.dtype, copy=False), psi.reshape(batch, -1, 2 ** k))
+    psi = np.moveaxis(psi.reshape(moved_shape), list(range(num_qubits + 1 - k, num_qubits + 1)), axes)
+    return psi.reshape(state.shape)
@@ -1,6 +1,7 @@
 import numpy as np
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit
 from typing import List, Tuple
+from src.quantum_integration.batch_executor import BatchExecutor
 
 class QuantumEncryption:
     def __init__(self, num_bits: int):
@@ -10,6 +11,7 @@ class QuantumEncryption:
         self.basis_sender = []
         self.basis_receiver = []
         self.eavesdropper_intercepted = []
+        self.executor = BatchExecutor()
 
     def prepare_qubits(self) -> List[QuantumCircuit]:
         """Prepare qubits in random states based on the sender's basis."""
@@ -45,10 +47,8 @@ class QuantumEncryption:
                 circuit.h(0)  # Change to X-basis measurement
             circuit.measure(0, 0)
 
-            # Execute the circuit
-            job = execute(circuit, Aer.get_backend('qasm_simulator'), shots=1)
-            result = job.result()
-            counts = result.get_counts(circuit)
+        # Execute all circuits as batched jobs instead of one job per bit
+        for counts in self.executor.run(circuits, shots=1):
             measured_value = int(list(counts.keys())[0])  # Get the measured value
             results.append(measured_value)
         return results
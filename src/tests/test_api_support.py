@@ -0,0 +1,130 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.quantum_integration.circuit_sessions import SessionNotFound, SessionStore
+from src.quantum_integration.job_queue import ExecutorSaturated, JobNotFound, JobQueue
+from src.quantum_integration.quantum_simulator import QuantumSimulator
+from src.quantum_integration.rate_limiter import TokenBucketLimiter
+from src.quantum_integration.request_cache import RequestCache
+from src.quantum_integration.result_encoding import compress, decode, decompress, encode_counts, encode_statevector
+from src.quantum_integration.shot_stream import stream_counts
+from src.quantum_integration.simulator_circuit import SimulatorCircuit
+from src.quantum_integration.simulator_frontend import sample_counts
+
+class TestAPISupport(unittest.TestCase):
+
+    def test_session_store_ttl_and_capacity(self):
+        now = [0.0]
+        store = SessionStore(SimulatorCircuit, max_sessions=2, ttl=10, max_gates=3, clock=lambda: now[0])
+        first, second = store.create(2), store.create(2)
+        store.apply(first.session_id, lambda circuit: circuit.h(0).cx(0, 1), 2)
+        self.assertEqual(len(store.get(first.session_id).circuit), 2)
+        with self.assertRaises(ValueError):
+            store.apply(first.session_id, lambda circuit: circuit.h(1).h(0), 2)
+        third = store.create(1)  # full: evicts the least recently used session
+        with self.assertRaises(SessionNotFound):
+            store.get(second.session_id)
+        now[0] = 11.0
+        with self.assertRaises(SessionNotFound):
+            store.get(third.session_id)
+        self.assertEqual(len(store), 0)
+
+    def test_job_queue_rejects_when_full_and_expires_results(self):
+        now = [0.0]
+        queue = JobQueue(max_workers=1, max_queued=2, result_ttl=10, use_processes=False, clock=lambda: now[0])
+        release = threading.Event()
+        queue.submit(release.wait)
+        waiting = queue.submit(sum, [1, 2])
+        self.assertEqual(queue.status(waiting)['status'], 'queued')
+        with self.assertRaises(ExecutorSaturated):
+            queue.submit(sum, [3])
+        release.set()
+        queue.future(waiting).result()
+        self.assertEqual(queue.status(waiting), {'job_id': waiting, 'status': 'done', 'result': 3})
+        now[0] = 11.0
+        with self.assertRaises(JobNotFound):
+            queue.status(waiting)
+        queue.shutdown()
+
+    def test_request_cache_coalesces_and_expires(self):
+        now = [0.0]
+        cache = RequestCache(ttl=5, clock=lambda: now[0])
+        key = RequestCache.key('/measure', {'num_qubits': 3, 'shots': 10})
+        self.assertEqual(key, RequestCache.key('/measure', {'shots': 10, 'num_qubits': 3}))
+        started, release, calls = threading.Event(), threading.Event(), []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return {'000': 10}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(cache.get_or_compute, key, compute)
+            started.wait()
+            followers = [pool.submit(cache.get_or_compute, key, compute) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            statuses = sorted([leader.result()[1]] + [future.result()[1] for future in followers])
+        self.assertEqual(statuses, ['COALESCED'] * 3 + ['MISS'])
+        self.assertEqual(cache.get_or_compute(key, compute), ({'000': 10}, 'HIT'))
+        now[0] = 6.0
+        self.assertEqual(cache.get_or_compute(key, compute)[1], 'MISS')
+        self.assertEqual(len(calls), 2)
+
+    def test_token_bucket_refills_and_evicts_idle_clients(self):
+        now = [0.0]
+        limiter = TokenBucketLimiter(rate=2, capacity=3, num_shards=1, max_clients=4, clock=lambda: now[0])
+        self.assertEqual([limiter.acquire('a')[0] for _ in range(4)], [True, True, True, False])
+        self.assertAlmostEqual(limiter.acquire('a')[2], 0.5)
+        now[0] = 0.5
+        self.assertTrue(limiter.acquire('a')[0])
+        self.assertEqual(limiter.usage('a')['rejected'], 2)
+        for client in 'bcdefg':
+            limiter.acquire(client)
+        usage = limiter.usage()
+        self.assertEqual((usage['clients_tracked'], usage['clients_evicted']), (4, 3))
+        now[0] = 10.0  # past the refill time: idle buckets are dropped on the next check in their shard
+        limiter.acquire('h')
+        self.assertEqual(limiter.usage()['clients_tracked'], 1)
+
+    def test_hourly_limit_cuts_off_bursts(self):
+        now = [0.0]
+        limiter = TokenBucketLimiter.per_hour(1000, clock=lambda: now[0])
+        allowed = sum(limiter.acquire('a')[0] for _ in range(1000))
+        self.assertEqual(allowed, 16)  # a minute's share of the hour, not the whole quota
+        now[0] = 3600.0
+        self.assertEqual(sum(limiter.acquire('a')[0] for _ in range(1000)), 16)  # refills only to the burst
+        self.assertEqual(TokenBucketLimiter.per_hour(1000, burst=100).capacity, 100)
+        self.assertEqual(TokenBucketLimiter.per_hour(10).capacity, 1)
+
+    def test_binary_result_encoding_round_trips(self):
+        counts = sample_counts(SimulatorCircuit(5).h(0).h(3).cx(0, 4), shots=500, seed=2)
+        self.assertEqual(decode(encode_counts(counts)), counts)
+        self.assertEqual(decode(encode_counts({'1 01': 3, '0 11': 4})), {'101': 3, '011': 4})
+        self.assertEqual(len(encode_counts({})), 16)  # header only, zero entries
+        self.assertEqual(decode(encode_counts({})), {})
+        self.assertEqual(decode(encode_counts({}, num_qubits=3)), {})
+        simulator = QuantumSimulator(4)
+        simulator.hadamard(1)
+        state = simulator.state
+        body = encode_statevector(state)
+        self.assertEqual(len(body), 16 + 8 * 16)  # header plus complex64 amplitudes
+        np.testing.assert_allclose(decode(decompress(compress(body, 'gzip'), 'gzip')), state, atol=1e-7)
+        np.testing.assert_allclose(decode(encode_statevector(state, probabilities=True)), np.abs(state) ** 2)
+
+    def test_shot_stream_chunks_and_stops_on_convergence(self):
+        probabilities = np.array([0.5, 0.25, 0.25, 0.0])
+        records = list(stream_counts(probabilities, 25_000, chunk_shots=10_000, seed=5))
+        self.assertEqual([record['shots_done'] for record in records], [10_000, 20_000, 25_000])
+        self.assertEqual([record['finished'] for record in records], [False, False, True])
+        self.assertEqual(sum(sum(record['counts'].values()) for record in records), 25_000)
+        self.assertNotIn('11', records[0]['counts'])
+        converged = list(stream_counts(probabilities, 10 ** 7, chunk_shots=10_000, seed=5, tolerance=2e-3))
+        self.assertTrue(converged[-1]['converged'])
+        self.assertLessEqual(converged[-1]['shots_done'], 70_000)  # sqrt(0.25 / n) <= 2e-3 needs n >= 62,500
+
+if __name__ == '__main__':
+    unittest.main()
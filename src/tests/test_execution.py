@@ -0,0 +1,48 @@
+import unittest
+from qiskit import QuantumCircuit
+from src.quantum_integration.batch_executor import BatchExecutor
+from src.quantum_integration.quantum_circuit import QuantumCircuitManager
+from src.quantum_integration.simulator_frontend import route_counts
+
+def basis_circuit(num_qubits, index):
+    """Circuit preparing and measuring the basis state |index>."""
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    for qubit in range(num_qubits):
+        if index >> qubit & 1:
+            circuit.x(qubit)
+    circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
+
+class TestExecution(unittest.TestCase):
+
+    def test_transpile_cache_reuses_identical_circuits(self):
+        QuantumCircuitManager.transpile_cache.clear()
+        manager = QuantumCircuitManager(2)
+        first = manager.transpile_cached(basis_circuit(2, 1))
+        self.assertIs(manager.transpile_cached(basis_circuit(2, 1)), first)
+        self.assertEqual(QuantumCircuitManager.transpile_cache.stats()['hits'], 1)
+        counts = manager.run_many([basis_circuit(2, index) for index in (3, 0, 2)], shots=50)
+        self.assertEqual(counts, [{'11': 50}, {'00': 50}, {'10': 50}])
+
+    def test_batch_executor_keeps_input_order_across_jobs(self):
+        executor = BatchExecutor(max_batch_size=3, seed=7)
+        order = [5, 0, 7, 2, 6, 1, 3]
+        for index in order:
+            executor.add(basis_circuit(3, index))
+        counts = executor.flush(shots=20)  # three jobs of at most three circuits
+        self.assertEqual(counts, [{format(index, '03b'): 20} for index in order])
+        self.assertEqual(executor.pending, [])
+
+    def test_route_counts_seeds_each_circuit_independently(self):
+        circuits = []
+        for _ in range(16):
+            circuit = QuantumCircuit(1, 1)
+            circuit.h(0)
+            circuit.measure(0, 0)
+            circuits.append(circuit)
+        counts = route_counts(circuits, 1, lambda rest: self.fail("every circuit is Clifford"), seed=3)
+        self.assertEqual(len({next(iter(result)) for result in counts}), 2)
+        self.assertEqual(route_counts(circuits, 1, list, seed=3), counts)  # still reproducible
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.core.algorithms.qaoa_engine import QAOAEngine
+from src.core.algorithms.qaoa_optimizer import interpolate_params
+from src.core.algorithms.quantum_optimization import QuantumOptimization
+
+class TestQAOA(unittest.TestCase):
+
+    def test_max_cut_counts_each_edge_once(self):
+        path = QuantumOptimization({0: [1], 1: [0, 2], 2: [1]})
+        self.assertEqual(path.edges.tolist(), [[0, 1], [1, 2]])
+        # Node i is bitstring[n - 1 - i]: '001' puts only node 0 in the second partition
+        self.assertEqual(path.calculate_cut_value('001'), 1)
+        self.assertEqual(path.calculate_cut_value('010'), 2)
+        self.assertEqual(list(path.cost_diagonal()), [0, 1, 2, 1, 1, 2, 1, 0])
+        self.assertAlmostEqual(path.calculate_max_cut({'010': 3, '000': 1}), 1.5)
+
+    def test_numpy_qaoa_engine_matches_circuit_and_gradient(self):
+        square = QuantumOptimization({0: [1, 3], 1: [0, 2], 2: [1, 3], 3: [0, 2]})
+        engine = QAOAEngine(square.cost_diagonal())
+        params = np.array([0.3, 0.8, 0.5, 0.2])
+        value, gradient = engine.value_and_grad(params)
+        self.assertAlmostEqual(-square.sweep_objective([[0.3, 0.5]])[0], engine.expectation([0.3, 0.5]))
+        shifts = 1e-6 * np.eye(4)
+        finite = [(engine.expectation(params + shift) - engine.expectation(params - shift)) / 2e-6 for shift in shifts]
+        np.testing.assert_allclose(gradient, finite, atol=1e-7)
+        np.random.seed(0)
+        result = square.optimize(p=2, engine='numpy', gradient=True)
+        self.assertAlmostEqual(result.fun, -4, places=4)
+        np.random.seed(0)
+        self.assertAlmostEqual(square.optimize(True, 2).fun, -4, places=4)  # positional gradient, p
+        np.random.seed(0)
+        self.assertLess(square.optimize(p=2, exact=True).fun, -3.9)
+
+    def test_layerwise_optimizer_warm_starts_and_caches(self):
+        np.testing.assert_allclose(interpolate_params(np.array([0.4, 0.2])), [0.4, 0.4, 0.2, 0.2])
+        triangle = QuantumOptimization({0: [1, 2], 1: [0, 2], 2: [0, 1]})
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, 'qaoa_params.json')
+            result = triangle.optimize_layerwise(max_p=2, num_starts=3, cache_path=cache_path, seed=0)
+            self.assertGreater(result.approximation_ratio, 0.7)
+            self.assertEqual([entry['p'] for entry in result.history], list(range(1, len(result.history) + 1)))
+            self.assertTrue(os.path.exists(cache_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+from src.quantum_integration import quantum_api as api
+from src.quantum_integration.job_queue import JobQueue
+from src.quantum_integration.rate_limiter import TokenBucketLimiter
+from src.quantum_integration.request_cache import RequestCache
+
+class TestQuantumAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.client = api.app.test_client()
+
+    def test_job_is_polled_until_done_and_expires(self):
+        now = [0.0]
+        queue = JobQueue(max_workers=1, max_queued=2, result_ttl=10, use_processes=False, clock=lambda: now[0])
+        release = threading.Event()
+        with patch.object(api, 'jobs', queue), patch.object(api, 'rate_limiter', None):
+            queue.submit(release.wait)  # occupies the only worker
+            accepted = self.client.post('/measure', json={'num_qubits': 2, 'async': True})
+            self.assertEqual(accepted.status_code, 202)
+            status_url = accepted.json['status_url']
+            self.assertEqual(self.client.get(status_url).json['status'], 'queued')
+            rejected = self.client.post('/measure', json={'num_qubits': 2, 'async': True})
+            self.assertEqual((rejected.status_code, rejected.json['reason']), (429, 'queue_full'))
+            release.set()
+            queue.future(accepted.json['job_id']).result()
+            done = self.client.get(status_url).json
+            self.assertEqual(done['status'], 'done')
+            self.assertEqual(sum(done['measurement_results'].values()), 1024)
+            now[0] = 11.0
+            self.assertEqual(self.client.get(status_url).status_code, 404)
+        queue.shutdown()
+
+    def test_rate_limit_rejections_are_marked_and_polling_is_free(self):
+        queue = JobQueue(max_workers=1, use_processes=False)
+        limiter = TokenBucketLimiter(rate=1e-6, capacity=1)
+        with patch.object(api, 'jobs', queue), patch.object(api, 'rate_limiter', limiter):
+            accepted = self.client.post('/measure', json={'num_qubits': 2, 'async': True})
+            self.assertEqual(accepted.status_code, 202)
+            queue.future(accepted.json['job_id']).result()
+            for _ in range(3):
+                self.assertEqual(self.client.get(accepted.json['status_url']).json['status'], 'done')
+            limited = self.client.post('/measure', json={'num_qubits': 2, 'async': True})
+        queue.shutdown()
+        self.assertEqual((limited.status_code, limited.json['reason']), (429, 'rate_limited'))
+        self.assertEqual(limited.headers['X-RateLimit-Remaining'], '0')
+        totals = limiter.usage()
+        self.assertEqual((totals['allowed'], totals['rejected']), (1, 1))  # the polls were not charged
+
+    def test_stream_bounds_qubits_and_gives_up_on_a_slow_statevector(self):
+        queue = JobQueue(max_workers=1, use_processes=False)
+        release = threading.Event()
+        with patch.object(api, 'jobs', queue), patch.object(api, 'rate_limiter', None), \
+                patch.object(api, 'SYNC_WAIT', 0.05):
+            too_big = self.client.post('/measure/stream', json={'num_qubits': api.sessions.max_qubits + 1})
+            self.assertEqual(too_big.status_code, 400)
+            queue.submit(release.wait)  # occupies the only worker
+            slow = self.client.post('/measure/stream', json={'num_qubits': 2, 'shots': 1000, 'chunk_shots': 1000})
+            release.set()
+            streamed = self.client.post('/measure/stream', json={'num_qubits': 2, 'shots': 1000,
+                                                                 'chunk_shots': 1000, 'seed': 1})
+        queue.shutdown()
+        self.assertEqual(slow.status_code, 503)
+        self.assertIn('Retry-After', slow.headers)
+        records = [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()]
+        self.assertTrue(records[-1]['finished'])
+        self.assertEqual(sum(sum(record['counts'].values()) for record in records), 1000)
+
+    def test_session_builds_and_runs_a_bell_state(self):
+        queue = JobQueue(max_workers=1, use_processes=False)
+        with patch.object(api, 'jobs', queue), patch.object(api, 'rate_limiter', None):
+            session_id = self.client.post('/create_circuit', json={'num_qubits': 2}).json['session_id']
+            applied = self.client.post('/apply_gates', json={'session_id': session_id, 'gates': [
+                {'gate': 'H', 'target_qubits': [0]}, {'gate': 'CX', 'target_qubits': [0, 1]}]})
+            self.assertEqual(applied.json['gate_count'], 2)
+            counts = self.client.post('/run', json={'session_id': session_id, 'shots': 1000}).json
+        queue.shutdown()
+        self.assertLessEqual(set(counts['measurement_results']), {'00', '11'})
+        self.assertEqual(sum(counts['measurement_results'].values()), 1000)
+
+    def test_wrongly_typed_fields_are_rejected_with_400(self):
+        with patch.object(api, 'rate_limiter', None):
+            session_id = self.client.post('/create_circuit', json={'num_qubits': 2}).json['session_id']
+            requests = [
+                ('/create_circuit', {'num_qubits': '2'}),
+                ('/create_circuit', {'num_qubits': True}),
+                ('/apply_gates', {'session_id': session_id, 'gates': ['H']}),
+                ('/apply_gates', {'session_id': session_id, 'gates': [{'gate': 'H', 'target_qubits': [True]}]}),
+                ('/apply_gate', {'session_id': session_id, 'gate': 'H', 'target_qubits': 0}),
+                ('/apply_gate', {'gate': 'H', 'target_qubits': ['a']}),
+                ('/apply_gate', {'gate': ['H'], 'target_qubits': [0]}),
+                ('/run', {'session_id': session_id, 'shots': '10'}),
+            ]
+            for path, body in requests:
+                response = self.client.post(path, json=body)
+                self.assertEqual(response.status_code, 400, (path, body))
+                self.assertIn('error', response.json)
+            self.assertEqual(api.sessions.get(session_id).gate_count, 0)
+
+    def test_run_rejects_out_of_range_shots(self):
+        with patch.object(api, 'rate_limiter', None):
+            session_id = self.client.post('/create_circuit', json={'num_qubits': 1}).json['session_id']
+            for shots in (0, -5, api.MAX_SHOTS + 1):
+                response = self.client.post('/run', json={'session_id': session_id, 'shots': shots})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('shots', response.json['error'])
+
+    def test_measure_rejects_out_of_range_qubits_before_the_cache(self):
+        with patch.object(api, 'rate_limiter', None), patch.object(api, 'demo_circuit') as demo_circuit:
+            for num_qubits in (0, api.sessions.max_qubits + 1):
+                response = self.client.post('/measure', json={'num_qubits': num_qubits})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('num_qubits', response.json['error'])
+            demo_circuit.assert_not_called()
+
+    def test_measure_builds_the_circuit_only_on_a_cache_miss(self):
+        queue = JobQueue(max_workers=1, use_processes=False)
+        with patch.object(api, 'rate_limiter', None), patch.object(api, 'jobs', queue), \
+                patch.object(api, 'request_cache', RequestCache(ttl=30.0)), \
+                patch.object(api, 'demo_circuit', wraps=api.demo_circuit) as demo_circuit:
+            first = self.client.post('/measure', json={'num_qubits': 3})
+            second = self.client.post('/measure', json={'num_qubits': 3})
+        queue.shutdown()
+        self.assertEqual((first.headers['X-Cache'], second.headers['X-Cache']), ('MISS', 'HIT'))
+        self.assertEqual(first.json, second.json)
+        self.assertEqual(demo_circuit.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,296 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+import numpy as np
+from src.quantum_integration.adjoint_gradient import value_and_grad
+from src.quantum_integration.async_executor import AsyncQuantumExecutor, ExecutorSaturated
+from src.quantum_integration.batched_simulator import BatchedQuantumSimulator
+from src.quantum_integration.circuit_compiler import CircuitCompiler
+from src.quantum_integration.density_matrix_simulator import DensityMatrixSimulator, TrajectorySimulator
+from src.quantum_integration.execution_cache import ExecutionCache, circuit_key
+from src.quantum_integration.mps_simulator import MPSSimulator
+from src.quantum_integration.noise_channels import NoiseModel, amplitude_damping_kraus, depolarizing_kraus
+from src.quantum_integration.observables import DiagonalObservable, PauliSum
+from src.quantum_integration.out_of_core_simulator import OutOfCoreSimulator
+from src.quantum_integration.quantum_simulator import QuantumSimulator, estimate_memory
+from src.quantum_integration.sampling import spawn_seeds
+from src.quantum_integration.simulator_circuit import Parameter, SimulatorCircuit
+from src.quantum_integration.simulator_frontend import choose_backend, sample_counts
+from src.quantum_integration.stabilizer_simulator import StabilizerSimulator
+
+class TestQuantumSimulator(unittest.TestCase):
+
+    def test_bell_state(self):
+        simulator = QuantumSimulator(num_qubits=2)
+        simulator.hadamard(0)
+        simulator.cnot(0, 1)
+        expected = np.array([1, 0, 0, 1]) / np.sqrt(2)
+        np.testing.assert_allclose(simulator.state.flatten(), expected, atol=1e-12)
+
+    def test_cnot_control_target_ordering(self):
+        simulator = QuantumSimulator(num_qubits=3)
+        simulator.pauli_x(2)
+        simulator.cnot(2, 0)
+        # qubit q is bit q of the basis index: |q2 q1 q0> = |101> = 5
+        self.assertAlmostEqual(abs(simulator.state.flatten()[5]), 1.0)
+
+    def test_matches_dense_reference(self):
+        rng = np.random.default_rng(7)
+        num_qubits = 4
+        gate, _ = np.linalg.qr(rng.normal(size=(8, 8)) + 1j * rng.normal(size=(8, 8)))
+        simulator = QuantumSimulator(num_qubits)
+        for qubit in range(num_qubits):
+            simulator.hadamard(qubit)
+        state = simulator.state.flatten().copy()
+        simulator.apply_gate(gate, [3, 1, 2])
+
+        # Dense reference: permute qubits so the targets are the top bits in order
+        tensor = state.reshape((2,) * num_qubits)
+        perm = [0, 2, 1, 3]  # axes for qubits 3, 1, 2, 0
+        reference = (gate @ tensor.transpose(perm).reshape(8, 2)).reshape((2,) * num_qubits)
+        reference = reference.transpose(np.argsort(perm)).flatten()
+        np.testing.assert_allclose(simulator.state.flatten(), reference, atol=1e-12)
+
+    def test_gate_fusion_preserves_state(self):
+        circuit = SimulatorCircuit(3)
+        for qubit in range(3):
+            circuit.h(qubit).rz(0.3 * qubit, qubit).rx(0.7, qubit)
+        circuit.cx(0, 1).rz(0.4, 1).cx(1, 0).ry(0.2, 0).cx(1, 2).t(2)
+
+        reference = QuantumSimulator(3)
+        for instruction in circuit.instructions:
+            reference.apply_gate(instruction.matrix, list(instruction.qubits))
+
+        compiler = CircuitCompiler()
+        fused = QuantumSimulator(3)
+        report = fused.run(circuit, compiler)
+        np.testing.assert_allclose(fused.state, reference.state, atol=1e-12)
+        self.assertEqual(report['gates_in'], len(circuit))
+        self.assertLessEqual(report['passes_out'], 3)
+
+        QuantumSimulator(3).run(circuit, compiler)
+        self.assertEqual(compiler.cache_info()['hits'], 1)
+
+    def test_batched_rotations_match_single_runs(self):
+        thetas = np.array([0.1, 1.2, 2.5])
+        batched = BatchedQuantumSimulator(num_qubits=2, batch_size=len(thetas))
+        batched.rx(thetas, 1)
+        batched.cnot(1, 0)
+        for member, theta in enumerate(thetas):
+            circuit = SimulatorCircuit(2).rx(theta, 1).cx(1, 0)
+            single = QuantumSimulator(2)
+            single.run(circuit)
+            np.testing.assert_allclose(batched.state[member], single.state.flatten(), atol=1e-12)
+
+    def test_sample_counts_and_marginals(self):
+        simulator = QuantumSimulator(num_qubits=3)
+        simulator.hadamard(0)
+        simulator.cnot(0, 1)
+        simulator.pauli_x(2)
+        counts = simulator.sample(2000, seed=11)
+        self.assertEqual(set(counts), {'100', '111'})
+        self.assertEqual(sum(counts.values()), 2000)
+
+        marginal = simulator.sample(500, qubits=[2, 0], seed=11)
+        self.assertEqual(set(marginal), {'01', '11'})
+        packed = simulator.sample(4, qubits=[2], packed=True)
+        np.testing.assert_array_equal(packed, np.full((4, 1), 0x80, dtype=np.uint8))
+
+        outcome = simulator.measure_qubits([0], seed=3)
+        self.assertEqual(set(simulator.sample(100)), {'111'} if outcome else {'100'})
+
+    def test_mps_matches_statevector(self):
+        rng = np.random.default_rng(5)
+        circuit = SimulatorCircuit(5)
+        for _ in range(20):
+            a, b = (int(q) for q in rng.choice(5, 2, replace=False))
+            circuit.ry(rng.uniform(0, np.pi), a).rz(rng.uniform(0, np.pi), b).cx(a, b)
+        mps = MPSSimulator(5, max_bond_dimension=8)
+        mps.run(circuit)
+        dense = QuantumSimulator(5)
+        dense.run(circuit)
+        self.assertAlmostEqual(abs(np.vdot(mps.to_statevector(), dense.state.flatten())), 1.0)
+        self.assertLess(mps.memory_report()['truncation_error'], 1e-12)
+
+    def test_clifford_circuits_use_stabilizer_backend(self):
+        circuit = SimulatorCircuit(4).h(0).s(0).cx(0, 1).h(2).cz(2, 3).swap(1, 3).y(2)
+        self.assertEqual(choose_backend(circuit), 'stabilizer')
+        self.assertEqual(choose_backend(SimulatorCircuit(1).t(0)), 'statevector')
+
+        dense = QuantumSimulator(4)
+        dense.run(circuit)
+        probabilities = dense.probabilities()
+        counts = sample_counts(circuit, shots=20000, seed=4)
+        self.assertEqual({int(key, 2) for key in counts}, set(np.nonzero(probabilities > 1e-9)[0]))
+        for key, count in counts.items():
+            self.assertAlmostEqual(count / 20000, probabilities[int(key, 2)], delta=0.02)
+        with self.assertRaises(ValueError):
+            StabilizerSimulator(2).measure(2)
+
+    def test_noisy_trajectories_match_density_matrix(self):
+        noise = NoiseModel().add_channel(depolarizing_kraus(0.1)).add_channel(amplitude_damping_kraus(0.2), ['x'])
+        circuit = SimulatorCircuit(2).h(0).cx(0, 1).x(1)
+
+        exact = DensityMatrixSimulator(2)
+        exact.run(circuit, noise)
+        self.assertAlmostEqual(np.trace(exact.density_matrix()).real, 1.0)
+        self.assertLess(exact.purity(), 1.0)
+
+        serial = TrajectorySimulator(2, noise, num_trajectories=3000, seed=9)
+        parallel = TrajectorySimulator(2, noise, num_trajectories=3000, seed=9, workers=3)
+        np.testing.assert_allclose(serial.run(circuit), parallel.run(circuit))
+        np.testing.assert_allclose(serial.probabilities(), exact.probabilities(), atol=0.03)
+
+    def test_single_precision_and_memory_budget(self):
+        self.assertEqual(estimate_memory(20, np.complex64)['state_bytes'], 8 * 2 ** 20)
+        simulator = QuantumSimulator(3, dtype=np.complex64)
+        simulator.hadamard(0)
+        simulator.cnot(0, 1)
+        self.assertEqual(simulator.state.dtype, np.complex64)
+        self.assertEqual(simulator.state.shape, (8,))
+
+        budget = estimate_memory(10, np.complex64)['peak_bytes']
+        downgraded = QuantumSimulator(10, memory_budget=budget)
+        self.assertEqual(downgraded.dtype, np.complex64)
+        with self.assertRaises(MemoryError):
+            QuantumSimulator(10, memory_budget=budget, allow_downgrade=False)
+        with self.assertRaises(MemoryError):
+            QuantumSimulator(11, memory_budget=budget)
+
+    def test_threaded_kernels_match_serial(self):
+        circuit = SimulatorCircuit(14)
+        for qubit in range(14):
+            circuit.h(qubit).rz(0.1 * qubit, qubit)
+        for qubit in range(13):
+            circuit.cx(qubit, 13 - qubit)
+        serial = QuantumSimulator(14)
+        serial.run(circuit)
+        threaded = QuantumSimulator(14, num_threads=3)
+        threaded.run(circuit)
+        threaded.apply_gate(np.kron(np.eye(2), np.eye(2)).astype(complex), [13, 0])
+        threaded.close()
+        np.testing.assert_allclose(threaded.state, serial.state, atol=1e-12)
+
+        with QuantumSimulator(14, num_threads=2) as scoped:
+            scoped.run(circuit)
+        self.assertIsNone(scoped._executor)
+        dropped = QuantumSimulator(14, num_threads=2)
+        dropped.run(circuit)
+        finalizer = dropped._finalizer
+        del dropped  # an unreferenced simulator shuts its pool down without close()
+        self.assertFalse(finalizer.alive)
+
+    def test_out_of_core_matches_in_memory(self):
+        rng = np.random.default_rng(3)
+        circuit = SimulatorCircuit(8)
+        for _ in range(30):
+            first, second = rng.choice(8, size=2, replace=False)
+            circuit.ry(rng.uniform(0, np.pi), int(first)).cx(int(first), int(second))
+        reference = QuantumSimulator(8)
+        reference.run(circuit)
+        simulator = OutOfCoreSimulator(8, block_qubits=4)
+        simulator.run(circuit)
+        np.testing.assert_allclose(simulator.to_array(), reference.state, atol=1e-12)
+        self.assertGreater(simulator.io_report()['swaps'], 0)
+        before = simulator.io['bytes_read']
+        simulator.sample(1, seed=5)  # a full pass for the block weights, then only the chosen block
+        self.assertEqual(simulator.io['bytes_read'] - before, simulator.state.nbytes + 16 * simulator.dtype.itemsize)
+        counts = simulator.sample(4000, seed=5)
+        self.assertEqual(sum(counts.values()), 4000)
+        self.assertTrue(set(counts) <= {format(i, '08b') for i in np.nonzero(reference.probabilities() > 1e-9)[0]})
+        simulator.close()
+
+    def test_adjoint_gradient_matches_finite_differences(self):
+        circuit = SimulatorCircuit(3)
+        for layer in range(2):
+            for qubit in range(3):
+                circuit.ry(Parameter(qubit), qubit).rz(2 * Parameter(3), qubit)
+            circuit.cx(0, 1).cx(1, 2).rx(0.5 * Parameter(layer), 2)
+        observable = np.random.default_rng(2).normal(size=8)
+        values = np.array([0.3, -0.7, 1.1, 0.4])
+        _, gradient = value_and_grad(circuit, observable, values)
+        shifts = 1e-6 * np.eye(4)
+        finite = [(value_and_grad(circuit, observable, values + shift)[0]
+                   - value_and_grad(circuit, observable, values - shift)[0]) / 2e-6 for shift in shifts]
+        np.testing.assert_allclose(gradient, finite, atol=1e-7)
+        with self.assertRaises(ValueError):
+            QuantumSimulator(3).run(circuit)
+
+    def test_pauli_sum_expectation_matches_dense_matrix(self):
+        paulis = {'I': np.eye(2), 'X': np.array([[0, 1], [1, 0]]),
+                  'Y': np.array([[0, -1j], [1j, 0]]), 'Z': np.diag([1, -1])}
+        terms = [('ZZI', 0.5), ('XIY', -1.2), ('IYX', 0.3), ('ZIZ', 2.0), ('XXX', 0.7)]
+        dense = sum(coefficient * np.kron(np.kron(paulis[label[0]], paulis[label[1]]), paulis[label[2]])
+                    for label, coefficient in terms)
+        simulator = QuantumSimulator(3)
+        simulator.run(SimulatorCircuit(3).h(0).ry(0.4, 1).cx(0, 2).rz(0.9, 2).rx(1.3, 1))
+        observable = PauliSum(terms)
+        self.assertAlmostEqual(simulator.expectation(observable), simulator.expectation(dense))
+        np.testing.assert_allclose(observable.apply(simulator.state), dense @ simulator.state, atol=1e-12)
+        diagonal = np.arange(8.0)
+        self.assertAlmostEqual(simulator.expectation(DiagonalObservable(diagonal)),
+                               simulator.probabilities() @ diagonal)
+
+    def test_execution_cache_keys_lru_and_disk_tier(self):
+        first, second = SimulatorCircuit(2).h(0).cx(0, 1), SimulatorCircuit(2).h(0).cx(0, 1)
+        self.assertEqual(circuit_key(first, shots=100, seed=1), circuit_key(second, shots=100, seed=1))
+        self.assertNotEqual(circuit_key(first, shots=100, seed=1), circuit_key(first, shots=100, seed=2))
+
+        def run_bell():
+            simulator = QuantumSimulator(2)
+            simulator.run(first)
+            return simulator.state
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ExecutionCache(max_entries=1, disk_path=directory)
+            key = circuit_key(first, 'statevector')
+            state = cache.get_or_compute(key, run_bell)
+            np.testing.assert_allclose(cache.get_or_compute(key, run_bell), state)
+            cache.put('other', {'00': 1})  # evicts the statevector from memory
+            np.testing.assert_allclose(cache.get(key), state)
+            stats = cache.stats()
+            self.assertEqual((stats['hits'], stats['disk_hits'], stats['misses'], stats['entries']), (1, 1, 1, 1))
+
+        own = np.zeros(4, dtype=complex)
+        cache = ExecutionCache()
+        cache.put('own', own)
+        own[0] = 1  # the caller's array stays writable; the cache holds a frozen copy
+        self.assertEqual(cache.get('own')[0], 0)
+        self.assertFalse(cache.get('own').flags.writeable)
+
+    def test_async_executor_gathers_times_out_and_applies_backpressure(self):
+        circuits = [SimulatorCircuit(3).h(0).cx(0, 1).rx(0.2 * k, 2) for k in range(6)]
+        release = threading.Event()
+
+        async def scenario(executor):
+            counts = await executor.run_many(circuits, shots=200, seed=4)
+            coin_flips = await executor.run_many([SimulatorCircuit(1).h(0)] * 16, shots=1, seed=4)
+            self.assertEqual(len({next(iter(flip)) for flip in coin_flips}), 2)
+            blocker = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+            with self.assertRaises(ExecutorSaturated):
+                await executor.run(sum, [1, 2], block=False)
+            waiter = asyncio.ensure_future(executor.run(sum, [1, 2]))  # blocks until the slot frees
+            await asyncio.sleep(0.05)
+            self.assertFalse(waiter.done())
+            release.set()
+            await blocker
+            self.assertEqual(await waiter, 3)
+            with self.assertRaises(asyncio.TimeoutError):
+                await executor.run(threading.Event().wait, 0.5, timeout=0.05)
+            return counts
+
+        executor = AsyncQuantumExecutor(max_workers=1, max_pending=1)
+        counts = asyncio.run(scenario(executor))
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            executor.submit(sum, [1, 2])
+        with self.assertRaises(RuntimeError):  # the failed submit gave its slot back
+            executor.submit(sum, [1, 2], block=False)
+        seeds = spawn_seeds(4, len(circuits))
+        self.assertEqual(counts, [sample_counts(circuit, shots=200, seed=seed)
+                                  for circuit, seed in zip(circuits, seeds)])
+
+if __name__ == '__main__':
+    unittest.main()